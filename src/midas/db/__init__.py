@@ -3,7 +3,10 @@ from sys import stderr
 from typing import Optional
 from dotenv import load_dotenv
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from midas.db.pool import InstrumentedPool
+from midas.db.replica import ReplicaRouter
 
 load_dotenv()
 _POSTGRES_USER: Optional[str] = getenv("POSTGRES_USER")
@@ -11,6 +14,9 @@ _POSTGRES_PASSWORD: Optional[str] = getenv("POSTGRES_PASSWORD")
 _POSTGRES_DB: Optional[str] = getenv("POSTGRES_DB")
 _POSTGRES_HOST: Optional[str] = getenv("POSTGRES_HOST")
 _POSTGRES_PORT: Optional[str] = getenv("POSTGRES_PORT", "5432")
+# optional streaming replica serving the read-only usecases
+_POSTGRES_REPLICA_HOST: Optional[str] = getenv("POSTGRES_REPLICA_HOST")
+_POSTGRES_REPLICA_PORT: Optional[str] = getenv("POSTGRES_REPLICA_PORT", "5432")
 
 _TESTING: Optional[str] = getenv("TESTING")
 
@@ -25,11 +31,65 @@ if (
     print("Finishing job...", file=stderr)
     exit(1)
 
-# https://docs.sqlalchemy.org/en/20/tutorial/engine.html#tutorial-engine
-engine = create_async_engine(
-    f"postgresql+asyncpg://{_POSTGRES_USER}:{_POSTGRES_PASSWORD}@{_POSTGRES_HOST}:{_POSTGRES_PORT}/{_POSTGRES_DB}",
-    echo=getenv("SQLALCHEMY_ECHO", "False").lower() in ("true", "1"),
+# https://docs.sqlalchemy.org/en/20/core/pooling.html#setting-pool-options
+_POOL_SIZE = int(getenv("SQLALCHEMY_POOL_SIZE", "5"))
+_MAX_OVERFLOW = int(getenv("SQLALCHEMY_MAX_OVERFLOW", "10"))
+_POOL_TIMEOUT = float(getenv("SQLALCHEMY_POOL_TIMEOUT", "30"))
+_POOL_RECYCLE = int(getenv("SQLALCHEMY_POOL_RECYCLE", "-1"))
+_POOL_PRE_PING = getenv("SQLALCHEMY_POOL_PRE_PING", "False").lower() in ("true", "1")
+
+# https://magicstack.github.io/asyncpg/current/api/index.html#connection
+_STATEMENT_CACHE_SIZE = int(getenv("ASYNCPG_STATEMENT_CACHE_SIZE", "100"))
+_COMMAND_TIMEOUT: Optional[str] = getenv("ASYNCPG_COMMAND_TIMEOUT")
+# https://docs.sqlalchemy.org/en/20/dialects/postgresql.html#prepared-statement-cache
+_PREPARED_STATEMENT_CACHE_SIZE = int(
+    getenv("ASYNCPG_PREPARED_STATEMENT_CACHE_SIZE", "100")
+)
+# https://docs.sqlalchemy.org/en/20/core/connections.html#sql-compilation-caching
+_QUERY_CACHE_SIZE = int(getenv("SQLALCHEMY_QUERY_CACHE_SIZE", "500"))
+
+# seconds
+_REPLICA_MAX_LAG = float(getenv("REPLICA_MAX_LAG", "1"))
+_REPLICA_CHECK_INTERVAL = float(getenv("REPLICA_CHECK_INTERVAL", "5"))
+
+# `balances` or `journal`, see `Transaction.folded`
+_LEDGER_MODE = getenv("LEDGER_MODE", "balances").lower()
+
+
+def _create_engine(host: Optional[str], port: Optional[str]) -> AsyncEngine:
+    # https://docs.sqlalchemy.org/en/20/tutorial/engine.html#tutorial-engine
+    return create_async_engine(
+        f"postgresql+asyncpg://{_POSTGRES_USER}:{_POSTGRES_PASSWORD}@{host}:{port}/{_POSTGRES_DB}"
+        # statements prepared on a connection are reused by every later
+        # execution of the same compiled SQL
+        f"?prepared_statement_cache_size={_PREPARED_STATEMENT_CACHE_SIZE}",
+        echo=getenv("SQLALCHEMY_ECHO", "False").lower() in ("true", "1"),
+        query_cache_size=_QUERY_CACHE_SIZE,
+        poolclass=InstrumentedPool,
+        pool_size=_POOL_SIZE,
+        max_overflow=_MAX_OVERFLOW,
+        pool_timeout=_POOL_TIMEOUT,
+        pool_recycle=_POOL_RECYCLE,
+        pool_pre_ping=_POOL_PRE_PING,
+        connect_args={
+            "statement_cache_size": _STATEMENT_CACHE_SIZE,
+            # blank means no timeout
+            "command_timeout": float(_COMMAND_TIMEOUT) if _COMMAND_TIMEOUT else None,
+        },
+    )
+
+
+engine = _create_engine(_POSTGRES_HOST, _POSTGRES_PORT)
+replica_engine: Optional[AsyncEngine] = (
+    _create_engine(_POSTGRES_REPLICA_HOST, _POSTGRES_REPLICA_PORT)
+    if _POSTGRES_REPLICA_HOST
+    else None
+)
+replica_router = ReplicaRouter(
+    replica_engine, _REPLICA_MAX_LAG, _REPLICA_CHECK_INTERVAL
 )
+# postings only append to the journal of transactions
+journal_ledger = _LEDGER_MODE == "journal"
 
 
 # https://docs.sqlalchemy.org/en/20/tutorial/metadata.html#establishing-a-declarative-base
@@ -37,4 +97,4 @@ class Base(DeclarativeBase):
     pass
 
 
-__all__ = ["engine", "Base"]
+__all__ = ["engine", "replica_engine", "replica_router", "journal_ledger", "Base"]
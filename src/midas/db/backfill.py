@@ -0,0 +1,35 @@
+# This file is meant to be ran with poetry via `poetry run backfill`
+# however it still provides the entry point at the bottom.
+#
+# Rebuilds the `monthly_aggregates` and `account_periods` tables from all
+# existing transactions in one pass. Run it once after the tables are
+# created, or whenever they are suspected to have drifted from
+# `transactions`.
+from asyncio import run
+from sys import stdout
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db import engine
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+
+
+async def do_run_main() -> None:
+    print("Rebuilding monthly aggregates and account periods...", file=stdout)
+    async with AsyncSession(engine) as session:
+        aggregates = await MonthlyAggregateRepository(session).rebuild()
+        periods = await AccountPeriodRepository(session).rebuild()
+        await session.commit()
+    await engine.dispose()
+    print(
+        f"Finished rebuilding {aggregates} monthly aggregates and {periods} account periods",
+        file=stdout,
+    )
+
+
+def main() -> None:
+    run(do_run_main())
+
+
+if __name__ == "__main__":
+    main()
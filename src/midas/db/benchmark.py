@@ -0,0 +1,162 @@
+# This file is meant to be ran with poetry via `poetry run benchmark`
+# however it still provides the entry point at the bottom.
+#
+# Compares the per-call overhead of the hot repository queries with the
+# statements rebuilt from scratch on every call, the way the repositories
+# used to build them. The queries look up a user that doesn't exist, so
+# the timings are dominated by statement construction, compilation cache
+# lookup and the round trip. Run it with `--sqlite` to leave out the
+# network and measure the Python side only.
+from argparse import ArgumentParser
+from asyncio import run
+from datetime import datetime, timezone
+from sys import stdout
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+from sqlalchemy import Executable, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from midas.db import Base, engine
+from midas.db.schemas.account import Account
+from midas.db.schemas.event import Event
+from midas.db.schemas.transaction import Transaction
+from midas.query.account import AccountRepository
+from midas.query.event import EventRepository
+from midas.query.transaction import TransactionRepository
+from midas.util.enums import TransactionType
+
+type Query = Callable[[AsyncSession], Awaitable[Any]]
+
+_AFTER = (datetime.now(timezone.utc), UUID(int=0))
+
+
+def _get_recent(eager: bool) -> Executable:
+    stmt = (
+        select(Transaction)
+        .where(Transaction.user_id == 0)
+        .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+        .limit(16)
+        .where(
+            Transaction.created_at <= _AFTER[0],
+            tuple_(Transaction.created_at, Transaction.id) < tuple_(*_AFTER),
+        )
+    )
+    if eager:
+        stmt = stmt.options(
+            selectinload(Transaction.debit_account).selectinload(Account.user),
+            selectinload(Transaction.credit_account),
+        )
+    return stmt
+
+
+def _get_account() -> Executable:
+    return (
+        select(Account)
+        .where(Account.user_id == 0)
+        .where(Account.transaction_type_id == TransactionType.INCOME)
+    )
+
+
+def _get_events() -> Executable:
+    return (
+        select(Event)
+        .where(Event.user_id == 0)
+        .order_by(Event.id.desc())
+        .limit(16)
+        .where(Event.id < 1)
+    )
+
+
+# (name, statement rebuilt on every call, cached repository query)
+CASES: tuple[tuple[str, Callable[[], Executable], Query], ...] = (
+    (
+        "TransactionRepository.get_recent(after)",
+        lambda: _get_recent(False),
+        lambda session: TransactionRepository(session).get_recent(0, 16, after=_AFTER),
+    ),
+    (
+        "TransactionRepository.get_recent(after, eager)",
+        lambda: _get_recent(True),
+        lambda session: TransactionRepository(session).get_recent(
+            0, 16, eager=True, after=_AFTER
+        ),
+    ),
+    (
+        "AccountRepository.get_user_account_by_transaction_type",
+        _get_account,
+        lambda session: AccountRepository(session).get_user_account_by_transaction_type(
+            0, TransactionType.INCOME
+        ),
+    ),
+    (
+        "EventRepository.get_by_user_id(after)",
+        _get_events,
+        lambda session: EventRepository(session).get_by_user_id(0, 16, after=1),
+    ),
+)
+
+
+async def _measure(query: Query, session: AsyncSession, calls: int) -> float:
+    """
+    Get the average number of microseconds a call of `query` takes.
+    """
+    # warm up the compilation and prepared statement caches
+    for _ in range(10):
+        await query(session)
+
+    start = perf_counter()
+    for _ in range(calls):
+        await query(session)
+    return (perf_counter() - start) / calls * 10**6
+
+
+async def benchmark(bench_engine: AsyncEngine, calls: int) -> None:
+    async with bench_engine.connect() as connection:
+        session = AsyncSession(bind=connection)
+        print(f"{'query':<56} {'rebuilt':>10} {'cached':>10}", file=stdout)
+        for name, build, query in CASES:
+            rebuilt = await _measure(
+                lambda session: session.scalars(build()), session, calls
+            )
+            cached = await _measure(query, session, calls)
+            print(
+                f"{name:<56} {rebuilt:>8.1f}us {cached:>8.1f}us "
+                f"({(rebuilt - cached) / rebuilt:+.0%})",
+                file=stdout,
+            )
+        await connection.rollback()
+
+
+async def do_run_main(calls: int, sqlite: bool) -> None:
+    if not sqlite:
+        await benchmark(engine, calls)
+        await engine.dispose()
+        return
+
+    sqlite_engine = create_async_engine("sqlite+aiosqlite://")
+    async with sqlite_engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    await benchmark(sqlite_engine, calls)
+    await sqlite_engine.dispose()
+
+
+def main() -> None:
+    parser = ArgumentParser(
+        description="Measure the per-call overhead of the hot queries"
+    )
+    parser.add_argument(
+        "-n", "--calls", type=int, default=2000, help="number of calls per query"
+    )
+    parser.add_argument(
+        "--sqlite",
+        action="store_true",
+        help="use an in-memory SQLite database instead of PostgreSQL",
+    )
+    args = parser.parse_args()
+    run(do_run_main(args.calls, args.sqlite))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+# This file is meant to be ran with poetry via `poetry run explain`
+# however it still provides the entry point at the bottom.
+#
+# Runs the hot repository queries against the database, captures the SQL
+# they emit and checks with EXPLAIN that PostgreSQL reads the expected
+# table through the expected index, with an index condition, i.e. the
+# index narrows down the rows rather than just ordering them. Sequential
+# scans are disabled for the check, so the result doesn't depend on the
+# amount of data in the tables.
+from asyncio import run
+from datetime import date, datetime, timezone
+from json import loads
+from sys import stderr, stdout
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from midas.db import engine
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.event import EventRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.report import ReportRepository
+from midas.query.transaction import TransactionRepository
+from midas.util.enums import TransactionType
+
+type Query = Callable[[AsyncSession], Awaitable[Any]]
+
+# (name, table, index the table is expected to be read through, query)
+CHECKS: tuple[tuple[str, str, str, Query], ...] = (
+    (
+        "TransactionRepository.get_recent",
+        "transactions",
+        "ix_transactions_user_id_created_at",
+        lambda session: TransactionRepository(session).get_recent(0),
+    ),
+    (
+        "TransactionRepository.get_recent(after)",
+        "transactions",
+        "ix_transactions_user_id_created_at",
+        lambda session: TransactionRepository(session).get_recent(
+            0, after=(datetime.now(timezone.utc), UUID(int=0))
+        ),
+    ),
+    (
+        "TransactionRepository.sum_by_type",
+        "transactions",
+        "ix_transactions_user_id_created_at",
+        lambda session: TransactionRepository(session).sum_by_type(
+            0,
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+            datetime(2025, 4, 1, tzinfo=timezone.utc),
+        ),
+    ),
+    (
+        "EventRepository.get_upcoming_events",
+        "events",
+        "ix_events_next_run_on",
+        lambda session: EventRepository(session).get_upcoming_events(),
+    ),
+    (
+        "EventRepository.get_upcoming_events(claim)",
+        "events",
+        "ix_events_next_run_on",
+        lambda session: EventRepository(session).get_upcoming_events(claim=500),
+    ),
+    (
+        "EventRepository.get_earliest_next_run_on",
+        "events",
+        "ix_events_next_run_on",
+        lambda session: EventRepository(session).get_earliest_next_run_on(),
+    ),
+    (
+        "EventRepository.get_by_user_id",
+        "events",
+        "ix_events_user_id_id",
+        lambda session: EventRepository(session).get_by_user_id(0),
+    ),
+    (
+        "AccountRepository.get_user_account_by_transaction_type",
+        "accounts",
+        "accounts_user_id_transaction_type_id_key",
+        lambda session: AccountRepository(session).get_user_account_by_transaction_type(
+            0, TransactionType.INCOME
+        ),
+    ),
+    (
+        "AccountPeriodRepository.get_balances",
+        "account_periods",
+        "account_periods_pkey",
+        lambda session: AccountPeriodRepository(session).get_balances(
+            0, date(2025, 1, 1)
+        ),
+    ),
+    (
+        "MonthlyAggregateRepository.get_by_period",
+        "monthly_aggregates",
+        "monthly_aggregates_pkey",
+        lambda session: MonthlyAggregateRepository(session).get_by_period(
+            0, date(2025, 1, 1), date(2026, 1, 1)
+        ),
+    ),
+    (
+        "ReportRepository.get_by_user_id",
+        "reports",
+        "reports_pkey",
+        lambda session: ReportRepository(session).get_by_user_id(0),
+    ),
+    (
+        "ReportRepository.get_by_user_id(after)",
+        "reports",
+        "reports_pkey",
+        lambda session: ReportRepository(session).get_by_user_id(
+            0, after=date(2025, 1, 1)
+        ),
+    ),
+)
+
+
+def _find_scans(plan: dict[str, Any], table: str) -> list[dict[str, Any]]:
+    """
+    Collect all plan nodes reading `table` or one of its partitions,
+    which are named `<table>_<suffix>`.
+    """
+    scans = []
+    name = plan.get("Relation Name", "")
+    if name == table or name.startswith(f"{table}_"):
+        scans.append(plan)
+    for child in plan.get("Plans", []):
+        scans.extend(_find_scans(child, table))
+    return scans
+
+
+def _index_names(scan: dict[str, Any]) -> list[str]:
+    """
+    Collect names of the indexes a scan node reads. Bitmap heap scans
+    read the table through the bitmap index scans below them.
+    """
+    if "Index Name" in scan:
+        return [scan["Index Name"]]
+    names = []
+    for child in scan.get("Plans", []):
+        names.extend(_index_names(child))
+    return names
+
+
+def _has_condition(scan: dict[str, Any]) -> bool:
+    """
+    Check that the index narrows down the rows the scan node reads.
+    """
+    if scan["Node Type"] == "Bitmap Heap Scan":
+        return "Recheck Cond" in scan
+    return "Index Cond" in scan
+
+
+async def _capture(connection: AsyncConnection, query: Query) -> tuple[str, Any]:
+    """
+    Run `query` and return the first statement it sent to the database.
+    """
+    captured: list[tuple[str, Any]] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        captured.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", on_execute)
+    try:
+        await query(AsyncSession(bind=connection))
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", on_execute)
+
+    return captured[0]
+
+
+async def _ancestors(connection: AsyncConnection, index: str) -> set[str]:
+    """
+    Get names of `index` and of the partitioned indexes it's a partition
+    of. Partitions of a table get indexes of their own, named after the
+    partition.
+    """
+    result = await connection.execute(
+        text(
+            "SELECT relid::text FROM pg_partition_ancestors(CAST(:index AS regclass))"
+        ),
+        {"index": index},
+    )
+    # plain indexes aren't partitions and have no ancestors
+    return {index, *result.scalars()}
+
+
+async def check(name: str, table: str, index: str, query: Query) -> bool:
+    """
+    Check that the first statement of `query` reads `table` through
+    `index` with an index condition.
+
+    :return: `True` if the check passed
+    :rtype: bool
+    """
+    async with engine.connect() as connection:
+        statement, parameters = await _capture(connection, query)
+
+        await connection.execute(text("SET LOCAL enable_seqscan = off"))
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        raw = result.scalar_one()
+        plan = (loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+        scans = _find_scans(plan, table)
+        passed = len(scans) > 0
+        for scan in scans:
+            names = _index_names(scan)
+            ancestors = [await _ancestors(connection, name) for name in names]
+            passed = (
+                passed
+                and _has_condition(scan)
+                and any(index in names for names in ancestors)
+            )
+        await connection.rollback()
+
+    used = ", ".join(
+        f"{scan['Node Type']} using {', '.join(_index_names(scan)) or 'no index'}"
+        for scan in scans
+    )
+    status = "OK  " if passed else "FAIL"
+    print(f"{status} {name}: {table} read with {used or 'nothing'}, expected {index}")
+    return passed
+
+
+async def do_run_main() -> bool:
+    results = [await check(*args) for args in CHECKS]
+    await engine.dispose()
+    return all(results)
+
+
+def main() -> None:
+    if not run(do_run_main()):
+        print("Some queries don't use an index", file=stderr)
+        exit(1)
+    print("All queries use an index", file=stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""add id to transactions user index
+
+Revision ID: 1b7e4c9a5d20
+Revises: 9c4f1e7a2b35
+Create Date: 2026-10-18 12:31:52.604117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b7e4c9a5d20'
+down_revision: Union[str, Sequence[str], None] = '9c4f1e7a2b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _replace_index(columns: list) -> None:
+    # the new index is built next to the old one, so the transactions are
+    # never left without an index on user_id while it's being built
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transactions_user_id_created_at_new', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+        op.create_index('ix_transactions_user_id_created_at_new', 'transactions', columns, unique=False, postgresql_concurrently=True)
+        op.drop_index('ix_transactions_user_id_created_at', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+    op.execute('ALTER INDEX ix_transactions_user_id_created_at_new RENAME TO ix_transactions_user_id_created_at')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # keyset pagination seeks past a (created_at, id) cursor
+    _replace_index(['user_id', sa.text('created_at DESC'), sa.text('id DESC')])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _replace_index(['user_id', sa.text('created_at DESC')])
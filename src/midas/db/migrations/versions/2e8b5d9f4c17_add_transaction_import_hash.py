@@ -0,0 +1,34 @@
+"""add transaction import hash
+
+Revision ID: 2e8b5d9f4c17
+Revises: 1b7e4c9a5d20
+Create Date: 2026-10-18 14:12:45.530127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2e8b5d9f4c17'
+down_revision: Union[str, Sequence[str], None] = '1b7e4c9a5d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # nullable column without a default, the table isn't rewritten
+    op.add_column('transactions', sa.Column('import_hash', sa.String(length=64), nullable=True))
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transactions_user_id_import_hash', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+        op.create_index('ix_transactions_user_id_import_hash', 'transactions', ['user_id', 'import_hash'], unique=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_transactions_user_id_import_hash', table_name='transactions', postgresql_concurrently=True, if_exists=True)
+    op.drop_column('transactions', 'import_hash')
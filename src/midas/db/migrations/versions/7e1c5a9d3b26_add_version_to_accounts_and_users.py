@@ -0,0 +1,31 @@
+"""add version to accounts and users
+
+Revision ID: 7e1c5a9d3b26
+Revises: 4f7b2e9c1d58
+Create Date: 2026-10-18 21:12:44.903217
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e1c5a9d3b26'
+down_revision: Union[str, Sequence[str], None] = '4f7b2e9c1d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # dropped again by e5b9d2a7c413, postings stop updating the accounts
+    op.add_column('accounts', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+    op.add_column('users', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'version')
+    op.drop_column('accounts', 'version')
@@ -0,0 +1,107 @@
+"""partition transactions by month
+
+Revision ID: 8a6f2d4b9e03
+Revises: 5d3a7c9e1b64
+Create Date: 2026-10-18 16:40:07.218954
+
+"""
+from datetime import date, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a6f2d4b9e03'
+down_revision: Union[str, Sequence[str], None] = '5d3a7c9e1b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = 'id, user_id, transaction_type_id, created_at, title, description, amount, debit_account_id, credit_account_id, updated_at, import_hash'
+# number of upcoming months that get a partition right away
+MONTHS_AHEAD = 3
+
+
+def _create_transactions_table(*args, **kwargs) -> None:
+    op.create_table('transactions',
+    sa.Column('id', sa.Uuid(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('transaction_type_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('title', sa.String(length=64), nullable=False),
+    sa.Column('description', sa.String(length=256), nullable=True),
+    sa.Column('amount', sa.Numeric(precision=12, scale=2), nullable=False),
+    sa.Column('debit_account_id', sa.Integer(), nullable=False),
+    sa.Column('credit_account_id', sa.Integer(), nullable=True),
+    sa.Column('updated_at', sa.TIMESTAMP(timezone=True), nullable=True),
+    sa.Column('import_hash', sa.String(length=64), nullable=True),
+    sa.ForeignKeyConstraint(['credit_account_id'], ['accounts.id'], name='transactions_credit_account_id_fkey'),
+    sa.ForeignKeyConstraint(['debit_account_id'], ['accounts.id'], name='transactions_debit_account_id_fkey'),
+    sa.ForeignKeyConstraint(['transaction_type_id'], ['transaction_types.id'], name='transactions_transaction_type_id_fkey'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name='transactions_user_id_fkey'),
+    *args,
+    **kwargs
+    )
+
+
+def _rename_old_table(suffix: str) -> None:
+    op.rename_table('transactions', f'transactions_{suffix}')
+    op.execute(f'ALTER INDEX transactions_pkey RENAME TO transactions_{suffix}_pkey')
+    op.execute(f'ALTER INDEX ix_transactions_user_id_created_at RENAME TO ix_transactions_{suffix}_user_id_created_at')
+    op.execute(f'ALTER INDEX ix_transactions_user_id_import_hash RENAME TO ix_transactions_{suffix}_user_id_import_hash')
+
+
+def _next_month(month: date) -> date:
+    return (month + timedelta(days=31)).replace(day=1)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the partitioned table is created next to the old one and filled
+    # with a single INSERT ... SELECT, the old table is locked meanwhile
+    op.execute('LOCK TABLE transactions IN EXCLUSIVE MODE')
+    _rename_old_table('unpartitioned')
+
+    _create_transactions_table(
+        sa.PrimaryKeyConstraint('id', 'created_at'),
+        postgresql_partition_by='RANGE (created_at)',
+    )
+    op.create_index('ix_transactions_user_id_created_at', 'transactions', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_transactions_user_id_import_hash', 'transactions', ['user_id', 'import_hash', 'created_at'], unique=True)
+
+    # one partition per month from the month of the oldest transaction,
+    # or the current month if there's none, to MONTHS_AHEAD months after
+    # the current one. The default partition takes the transactions
+    # outside of them, e.g. ones imported later with older dates.
+    first = op.get_bind().execute(sa.text(
+        "SELECT CAST(date_trunc('month', min(created_at) AT TIME ZONE 'UTC') AS date) FROM transactions_unpartitioned"
+    )).scalar()
+    current = date.today().replace(day=1)
+    month = min(first, current) if first is not None else current
+    for _ in range(MONTHS_AHEAD):
+        current = _next_month(current)
+    while month <= current:
+        op.execute(
+            f"CREATE TABLE transactions_y{month:%Y}m{month:%m} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{month} 00:00+00') TO ('{_next_month(month)} 00:00+00')"
+        )
+        month = _next_month(month)
+    op.execute('CREATE TABLE transactions_default PARTITION OF transactions DEFAULT')
+
+    op.execute(f'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_unpartitioned')
+    op.drop_table('transactions_unpartitioned')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute('LOCK TABLE transactions IN EXCLUSIVE MODE')
+    _rename_old_table('partitioned')
+
+    _create_transactions_table(sa.PrimaryKeyConstraint('id'))
+    op.create_index('ix_transactions_user_id_created_at', 'transactions', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
+    op.create_index('ix_transactions_user_id_import_hash', 'transactions', ['user_id', 'import_hash'], unique=True)
+
+    op.execute(f'INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_partitioned')
+    # drops the partitions as well
+    op.drop_table('transactions_partitioned')
@@ -0,0 +1,51 @@
+"""add hot path indexes
+
+Revision ID: 9c4f1e7a2b35
+Revises: 6b0e2c4d8a1f
+Create Date: 2026-10-18 11:47:03.218664
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4f1e7a2b35'
+down_revision: Union[str, Sequence[str], None] = '6b0e2c4d8a1f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, unique)
+INDEXES = (
+    ('ix_transactions_user_id_created_at', 'transactions', ['user_id', sa.text('created_at DESC')], False),
+    ('ix_events_next_run_on', 'events', ['next_run_on'], False),
+    ('ix_events_user_id_id', 'events', ['user_id', sa.text('id DESC')], False),
+    ('accounts_user_id_transaction_type_id_key', 'accounts', ['user_id', 'transaction_type_id'], True),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block. An
+    # interrupted concurrent build leaves an invalid index behind, so it's
+    # dropped first to make the migration safe to re-run.
+    with op.get_context().autocommit_block():
+        for name, table, columns, unique in INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+            op.create_index(name, table, columns, unique=unique, postgresql_concurrently=True)
+
+    # the unique index is attached as a constraint without another table scan
+    op.execute(
+        'ALTER TABLE accounts ADD CONSTRAINT accounts_user_id_transaction_type_id_key '
+        'UNIQUE USING INDEX accounts_user_id_transaction_type_id_key'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('accounts_user_id_transaction_type_id_key', 'accounts', type_='unique')
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in INDEXES[:-1]:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
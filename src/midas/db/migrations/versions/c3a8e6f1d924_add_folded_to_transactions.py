@@ -0,0 +1,30 @@
+"""add folded to transactions
+
+Revision ID: c3a8e6f1d924
+Revises: 7e1c5a9d3b26
+Create Date: 2026-10-18 22:03:18.517642
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a8e6f1d924'
+down_revision: Union[str, Sequence[str], None] = '7e1c5a9d3b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('transactions', sa.Column('folded', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.create_index('ix_transactions_user_id_unfolded', 'transactions', ['user_id'], unique=False, postgresql_where=sa.text('NOT folded'), sqlite_where=sa.text('NOT folded'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_user_id_unfolded', table_name='transactions', postgresql_where=sa.text('NOT folded'), sqlite_where=sa.text('NOT folded'))
+    op.drop_column('transactions', 'folded')
@@ -0,0 +1,30 @@
+"""include type and amount in user index
+
+Revision ID: d2f6a8c4e157
+Revises: b4d8f3a6c190
+Create Date: 2026-10-19 02:04:33.918265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f6a8c4e157'
+down_revision: Union[str, Sequence[str], None] = 'b4d8f3a6c190'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_transactions_user_id_created_at', table_name='transactions')
+    op.create_index('ix_transactions_user_id_created_at', 'transactions', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False, postgresql_include=['transaction_type_id', 'amount'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transactions_user_id_created_at', table_name='transactions')
+    op.create_index('ix_transactions_user_id_created_at', 'transactions', ['user_id', sa.text('created_at DESC'), sa.text('id DESC')], unique=False)
@@ -0,0 +1,62 @@
+"""add account periods
+
+Revision ID: e5b9d2a7c413
+Revises: c3a8e6f1d924
+Create Date: 2026-10-18 23:41:07.208311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b9d2a7c413'
+down_revision: Union[str, Sequence[str], None] = 'c3a8e6f1d924'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTH = "date_trunc('month', timezone('UTC', created_at))::date"
+CURRENT_MONTH = "date_trunc('month', timezone('UTC', now()))::date"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('account_periods',
+    sa.Column('account_id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.Date(), nullable=False),
+    sa.Column('debit_amount', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False),
+    sa.Column('credit_amount', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False),
+    sa.ForeignKeyConstraint(['account_id'], ['accounts.id'], ),
+    sa.PrimaryKeyConstraint('account_id', 'period')
+    )
+    # the history of every month is rebuilt from the folded transactions,
+    # the journal tail is added by the compactor
+    op.execute(
+        'INSERT INTO account_periods (account_id, period, debit_amount, credit_amount) '
+        'SELECT account_id, period, sum(debit_amount), sum(credit_amount) FROM ('
+        f'SELECT debit_account_id AS account_id, {MONTH} AS period, amount AS debit_amount, 0 AS credit_amount '
+        'FROM transactions WHERE folded '
+        'UNION ALL '
+        f'SELECT credit_account_id, {MONTH}, 0, amount '
+        'FROM transactions WHERE folded AND credit_account_id IS NOT NULL'
+        ') AS entries GROUP BY account_id, period'
+    )
+    op.drop_column('accounts', 'credit_amount')
+    op.drop_column('accounts', 'debit_amount')
+    # the account rows aren't updated anymore, nothing to version
+    op.drop_column('accounts', 'version')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('accounts', sa.Column('version', sa.Integer(), server_default=sa.text('1'), nullable=False))
+    op.add_column('accounts', sa.Column('debit_amount', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False))
+    op.add_column('accounts', sa.Column('credit_amount', sa.Numeric(precision=12, scale=2), server_default='0', nullable=False))
+    op.execute(
+        'UPDATE accounts SET debit_amount = account_periods.debit_amount, '
+        'credit_amount = account_periods.credit_amount FROM account_periods '
+        f'WHERE account_periods.account_id = accounts.id AND account_periods.period = {CURRENT_MONTH}'
+    )
+    op.drop_table('account_periods')
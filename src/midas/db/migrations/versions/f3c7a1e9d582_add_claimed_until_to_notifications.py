@@ -0,0 +1,28 @@
+"""add claimed_until to notifications
+
+Revision ID: f3c7a1e9d582
+Revises: d2f6a8c4e157
+Create Date: 2026-10-19 09:41:17.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c7a1e9d582'
+down_revision: Union[str, Sequence[str], None] = 'd2f6a8c4e157'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('notifications_outbox', sa.Column('claimed_until', sa.TIMESTAMP(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('notifications_outbox', 'claimed_until')
@@ -0,0 +1,82 @@
+# This file is meant to be ran with poetry via `poetry run partitions`
+# however it still provides the entry point at the bottom.
+#
+# Manages the monthly partitions of the `transactions` table. The bot
+# creates upcoming partitions on its own, this command is for listing them,
+# creating them in advance and detaching old ones. A detached partition is
+# a standalone table that can be archived with `pg_dump` and dropped, its
+# transactions are no longer visible to the application, but they're
+# still counted in the monthly aggregates.
+from argparse import ArgumentParser
+from asyncio import run
+from datetime import datetime
+from sys import stderr, stdout
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db import engine
+from midas.query.transaction import TransactionRepository
+from midas.usecase.transaction import CreateTransactionPartitionsUsecase
+
+
+async def list_partitions() -> None:
+    async with AsyncSession(engine) as session:
+        for name in await TransactionRepository(session).get_partitions():
+            print(name, file=stdout)
+
+
+async def create_partitions(months_ahead: int) -> None:
+    async with AsyncSession(engine) as session:
+        created = await CreateTransactionPartitionsUsecase(session).execute(
+            months_ahead
+        )
+    print(f"Created {len(created)} partitions", file=stdout)
+    for name in created:
+        print(name, file=stdout)
+
+
+async def detach_partition(month: str) -> None:
+    async with AsyncSession(engine) as session:
+        name = await TransactionRepository(session).detach_partition(
+            datetime.strptime(month, "%Y-%m").date()
+        )
+        await session.commit()
+    print(f"Detached {name}", file=stdout)
+
+
+async def do_run_main(args) -> None:
+    match args.command:
+        case "list":
+            await list_partitions()
+        case "create":
+            await create_partitions(args.ahead)
+        case "detach":
+            await detach_partition(args.month)
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Manage partitions of transactions.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="list partitions")
+    create = commands.add_parser(
+        "create", help="create partitions of the current and upcoming months"
+    )
+    create.add_argument(
+        "-a",
+        "--ahead",
+        type=int,
+        default=3,
+        help="number of upcoming months (default: 3)",
+    )
+    detach = commands.add_parser("detach", help="detach the partition of a month")
+    detach.add_argument("month", help="month of the partition as YYYY-MM")
+
+    try:
+        run(do_run_main(parser.parse_args()))
+    except ValueError as e:
+        print(e, file=stderr)
+        exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+from dataclasses import dataclass
+from threading import Lock
+from time import perf_counter
+from typing import override
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    Snapshot of the connection pool state. `checkouts`, `total_wait` and
+    `max_wait` are accumulated since the pool was created, wait time being
+    the time spent in `connect()` until a connection was handed out.
+    """
+
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.checkouts if self.checkouts else 0
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that measures how long callers wait for a connection.
+    Use it as the `poolclass` of the engine and read the statistics with
+    `get_stats()`.
+    """
+
+    @override
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._stats_lock = Lock()
+        self._checkouts = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @override
+    def connect(self) -> PoolProxiedConnection:
+        start = perf_counter()
+        connection = super().connect()
+        wait = perf_counter() - start
+
+        with self._stats_lock:
+            self._checkouts += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+        return connection
+
+    def get_stats(self) -> PoolStats:
+        """
+        Get the current pool statistics.
+
+        :return: pool statistics
+        :rtype: PoolStats
+        """
+        return PoolStats(
+            size=self.size(),
+            checked_in=self.checkedin(),
+            checked_out=self.checkedout(),
+            overflow=max(0, self.overflow()),
+            checkouts=self._checkouts,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
@@ -0,0 +1,145 @@
+from asyncio import sleep, wait_for
+from typing import Optional
+from sqlalchemy import event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from midas.loggers import app_logger
+
+# zero when the replica has replayed everything it received, so an idle
+# primary doesn't look like replication lag
+_LAG_QUERY = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery()
+            OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+    """)
+
+
+class ReplicaRouter:
+    """
+    Read replica router. Keeps track of whether the replica is reachable
+    and how far it lags behind the primary, read-only sessions are bound
+    to the replica only while it is reachable and its lag is within
+    `max_lag` seconds. Otherwise they fall back to the primary.
+
+    The state is refreshed by `loop()`, a replica that was never checked
+    is considered unavailable.
+    """
+
+    def __init__(
+        self,
+        replica: Optional[AsyncEngine],
+        max_lag: float = 1,
+        interval: float = 5,
+    ) -> None:
+        """
+        Create new replica router.
+
+        :param replica: replica engine or `None` if no replica is set up
+        :type replica: Optional[AsyncEngine]
+        :param max_lag: number of seconds the replica may lag behind the
+        primary and still serve reads.
+        :type max_lag: float
+        :param interval: number of seconds between two checks of the
+        replica, also the timeout of a check.
+        :type interval: float
+        """
+        self._replica = replica
+        self._MAX_LAG = max_lag
+        self._INTERVAL = interval
+        self._available = False
+        self._lag: Optional[float] = None
+
+        if replica is not None:
+            event.listen(replica.sync_engine, "handle_error", self._handle_error)
+
+    @property
+    def engine(self) -> Optional[AsyncEngine]:
+        """
+        The replica engine if it may serve reads right now, `None` otherwise.
+        """
+        return self._replica if self._available else None
+
+    @property
+    def replica(self) -> Optional[AsyncEngine]:
+        """
+        The replica engine, whether it may serve reads right now or not.
+        """
+        return self._replica
+
+    @property
+    def lag(self) -> Optional[float]:
+        """
+        Replication lag in seconds measured by the last successful check.
+        """
+        return self._lag
+
+    def _set_available(self, available: bool, reason: str) -> None:
+        if available != self._available:
+            if available:
+                app_logger.info(f"Routing read-only sessions to the replica: {reason}")
+            else:
+                app_logger.warning(
+                    f"Routing read-only sessions to the primary: {reason}"
+                )
+        self._available = available
+
+    def mark_unavailable(self, reason: str) -> None:
+        """
+        Route read-only sessions to the primary until the next successful
+        check, without waiting for it to notice the replica is gone.
+
+        :param reason: why the replica is unavailable, logged
+        :type reason: str
+        """
+        self._set_available(False, reason)
+
+    def _handle_error(self, context: ExceptionContext) -> None:
+        # don't wait for the next check once the replica went away
+        if context.is_disconnect:
+            self.mark_unavailable("lost connection to the replica")
+
+    async def _get_lag(self) -> float:
+        assert self._replica is not None
+        async with self._replica.connect() as connection:
+            # nothing to replay for other dialects, e.g. in tests
+            if connection.dialect.name != "postgresql":
+                return 0
+            return float((await connection.execute(_LAG_QUERY)).scalar_one())
+
+    async def check(self) -> bool:
+        """
+        Check whether the replica is reachable and measure its lag.
+
+        :return: `True` if read-only sessions are routed to the replica.
+        :rtype: bool
+        """
+        if self._replica is None:
+            return False
+
+        try:
+            self._lag = await wait_for(self._get_lag(), self._INTERVAL)
+        except (OSError, SQLAlchemyError, TimeoutError) as e:
+            self._set_available(False, f"replica is unavailable ({e!r})")
+            return False
+
+        if self._lag > self._MAX_LAG:
+            self._set_available(False, f"replica lags {self._lag:.1f}s behind")
+        else:
+            self._set_available(True, f"replica lags {self._lag:.1f}s behind")
+        return self._available
+
+    async def loop(self) -> None:
+        """
+        Check the replica every `interval` seconds. This coroutine never
+        returns and does nothing if no replica is set up.
+        """
+        if self._replica is None:
+            return
+
+        while True:
+            await self.check()
+            await sleep(self._INTERVAL)
@@ -1,5 +1,4 @@
-from decimal import Decimal
-from sqlalchemy import ForeignKey, Numeric
+from sqlalchemy import ForeignKey, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from midas.db import Base
 
@@ -7,27 +6,27 @@ from midas.db import Base
 class Account(Base):
     """
     Account database table. Represents double-entry accounts each user
-    has for different expenses and one for income.
+    has for different expenses and one for income. The debit and credit
+    amounts of each month are kept in `AccountPeriod`.
 
     id:             serial primary key
     user_id:        int foreign key not null
-    debit_amount:   Numeric(12, 2) not null default 0
-    credit_amount:  Numeric(12, 2) not null default 0
     """
 
     __tablename__ = "accounts"
+    __table_args__ = (
+        UniqueConstraint(
+            "user_id",
+            "transaction_type_id",
+            name="accounts_user_id_transaction_type_id_key",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
     transaction_type_id: Mapped[int] = mapped_column(
         ForeignKey("transaction_types.id"), nullable=False
     )
-    debit_amount: Mapped[Decimal] = mapped_column(
-        Numeric(12, 2), default=0, nullable=False
-    )
-    credit_amount: Mapped[Decimal] = mapped_column(
-        Numeric(12, 2), default=0, nullable=False
-    )
 
     user = relationship("User", back_populates="accounts")
     debit_transactions = relationship(
@@ -43,4 +42,6 @@ class Account(Base):
     transaction_type = relationship("TransactionType", back_populates="accounts")
 
     def __repr__(self) -> str:
-        return f"Account({self.id=!r}, {self.user_id=!r}, {self.debit_amount=!r}, {self.credit_amount=!r})"
+        return (
+            f"Account({self.id=!r}, {self.user_id=!r}, {self.transaction_type_id=!r})"
+        )
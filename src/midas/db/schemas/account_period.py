@@ -0,0 +1,37 @@
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import Date, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+from midas.db import Base
+
+
+class AccountPeriod(Base):
+    """
+    Account periods database table. Represents the debit and credit
+    amounts of an account in a month. Postings add to the row of the
+    month the transaction was created in, the row is created by the first
+    posting of the month, so a new month starts with no rows at all and
+    the amounts of past months are kept as they were.
+
+    `period` is the first day of the month the transactions were created
+    in, in UTC.
+
+    account_id:     int primary key, foreign key
+    period:         date primary key
+    debit_amount:   Numeric(12, 2) not null default 0
+    credit_amount:  Numeric(12, 2) not null default 0
+    """
+
+    __tablename__ = "account_periods"
+
+    account_id: Mapped[int] = mapped_column(ForeignKey("accounts.id"), primary_key=True)
+    period: Mapped[date] = mapped_column(Date, primary_key=True)
+    debit_amount: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), default=Decimal(), server_default="0", nullable=False
+    )
+    credit_amount: Mapped[Decimal] = mapped_column(
+        Numeric(12, 2), default=Decimal(), server_default="0", nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return f"AccountPeriod({self.account_id=!r}, {self.period=!r}, {self.debit_amount=!r}, {self.credit_amount=!r})"
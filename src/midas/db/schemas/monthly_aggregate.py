@@ -0,0 +1,40 @@
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import Date, ForeignKey, Numeric
+from sqlalchemy.orm import Mapped, mapped_column
+from midas.db import Base
+
+
+class MonthlyAggregate(Base):
+    """
+    Monthly aggregates database table. Represents the sum and the number
+    of transactions of each type a user made in a month. The rows are
+    maintained incrementally by the transaction usecases, so reports over
+    whole months read one row per transaction type and month instead of
+    the transactions, see `GetPeriodReportUsecase`. Only the folded
+    transactions are counted, see `Transaction.folded`.
+
+    `period` is the first day of the month the transactions were created
+    in, in UTC.
+
+    user_id:                int primary key, foreign key
+    period:                 date primary key
+    transaction_type_id:    int primary key, foreign key
+    total:                  Numeric(14, 2) not null default 0
+    count:                  int not null default 0
+    """
+
+    __tablename__ = "monthly_aggregates"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    period: Mapped[date] = mapped_column(Date, primary_key=True)
+    transaction_type_id: Mapped[int] = mapped_column(
+        ForeignKey("transaction_types.id"), primary_key=True
+    )
+    total: Mapped[Decimal] = mapped_column(
+        Numeric(14, 2), default=Decimal(), nullable=False
+    )
+    count: Mapped[int] = mapped_column(default=0, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MonthlyAggregate({self.user_id=!r}, {self.period=!r}, {self.transaction_type_id=!r}, {self.total=!r}, {self.count=!r})"
@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import TIMESTAMP, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+from midas.db import Base
+
+
+class Notification(Base):
+    """
+    Notifications outbox database table. Represents notifications that
+    are written in the same database transaction as the change they tell
+    the user about and are yet to be sent by the outbox dispatcher.
+    Rows are deleted once the notification is handed over to the notifier.
+
+    `claimed_until` is the end of the lease a dispatcher took on the row
+    while delivering it. Rows with an expired lease are claimed again.
+
+    id:             serial primary key
+    user_id:        int foreign key not null
+    message:        varchar(4096) not null
+    created_at:     timestamp default now not null
+    claimed_until:  timestamp
+    """
+
+    __tablename__ = "notifications_outbox"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
+    message: Mapped[str] = mapped_column(String(4096), nullable=False)
+    created_at = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False,
+    )
+    claimed_until: Mapped[Optional[datetime]] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True
+    )
+
+    def __repr__(self) -> str:
+        return f"Notification({self.id=!r}, {self.user_id=!r}, {self.message=!r}, {self.created_at=!r}, {self.claimed_until=!r})"
@@ -0,0 +1,40 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from sqlalchemy import JSON, TIMESTAMP, Date, ForeignKey, Numeric, func
+from sqlalchemy.orm import Mapped, mapped_column
+from midas.db import Base
+
+
+class Report(Base):
+    """
+    Reports database table. Represents the monthly report generated for
+    a user, so past reports are read back instead of being recomputed.
+    There's at most one report per user and month.
+
+    `period` is the first day of the reported month, in UTC. `accounts`
+    maps the lowercase transaction type names to the balance of the
+    user's account in the month, the amounts are stored as strings to
+    keep them exact.
+
+    user_id:    int primary key, foreign key
+    period:     date primary key
+    accounts:   json not null
+    result:     Numeric(14, 2) not null
+    created_at: timestamp default now not null
+    """
+
+    __tablename__ = "reports"
+
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    period: Mapped[date] = mapped_column(Date, primary_key=True)
+    accounts: Mapped[dict[str, str]] = mapped_column(JSON, nullable=False)
+    result: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    created_at = mapped_column(
+        TIMESTAMP(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"Report({self.user_id=!r}, {self.period=!r}, {self.accounts=!r}, {self.result=!r}, {self.created_at=!r})"
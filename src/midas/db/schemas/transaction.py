@@ -2,7 +2,17 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Optional
 from uuid import uuid4
-from sqlalchemy import TIMESTAMP, ForeignKey, Numeric, String, Uuid, func
+from sqlalchemy import (
+    TIMESTAMP,
+    ForeignKey,
+    Index,
+    Numeric,
+    String,
+    Uuid,
+    func,
+    text,
+    true,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from midas.db import Base
 
@@ -24,18 +34,63 @@ class Transaction(Base):
     transactions violate double-entry rules and apply changes only
     to Income account.
 
+    On PostgreSQL the table is partitioned by month on `created_at`, see
+    `TransactionRepository.create_partitions()`. The partition key has to
+    be a part of every unique constraint, hence `created_at` is a part of
+    the primary key and of the import hash index. Rows outside the monthly
+    partitions, e.g. old imported transactions, go to the default
+    partition.
+
+    With `LEDGER_MODE=journal` postings only insert transactions, the
+    amounts of accounts, the users' balances and the monthly aggregates
+    are a snapshot rolled forward by the journal compactor. `folded`
+    tells whether the transaction is included in the snapshot, see
+    `CompactJournalUsecase`. In the default mode every transaction is
+    folded when posted.
+
     id:                     uuid primary key
     user_id:                int foreign key not null
     transaction_type_id:    int foreign key not null
-    created_at:             timestamp default now not null
+    created_at:             timestamp primary key default now
     title:                  varchar(64) not null
     description:            varchar(256)
     amount:                 Numeric(12, 2) not null
     debit_account_id:       int foreign key not null
     credit_account_id:      int foreign key
+    import_hash:            varchar(64), unique per user and time
+    folded:                 bool not null default true
     """
 
     __tablename__ = "transactions"
+    __table_args__ = (
+        # covers the sums by transaction type over a time range as well,
+        # see `TransactionRepository.sum_by_type()`
+        Index(
+            "ix_transactions_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["transaction_type_id", "amount"],
+        ),
+        # re-importing a bank statement skips the rows imported before.
+        # The creation time is hashed as well, so it doesn't loosen the
+        # constraint.
+        Index(
+            "ix_transactions_user_id_import_hash",
+            "user_id",
+            "import_hash",
+            "created_at",
+            unique=True,
+        ),
+        # the journal tail, i.e. the transactions not folded yet
+        Index(
+            "ix_transactions_user_id_unfolded",
+            "user_id",
+            postgresql_where=text("NOT folded"),
+            sqlite_where=text("NOT folded"),
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[Uuid] = mapped_column(Uuid, default=uuid4, primary_key=True)
     user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=False)
@@ -46,7 +101,7 @@ class Transaction(Base):
         TIMESTAMP(timezone=True),
         default=lambda: datetime.now(timezone.utc),
         server_default=func.now(),
-        nullable=False,
+        primary_key=True,
     )
     updated_at = mapped_column(
         TIMESTAMP(timezone=True),
@@ -62,6 +117,10 @@ class Transaction(Base):
         ForeignKey("accounts.id"), nullable=False
     )
     credit_account_id: Mapped[Optional[int]] = mapped_column(ForeignKey("accounts.id"))
+    import_hash: Mapped[Optional[str]] = mapped_column(String(64))
+    folded: Mapped[bool] = mapped_column(
+        nullable=False, default=True, server_default=true()
+    )
 
     user = relationship("User", back_populates="transactions")
     transaction_type = relationship("TransactionType", back_populates="transactions")
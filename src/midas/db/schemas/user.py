@@ -1,5 +1,5 @@
 from decimal import Decimal
-from sqlalchemy import ForeignKey, Numeric
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, Numeric, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from midas.db import Base
@@ -12,13 +12,31 @@ class User(Base):
     `send_notifications` columns reference the currency that user's adopted
     and whether or not they want to receive notifications respectively.
 
+    A deleted user is only marked with `deleted_at` at first, their data
+    is purged in the background, see `PurgeDeletedUsersUsecase`.
+
     id:                 int primary key
     currency_id:        int not null
     send_notifications: bool not null default true
     balance:            Numeric(12, 2) not null default 0
+    deleted_at:         timestamp
+    version:            int not null default 1
+
+    `version` is incremented by every update of the row. The ORM checks
+    it when flushing, so an update made from a stale read raises
+    `StaleDataError` instead of overwriting a concurrent one, see
+    `retry_on_stale_data()`.
     """
 
     __tablename__ = "users"
+    __table_args__ = (
+        Index(
+            "ix_users_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+            sqlite_where=text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     currency_id: Mapped[int] = mapped_column(
@@ -28,6 +46,10 @@ class User(Base):
     balance: Mapped[Decimal] = mapped_column(
         Numeric(12, 2), nullable=False, default=Decimal()
     )
+    deleted_at = mapped_column(TIMESTAMP(timezone=True), nullable=True)
+    version: Mapped[int] = mapped_column(nullable=False, server_default=text("1"))
+
+    __mapper_args__ = {"version_id_col": version}
 
     currency = relationship("Currency", back_populates="users")
     accounts = relationship("Account", back_populates="user")
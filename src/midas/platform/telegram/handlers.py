@@ -1,21 +1,110 @@
 from asyncio import create_task
+from os import getenv
+
+from midas.db import engine, journal_ledger, replica_router
+from midas.services import outbox_dispatcher, scheduler
 
 from midas.platform.telegram.bot import bot
 from midas.platform.telegram.service.notifier import TelegramNotifier
-from midas.service.schedule import EventHandler, ReportHandler
+from midas.service.metrics import start_metrics_server
+from midas.service.pool_monitor import PoolMonitor
+from midas.service.schedule import (
+    EventHandler,
+    JournalCompactionHandler,
+    PartitionHandler,
+    ReportHandler,
+    UserPurgeHandler,
+)
 
 
 notifier = TelegramNotifier(bot)
 
 
+async def start_notifier() -> None:
+    notifier.start()
+
+
+async def stop_notifier() -> None:
+    await notifier.stop()
+
+
+async def start_outbox_dispatching() -> None:
+    create_task(outbox_dispatcher.loop(notifier))
+
+
+async def start_scheduler() -> None:
+    create_task(scheduler.loop())
+
+
+async def start_metrics_endpoint() -> None:
+    port = getenv("METRICS_PORT", "9100")
+    # blank port disables the endpoint
+    if not port:
+        return
+
+    await start_metrics_server(getenv("METRICS_HOST", "127.0.0.1"), int(port))
+
+
+async def start_pool_monitoring() -> None:
+    interval = float(getenv("DB_POOL_STATS_INTERVAL", "300") or 0)
+    monitor = PoolMonitor(engine, interval)
+    # the statistics are still exposed as metrics when logging is disabled
+    if interval > 0:
+        create_task(monitor.loop())
+
+
+async def start_replica_monitoring() -> None:
+    # read-only usecases use the primary until the replica was checked
+    create_task(replica_router.loop())
+
+
 async def start_event_handling() -> None:
-    handler = EventHandler(notifier)
-    create_task(handler.loop())
+    # events are handled by `poetry run worker` processes instead
+    if getenv("DISABLE_EVENT_HANDLING", "False").lower() in ("true", "1"):
+        return
+
+    scheduler.add(EventHandler(claim=True))
 
 
 async def start_monthly_reporting() -> None:
-    handler = ReportHandler(notifier)
-    create_task(handler.loop())
+    scheduler.add(ReportHandler())
+
+
+async def start_partition_maintenance() -> None:
+    months = int(getenv("TRANSACTION_PARTITIONS_AHEAD", "3"))
+    scheduler.add(PartitionHandler(months_ahead=months))
+
+
+async def start_user_purging() -> None:
+    batch_size = int(getenv("USER_PURGE_BATCH_SIZE", "1000"))
+    scheduler.add(UserPurgeHandler(batch_size=batch_size))
+
+
+async def start_journal_compaction() -> None:
+    # the balances are updated by every posting otherwise
+    if not journal_ledger:
+        return
+
+    interval = int(getenv("JOURNAL_COMPACTION_INTERVAL", "60"))
+    batch_size = int(getenv("JOURNAL_COMPACTION_BATCH_SIZE", "10000"))
+    scheduler.add(
+        JournalCompactionHandler(
+            notifier, update_interval=interval, batch_size=batch_size
+        )
+    )
 
 
-__all__ = ("start_event_handling", "start_monthly_reporting")
+__all__ = (
+    "start_notifier",
+    "stop_notifier",
+    "start_outbox_dispatching",
+    "start_scheduler",
+    "start_metrics_endpoint",
+    "start_pool_monitoring",
+    "start_replica_monitoring",
+    "start_event_handling",
+    "start_monthly_reporting",
+    "start_partition_maintenance",
+    "start_user_purging",
+    "start_journal_compaction",
+)
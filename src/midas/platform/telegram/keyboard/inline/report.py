@@ -0,0 +1,31 @@
+from enum import IntEnum
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+
+
+class Command(IntEnum):
+    EXIT = 0
+    PREV = 1
+    NEXT = 2
+
+
+class ReportPaginationCommand(CallbackData, prefix="report-pag"):
+    command: Command
+
+
+def get_report_pagination_inline_keyboard() -> InlineKeyboardMarkup:
+    builder = InlineKeyboardBuilder()
+    builder.button(
+        text="🔙",
+        callback_data=ReportPaginationCommand(command=Command.EXIT),
+    )
+    builder.button(
+        text="◀️",
+        callback_data=ReportPaginationCommand(command=Command.PREV),
+    )
+    builder.button(
+        text="▶️",
+        callback_data=ReportPaginationCommand(command=Command.NEXT),
+    )
+    return builder.as_markup()
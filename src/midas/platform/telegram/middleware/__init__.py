@@ -1,3 +1,4 @@
 from .auth import AuthMiddleware
+from .session import SessionMiddleware
 
-__all__ = ("AuthMiddleware",)
+__all__ = ("AuthMiddleware", "SessionMiddleware")
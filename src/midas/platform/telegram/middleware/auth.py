@@ -21,14 +21,12 @@ class AuthMiddleware(BaseMiddleware):
 
     The middleware component fails if:
         * no telegram user is associated with the event.
-        * no text is sent with the event.
+        * no text or document is sent with the event.
         * unregistered user runs unallowed command.
         * registered user runs `/start` command.
-    """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self._usecase = GetUserUsecase()
+    The middleware relies on `SessionMiddleware` for the database session.
+    """
 
     async def __call__(  # type: ignore
         self,
@@ -43,8 +41,9 @@ class AuthMiddleware(BaseMiddleware):
             )
             return
 
-        text = event.text
-        if not text:
+        # documents (e.g. imported bank statements) come without text
+        text = event.text or ""
+        if not text and event.document is None:
             aiogram_logger.warning(
                 "Auth middleware found an event without `message.text` attribute."
             )
@@ -53,7 +52,7 @@ class AuthMiddleware(BaseMiddleware):
         user = (
             await user_storage.get(telegram_user.id)
             if await user_storage.exists(telegram_user.id)
-            else await self._usecase.execute(telegram_user.id)
+            else await GetUserUsecase(data["session"]).execute(telegram_user.id)
         )
         if isinstance(user, User):
             aiogram_logger.info(f"Got request from uncached user {user.id}. Caching.")
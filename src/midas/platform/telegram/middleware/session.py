@@ -0,0 +1,33 @@
+from typing import Any, Awaitable, Callable, Dict
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from midas.query.session import session_factory
+
+
+class SessionMiddleware(BaseMiddleware):
+    """
+    Unit of work middleware implementation class.
+
+    The middleware opens a new database session for every update and passes
+    it to the handlers as the `session` argument, so usecases created in
+    handlers of concurrent updates never share a session. The session is
+    closed once the update is handled.
+    """
+
+    def __init__(
+        self, factory: async_sessionmaker[AsyncSession] = session_factory
+    ) -> None:
+        super().__init__()
+        self._factory = factory
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        async with self._factory() as session:
+            data["session"] = session
+            return await handler(event, data)
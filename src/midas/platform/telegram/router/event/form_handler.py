@@ -4,8 +4,10 @@ from aiogram import F, Router, html
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, ReplyKeyboardRemove
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
+from midas.services import scheduler
 from midas.service.user_caching import CachedUser
 
 from midas.db.schemas.event import Event
@@ -29,13 +31,17 @@ from midas.platform.telegram.util.menu.options import EventMenuOption
 router = Router(name=__name__)
 
 
-async def create_event(message: Message, state: FSMContext) -> None:
+async def create_event(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = {k: v for k, v in (await state.get_data()).items() if k not in ("mode")}
     await state.clear()
 
     try:
-        usecase = CreateEventUsecase()
+        usecase = CreateEventUsecase(session)
         await usecase.execute(**data)
+        # the new event may be due earlier than anything already scheduled
+        scheduler.wake()
         await send_events_menu(message, state, "👍", set_state=True)
     except Exception:
         aiogram_logger.error(f"Event creation failed: {data}", exc_info=True)
@@ -44,7 +50,9 @@ async def create_event(message: Message, state: FSMContext) -> None:
         )
 
 
-async def edit_event(message: Message, state: FSMContext) -> None:
+async def edit_event(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = {
         k: v
         for k, v in (await state.get_data()).items()
@@ -53,8 +61,9 @@ async def edit_event(message: Message, state: FSMContext) -> None:
     await state.clear()
 
     try:
-        usecase = EditEventUsecase()
+        usecase = EditEventUsecase(session)
         await usecase.execute(**data)
+        scheduler.wake()
         await send_events_menu(message, state, "👍", set_state=True)
     except NoChangesDetectedException:
         await send_events_menu(
@@ -218,7 +227,10 @@ async def handle_invalid_amount(message: Message) -> None:
 @router.message(EventForm.frequency, valid_event_frequency_filter)
 @router.message(EventForm.frequency, F.text == SkipAnswer.SKIP)
 async def handle_valid_frequency(
-    message: Message, state: FSMContext, frequency: Optional[EventFrequency] = None
+    message: Message,
+    state: FSMContext,
+    session: AsyncSession,
+    frequency: Optional[EventFrequency] = None,
 ) -> None:
     mode: FormMode = await state.get_value("mode")  # type: ignore
     if await skipped_unskippable(
@@ -231,7 +243,7 @@ async def handle_valid_frequency(
             f"Confirm event creation: {await state.get_value("user_id")}"
         )
         await state.update_data(frequency=frequency)
-        await create_event(message, state)
+        await create_event(message, state, session)
     else:
         aiogram_logger.info(
             f"Confirm event editing: {await state.get_value("user_id")}"
@@ -243,7 +255,7 @@ async def handle_valid_frequency(
         event: Event = await state.get_value("event")  # type: ignore
         await state.update_data(id=event.id)
 
-        await edit_event(message, state)
+        await edit_event(message, state, session)
 
 
 @router.message(EventForm.frequency)
@@ -46,6 +46,10 @@ class EventPager(Pager[Event]):
         )
         return text
 
+    @override
+    def _get_cursor(self, item: Event) -> int:
+        return item.id
+
     @override
     async def handle_edit_callback_query(
         self, query: CallbackQuery, state: FSMContext
@@ -122,8 +126,8 @@ class EventPager(Pager[Event]):
 
 
 pager = EventPager(
-    GetEventsUsecase(),
-    DeleteEventUsecase(),
+    GetEventsUsecase,
+    DeleteEventUsecase,
     get_event_pagination_inline_keyboard(),
     EventPaginationState,
 )
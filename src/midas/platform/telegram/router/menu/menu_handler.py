@@ -2,11 +2,11 @@ from aiogram import F, Router
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.service.user_caching import CachedUser
 
-from midas.db.schemas.user import User
-from midas.usecase.user import GetUserUsecase
+from midas.usecase.user import GetBalanceUsecase
 from midas.util.enums import Currency
 
 from midas.platform.telegram.state.menu import MenuState
@@ -46,13 +46,13 @@ async def handle_events_menu(message: Message, state: FSMContext) -> None:
 @router.message(Command("balance"))
 @router.message(MenuState.active, F.text == MainMenuOption.BALANCE)
 async def handle_balance_command(
-    message: Message, state: FSMContext, user: CachedUser
+    message: Message, state: FSMContext, user: CachedUser, session: AsyncSession
 ) -> None:
-    usecase = GetUserUsecase()
-    db_user: User = await usecase.execute(user.id)  # type: ignore
+    usecase = GetBalanceUsecase(session)
+    balance = await usecase.execute(user.id)
 
     currency = Currency(user.currency_id).name
-    text = f"🏦 Your current balance: {currency} {db_user.balance}"
+    text = f"🏦 Your current balance: {currency} {balance}"
     await send_main_menu(message, state, text=text)
 
 
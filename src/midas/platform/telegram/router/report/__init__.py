@@ -0,0 +1,9 @@
+from aiogram import Router
+
+from .pagination_handler import router as pagination_router
+from .period_report_handler import router as period_report_router
+
+router = Router(name=__name__)
+router.include_routers(pagination_router, period_report_router)
+
+__all__ = ("router",)
@@ -0,0 +1,87 @@
+from datetime import date
+from typing import Any, Callable, override
+from aiogram import F, Router, html
+from aiogram.filters import Command
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery
+
+from midas.db.schemas.report import Report
+from midas.usecase.report import GetReportsUsecase
+from midas.util.enums import Currency, TransactionType
+
+from midas.platform.telegram.keyboard.inline.report import (
+    Command as PaginationCommand,
+    ReportPaginationCommand,
+    get_report_pagination_inline_keyboard,
+)
+from midas.platform.telegram.state.report import ReportPaginationState
+from midas.platform.telegram.util.menu.options import MainMenuOption
+from midas.platform.telegram.util.rendering import Pager
+
+router = Router(name=__name__)
+
+
+class ReportPager(Pager[Report]):
+    @override
+    def _render_item(self, item: Report, currency: Currency) -> str:
+        month = item.period.strftime("%B %Y")  # December 2025
+        accounts = "\n".join(
+            f"- {TransactionType[name.upper()].readable()}: {currency.name} {value}"
+            for name, value in item.accounts.items()
+            if name != TransactionType.INCOME.name.lower()
+        )
+
+        text = (
+            f"{html.bold("MONTHLY REPORT")}\n"
+            f"📅 {month}\n"
+            f"{accounts}\n"
+            f"💰 Overall monthly balance: {currency.name} {item.result}"
+        )
+        return text
+
+    @override
+    def _get_cursor(self, item: Report) -> date:
+        return item.period
+
+    @override
+    async def handle_edit_callback_query(
+        self, query: CallbackQuery, state: FSMContext
+    ) -> None:
+        # reports have no edit button
+        await query.answer("Reports can't be edited.")
+
+    @override
+    def _handler_rules(self) -> list[Callable[..., Any]]:
+        return [
+            # /reports command
+            lambda r: r.message(Command("reports"))(
+                self.handle_init_pagination_command
+            ),
+            lambda r: r.message(F.text == MainMenuOption.REPORTS)(
+                self.handle_init_pagination_command
+            ),
+            # next button
+            lambda r: r.callback_query(
+                ReportPaginationCommand.filter(F.command == PaginationCommand.NEXT),
+                self.states_group.show,
+            )(self.handle_next_callback_query),
+            # prev button
+            lambda r: r.callback_query(
+                ReportPaginationCommand.filter(F.command == PaginationCommand.PREV),
+                self.states_group.show,
+            )(self.handle_prev_callback_query),
+            # exit button
+            lambda r: r.callback_query(
+                ReportPaginationCommand.filter(F.command == PaginationCommand.EXIT),
+                self.states_group.show,
+            )(self.handle_exit_callback_query),
+        ]
+
+
+pager = ReportPager(
+    GetReportsUsecase,
+    None,
+    get_report_pagination_inline_keyboard(),
+    ReportPaginationState,
+)
+pager.register_handlers(router)
@@ -0,0 +1,59 @@
+from aiogram import Router, html
+from aiogram.filters import Command, CommandObject
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import aiogram_logger
+from midas.service.user_caching import CachedUser
+
+from midas.usecase.report import GetPeriodReportUsecase, PeriodReport
+from midas.util.enums import Currency
+
+from midas.platform.telegram.util.menu.events import send_main_menu
+from midas.platform.telegram.validator.report import DATE_FORMAT, validate_date_range
+
+router = Router(name=__name__)
+
+
+def render_period_report(report: PeriodReport, currency: Currency) -> str:
+    start = report.start.strftime(DATE_FORMAT)
+    end = report.end.strftime(DATE_FORMAT)
+    totals = "\n".join(
+        f"- {ttype.readable()}: {currency.name} {total}"
+        for ttype, total in report.totals.items()
+        if total != 0
+    )
+
+    text = (
+        f"{html.bold("REPORT")}\n"
+        f"📅 {start} - {end}\n"
+        f"{totals or html.italic("No transactions in this period")}\n"
+        f"💰 Overall balance: {currency.name} {report.result}"
+    )
+    return text
+
+
+@router.message(Command("report"))
+async def handle_report_command(
+    message: Message,
+    command: CommandObject,
+    state: FSMContext,
+    user: CachedUser,
+    session: AsyncSession,
+) -> None:
+    try:
+        start, end = validate_date_range(command.args or "")
+    except ValueError:
+        await message.answer(
+            "Please, specify the first and the last day of the period, "
+            "e.g. /report 01/01/2025 31/03/2025"
+        )
+        return
+
+    aiogram_logger.info(f"Received period report command: {user.id} - {start} - {end}")
+    usecase = GetPeriodReportUsecase(session)
+    report = await usecase.execute(user.id, start, end)
+
+    text = render_period_report(report, Currency(user.currency_id))
+    await send_main_menu(message, state, text=text)
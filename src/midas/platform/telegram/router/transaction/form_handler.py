@@ -4,6 +4,7 @@ from aiogram import F, Router, html
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message, ReplyKeyboardRemove
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
 from midas.service.user_caching import CachedUser
@@ -27,12 +28,14 @@ from midas.platform.telegram.util.menu.options import TransactionsMenuOption
 router = Router(name=__name__)
 
 
-async def create_transaction(message: Message, state: FSMContext) -> None:
+async def create_transaction(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = {k: v for k, v in (await state.get_data()).items() if k not in ("mode")}
     await state.clear()
 
     try:
-        usecase = CreateTransactionUsecase()
+        usecase = CreateTransactionUsecase(session)
         await usecase.execute(**data)
         await send_transactions_menu(message, state, "👍", set_state=True)
     except Exception:
@@ -43,7 +46,9 @@ async def create_transaction(message: Message, state: FSMContext) -> None:
         )
 
 
-async def edit_transaction(message: Message, state: FSMContext) -> None:
+async def edit_transaction(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = {
         k: v
         for k, v in (await state.get_data()).items()
@@ -52,7 +57,7 @@ async def edit_transaction(message: Message, state: FSMContext) -> None:
     await state.clear()
 
     try:
-        usecase = EditTransactionUsecase()
+        usecase = EditTransactionUsecase(session)
         await usecase.execute(**data)
         await send_transactions_menu(message, state, "👍", set_state=True)
     except NoChangesDetectedException:
@@ -182,7 +187,10 @@ async def handle_invalid_description(message: Message) -> None:
 @router.message(TransactionForm.amount, amount_filter)
 @router.message(TransactionForm.amount, F.text == SkipAnswer.SKIP)
 async def handle_valid_amount(
-    message: Message, state: FSMContext, amount: Optional[Decimal] = None
+    message: Message,
+    state: FSMContext,
+    session: AsyncSession,
+    amount: Optional[Decimal] = None,
 ) -> None:
     mode: FormMode = await state.get_value("mode")  # type: ignore
     if await skipped_unskippable(message, mode, amount):
@@ -193,7 +201,7 @@ async def handle_valid_amount(
             f"Confirm transaction creation: {await state.get_value("user_id")}"
         )
         await state.update_data(amount=amount)
-        await create_transaction(message, state)
+        await create_transaction(message, state, session)
     else:
         aiogram_logger.info(
             f"Confirm transaction editing: {await state.get_value("user_id")}"
@@ -205,7 +213,7 @@ async def handle_valid_amount(
         transaction: Transaction = await state.get_value("transaction")  # type: ignore
         await state.update_data(id=transaction.id)
 
-        await edit_transaction(message, state)
+        await edit_transaction(message, state, session)
 
 
 @router.message(TransactionForm.amount)
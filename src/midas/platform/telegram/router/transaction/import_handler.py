@@ -0,0 +1,100 @@
+from io import TextIOWrapper
+from tempfile import TemporaryFile
+from aiogram import F, Router, html
+from aiogram.filters import Command
+from aiogram.fsm.context import FSMContext
+from aiogram.types import Message, ReplyKeyboardRemove
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import aiogram_logger
+from midas.service.user_caching import CachedUser
+
+from midas.usecase.transaction import ImportResult, ImportTransactionsUsecase
+
+from midas.platform.telegram.state.transaction import TransactionImportForm
+from midas.platform.telegram.util.menu.events import remove_menu, send_transactions_menu
+from midas.platform.telegram.util.menu.options import TransactionsMenuOption
+
+router = Router(name=__name__)
+
+# bots can't download files larger than 20 MB
+MAX_STATEMENT_SIZE = 20 * 1024 * 1024
+
+
+def render_import_result(result: ImportResult) -> str:
+    text = (
+        f"Imported {result.imported} transactions.\n"
+        f"Skipped {result.duplicates} transactions imported before."
+    )
+    if result.invalid > 0:
+        lines = ", ".join(str(line) for line in result.invalid_lines)
+        more = "…" if result.invalid > len(result.invalid_lines) else ""
+        text += f"\nSkipped {result.invalid} invalid rows (lines {lines}{more})."
+    return text
+
+
+@router.message(Command("import_transactions"))
+@router.message(F.text == TransactionsMenuOption.IMPORT)
+async def handle_import_transactions_command(
+    message: Message, state: FSMContext, user: CachedUser
+) -> None:
+    aiogram_logger.info(f"Received `/import_transactions` command: {user.id}")
+
+    await remove_menu(message, state)
+    await state.set_state(TransactionImportForm.statement)
+    await message.answer(
+        "Send the bank statement as a CSV file with <code>date</code>, "
+        "<code>type</code>, <code>title</code>, <code>amount</code> and optional "
+        "<code>description</code> columns. Dates are written as YYYY-MM-DD or "
+        "DD/MM/YYYY.\n"
+        "Rows imported before are skipped.",
+        reply_markup=ReplyKeyboardRemove(),
+    )
+
+
+@router.message(TransactionImportForm.statement, F.document)
+async def handle_statement(
+    message: Message, state: FSMContext, user: CachedUser, session: AsyncSession
+) -> None:
+    document = message.document
+    assert document is not None and message.bot is not None
+
+    if document.file_size is not None and document.file_size > MAX_STATEMENT_SIZE:
+        await message.answer("The file must be at most 20 MB.")
+        return
+
+    aiogram_logger.info(f"Importing bank statement: {user.id} - {document.file_name}")
+    await state.clear()
+
+    # the file is spooled to disk and read line by line, so it is never
+    # held in memory at once
+    with TemporaryFile() as file:
+        await message.bot.download(document, destination=file)
+        file.seek(0)
+
+        try:
+            lines = TextIOWrapper(file, encoding="utf-8-sig", newline="")
+            usecase = ImportTransactionsUsecase(session)
+            result = await usecase.execute(user.id, lines)
+        except ValueError as e:
+            await send_transactions_menu(
+                message, state, f"Failed. {html.quote(str(e))}", set_state=True
+            )
+            return
+        except Exception:
+            aiogram_logger.error(
+                f"Bank statement import failed: {user.id}", exc_info=True
+            )
+            await send_transactions_menu(
+                message, state, "Failed. Something went wrong.", set_state=True
+            )
+            return
+
+    await send_transactions_menu(
+        message, state, render_import_result(result), set_state=True
+    )
+
+
+@router.message(TransactionImportForm.statement)
+async def handle_invalid_statement(message: Message) -> None:
+    await message.answer("Please, send the bank statement as a CSV file.")
@@ -1,8 +1,11 @@
+from datetime import datetime
 from typing import Any, Callable, override
+from uuid import UUID
 from aiogram import F, Router, html
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
 from aiogram.types import CallbackQuery
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
 from midas.service.user_caching import CachedUser
@@ -46,6 +49,15 @@ class TransactionPager(Pager[Transaction]):
         )
         return text
 
+    @override
+    def _get_cursor(self, item: Transaction) -> tuple[datetime, UUID]:
+        return item.created_at, item.id
+
+    @override
+    async def _delete_item(self, session: AsyncSession, item: Transaction) -> None:
+        # the loaded transaction bounds the delete to its partition
+        await self.delete_usecase(session).execute(item)
+
     @override
     async def handle_edit_callback_query(
         self, query: CallbackQuery, state: FSMContext
@@ -134,8 +146,8 @@ class TransactionPager(Pager[Transaction]):
 
 
 pager = TransactionPager(
-    GetTransactionsUsecase(),
-    DeleteTransactionUsecase(),
+    GetTransactionsUsecase,
+    DeleteTransactionUsecase,
     get_transaction_pagination_inline_keyboard(),
     TransactionPaginationState,
 )
@@ -2,6 +2,7 @@ from aiogram import Router, F
 from aiogram.types import Message, ReplyKeyboardRemove
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
 from midas.service.user_caching import CachedUser
@@ -47,7 +48,9 @@ async def handle_reject_profile_deletion(message: Message, state: FSMContext) ->
 
 
 @router.message(ConfirmForm.confirm, F.text == YesNoAnswer.YES)
-async def handle_confirm_profile_deletion(message: Message, state: FSMContext) -> None:
+async def handle_confirm_profile_deletion(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = await state.get_data()
     user_id: int = data["user_id"]
 
@@ -58,7 +61,7 @@ async def handle_confirm_profile_deletion(message: Message, state: FSMContext) -
         if await user_storage.exists(user_id):
             await user_storage.delete(user_id)
 
-        usecase = DeleteUserUsecase()
+        usecase = DeleteUserUsecase(session)
         await usecase.execute(user_id)
         await message.answer(
             "Your profile has been deleted 😭", reply_markup=ReplyKeyboardRemove()
@@ -3,13 +3,17 @@ from aiogram import F, Router
 from aiogram.types import Message, ReplyKeyboardRemove
 from aiogram.filters import Command
 from aiogram.fsm.context import FSMContext
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
 from midas.service.user_caching import CachedUser
 
 from midas.usecase.user import RegisterUserUsecase, EditUserUsecase
 from midas.util.enums import Currency
-from midas.util.errors import NoChangesDetectedException
+from midas.util.errors import (
+    NoChangesDetectedException,
+    UserDeletionPendingException,
+)
 
 from midas.platform.telegram.validator import SkipAnswer, YesNoAnswer
 from midas.platform.telegram.validator.currency import valid_currency_filter
@@ -25,11 +29,13 @@ from midas.platform.telegram.util.menu.options import ProfileMenuOption
 router = Router(name=__name__)
 
 
-async def register_user(message: Message, state: FSMContext) -> None:
+async def register_user(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = {k: v for k, v in (await state.get_data()).items() if k not in ("mode")}
 
     try:
-        usecase = RegisterUserUsecase()
+        usecase = RegisterUserUsecase(session)
         await usecase.execute(**data)
         await send_main_menu(message, state, "You've been successfully registered 🥳")
     except KeyError:
@@ -41,13 +47,21 @@ async def register_user(message: Message, state: FSMContext) -> None:
         await message.answer(
             "You're already registered 🚫", reply_markup=ReplyKeyboardRemove()
         )
+    except UserDeletionPendingException:
+        await message.answer(
+            "Your previous profile is still being deleted ⏳\n"
+            "Please, try again in a few minutes.",
+            reply_markup=ReplyKeyboardRemove(),
+        )
 
 
-async def edit_user(message: Message, state: FSMContext) -> None:
+async def edit_user(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     data = {k: v for k, v in (await state.get_data()).items() if k not in ("mode")}
 
     try:
-        usecase = EditUserUsecase()
+        usecase = EditUserUsecase(session)
         await usecase.execute(**data)
         await send_main_menu(message, state, f"Successfully edited profile.")
     except NoChangesDetectedException:
@@ -96,7 +110,10 @@ async def handle_edit_profile_command(
 @router.message(UserForm.currency, valid_currency_filter)
 @router.message(UserForm.currency, F.text == SkipAnswer.SKIP)
 async def handle_currency(
-    message: Message, state: FSMContext, currency: Optional[Currency] = None
+    message: Message,
+    state: FSMContext,
+    session: AsyncSession,
+    currency: Optional[Currency] = None,
 ) -> None:
     mode: FormMode = await state.get_value("mode")  # type: ignore
     if await skipped_unskippable(
@@ -109,7 +126,7 @@ async def handle_currency(
         aiogram_logger.info(
             f"Confirmed registration: {await state.get_value("user_id")}"
         )
-        await register_user(message, state)
+        await register_user(message, state, session)
     else:
         if currency is not None and message.text != SkipAnswer.SKIP:
             await state.update_data(currency=currency)
@@ -132,7 +149,9 @@ async def handle_invalid_currency(message: Message, state: FSMContext) -> None:
 
 @router.message(UserForm.notifications, F.text == YesNoAnswer.YES)
 @router.message(UserForm.notifications, F.text == YesNoAnswer.NO)
-async def handle_notifications(message: Message, state: FSMContext) -> None:
+async def handle_notifications(
+    message: Message, state: FSMContext, session: AsyncSession
+) -> None:
     mode = await state.get_value("mode")
 
     if mode == FormMode.EDIT:
@@ -142,7 +161,7 @@ async def handle_notifications(message: Message, state: FSMContext) -> None:
         aiogram_logger.info(
             f"Confirmed profile edit: {await state.get_value("user_id")}"
         )
-        await edit_user(message, state)
+        await edit_user(message, state, session)
 
 
 @router.message(UserForm.notifications)
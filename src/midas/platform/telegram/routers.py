@@ -2,15 +2,26 @@ from aiogram import Dispatcher
 
 from midas.platform.telegram.handlers import (
     start_event_handling,
+    start_journal_compaction,
+    start_metrics_endpoint,
     start_monthly_reporting,
+    start_notifier,
+    start_outbox_dispatching,
+    start_partition_maintenance,
+    start_pool_monitoring,
+    start_replica_monitoring,
+    start_scheduler,
+    start_user_purging,
+    stop_notifier,
 )
 
 from .router import router as global_router
 from .router.user import router as user_router
 from .router.transaction import router as transaction_router
 from .router.event import router as event_router
+from .router.report import router as report_router
 from .router.menu import router as menu_router
-from .middleware import AuthMiddleware
+from .middleware import AuthMiddleware, SessionMiddleware
 
 # Global dispatcher (Router) object.
 # Attach new routers to it as needed.
@@ -18,14 +29,33 @@ dp = Dispatcher()
 
 # register coroutines to be attached to the main loop
 # of aiogram
+dp.startup.register(start_notifier)
+dp.startup.register(start_outbox_dispatching)
+dp.startup.register(start_metrics_endpoint)
+dp.startup.register(start_pool_monitoring)
+dp.startup.register(start_replica_monitoring)
 dp.startup.register(start_event_handling)
 dp.startup.register(start_monthly_reporting)
+dp.startup.register(start_partition_maintenance)
+dp.startup.register(start_user_purging)
+dp.startup.register(start_journal_compaction)
+dp.startup.register(start_scheduler)
+# deliver the messages left in the notifier queue before exiting
+dp.shutdown.register(stop_notifier)
 
+# every update gets its own database session before any other middleware runs.
+# The session connects lazily, so updates that don't use it cost nothing.
+dp.update.outer_middleware(SessionMiddleware())
 for middleware in [AuthMiddleware()]:
     dp.message.middleware(middleware)
 
 # turns out the order of routers matters, so menu router is the last one to be
 # triggered, so it doesn't steal events from other routers
 dp.include_routers(
-    global_router, user_router, transaction_router, event_router, menu_router
+    global_router,
+    user_router,
+    transaction_router,
+    event_router,
+    report_router,
+    menu_router,
 )
@@ -1,14 +1,55 @@
-from typing import override
+from os import getenv
+from typing import Optional, override
 from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
 
-from midas.service.abstract_notifier import AbstractNotifier
+from midas.loggers import aiogram_logger
 
+from midas.service.queued_notifier import QueuedNotifier
+
+
+class TelegramNotifier(QueuedNotifier):
+    """
+    Telegram notifier. Messages are delivered by the `QueuedNotifier`
+    workers, which by default keep under the Telegram limits of ~30
+    messages per second overall and one message per second per chat.
+
+    The overall limit is shared by all processes sending messages with
+    the same bot, set `NOTIFIER_PROCESSES` to their number. A flood wait
+    returned by Telegram pauses all workers of the process.
+    """
 
-class TelegramNotifier(AbstractNotifier):
     @override
-    def __init__(self, bot: Bot) -> None:
+    def __init__(self, bot: Bot, **kwargs) -> None:
+        kwargs.setdefault("processes", int(getenv("NOTIFIER_PROCESSES", "1")))
+        super().__init__(**kwargs)
         self.bot = bot
 
     @override
-    async def notify(self, user_id: int, msg: str) -> None:
+    async def _send(self, user_id: int, msg: str) -> None:
         await self.bot.send_message(user_id, msg)
+
+    @override
+    def _get_pause(self, error: Exception) -> Optional[float]:
+        if isinstance(error, TelegramRetryAfter):
+            return error.retry_after
+        return None
+
+    @override
+    def _get_retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        if isinstance(error, TelegramRetryAfter):
+            return error.retry_after
+        if isinstance(error, (TelegramNetworkError, TelegramServerError)):
+            return 2 ** (attempt - 1)
+        if isinstance(error, TelegramAPIError):
+            # blocked bot, deleted chat, etc. Retrying doesn't help.
+            aiogram_logger.warning(f"Couldn't notify {error.method}: {error.message}")
+            return None
+
+        aiogram_logger.error("Unexpected notification error", exc_info=error)
+        return None
@@ -0,0 +1,8 @@
+from aiogram.fsm.state import State
+
+from midas.platform.telegram.util.rendering import PagerStatesGroup
+
+
+class ReportPaginationState(PagerStatesGroup):
+    # reports can't be deleted, the inherited `confirm_delete` is never set
+    show = State()
@@ -14,6 +14,14 @@ class TransactionForm(StatesGroup):
     amount = State()
 
 
+class TransactionImportForm(StatesGroup):
+    """
+    Bank statement import form.
+    """
+
+    statement = State()
+
+
 class TransactionPaginationState(PagerStatesGroup):
     show = State()
     confirm_delete = State()
@@ -6,6 +6,7 @@ class MainMenuOption(StrEnum):
     TRANSACTIONS = "🗂 Transactions"
     EVENTS = "🗓️ Events"
     BALANCE = "🏦 See my balance"
+    REPORTS = "📊 Monthly reports"
 
 
 class BackOption(StrEnum):
@@ -24,6 +25,7 @@ class ProfileMenuOption(StrEnum):
 class TransactionsMenuOption(StrEnum):
     ADD = "✏️ Add new transaction"
     VIEW = "👀 View transactions"
+    IMPORT = "📥 Import bank statement"
 
 
 class EventMenuOption(StrEnum):
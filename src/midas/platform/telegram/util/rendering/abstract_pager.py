@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 from aiogram import Router
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -9,6 +9,7 @@ from aiogram.types import (
     InlineKeyboardMarkup,
     Message,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
 from midas.service.user_caching import CachedUser
@@ -35,18 +36,22 @@ class AbstractPager[T: Any](ABC):
 
     def __init__(
         self,
-        get_usecase: AbstractUsecase,
-        delete_usecase: AbstractUsecase,
+        get_usecase: type[AbstractUsecase],
+        delete_usecase: Optional[type[AbstractUsecase]],
         markup: InlineKeyboardMarkup,
         states_group: type[PagerStatesGroup],
     ) -> None:
         """
         Instantiate a new pager.
 
-        :param get_usecase: get usecase for the `T` type
-        :type get_usecase: AbstractUsecase
-        :param delete_usecase: delete usecase for the `T` type
-        :type delete_usecase: AbstractUsecase
+        The usecases are instantiated for every update with the session
+        opened for it, so concurrent updates never share a session.
+
+        :param get_usecase: get usecase class for the `T` type
+        :type get_usecase: type[AbstractUsecase]
+        :param delete_usecase: delete usecase class for the `T` type,
+        `None` if the items can't be deleted
+        :type delete_usecase: Optional[type[AbstractUsecase]]
         :param markup: telegram inline keyboard to attach to each page
         :type markup: InlineKeyboardMarkup
         :param states_group: `PagerStatesGroup` type defined for the exact pager.
@@ -133,7 +138,11 @@ class AbstractPager[T: Any](ABC):
 
     @abstractmethod
     async def handle_init_pagination_command(
-        self, message: Message, state: FSMContext, user: CachedUser
+        self,
+        message: Message,
+        state: FSMContext,
+        user: CachedUser,
+        session: AsyncSession,
     ) -> None:
         """
         Aiogram handler for `/items` command.
@@ -142,7 +151,7 @@ class AbstractPager[T: Any](ABC):
 
     @abstractmethod
     async def handle_next_callback_query(
-        self, query: CallbackQuery, state: FSMContext
+        self, query: CallbackQuery, state: FSMContext, session: AsyncSession
     ) -> None:
         """
         Aiogram handler for next command inside pagination.
@@ -151,7 +160,7 @@ class AbstractPager[T: Any](ABC):
 
     @abstractmethod
     async def handle_prev_callback_query(
-        self, query: CallbackQuery, state: FSMContext
+        self, query: CallbackQuery, state: FSMContext, session: AsyncSession
     ) -> None:
         """
         Aiogram handler for previous command inside pagination.
@@ -168,7 +177,9 @@ class AbstractPager[T: Any](ABC):
         pass
 
     @abstractmethod
-    async def handle_confirm_delete(self, message: Message, state: FSMContext) -> None:
+    async def handle_confirm_delete(
+        self, message: Message, state: FSMContext, session: AsyncSession
+    ) -> None:
         """
         Aiogram handler for confirming deletion command inside pagination.
         """
@@ -1,5 +1,5 @@
-from abc import ABC
-from typing import Any, override
+from abc import ABC, abstractmethod
+from typing import Any, Optional, override
 from aiogram.fsm.context import FSMContext
 from aiogram.types import (
     CallbackQuery,
@@ -7,6 +7,7 @@ from aiogram.types import (
     Message,
     ReplyKeyboardRemove,
 )
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import aiogram_logger
 from midas.service.user_caching import CachedUser
@@ -27,9 +28,16 @@ class Pager[T: Any](AbstractPager[T], ABC):
     Added abstraction layer above `AbstractPager`. This class contains basic
     algorithms for generic pagination routines.
 
-    Please, consider that `render_item()`, `handle_edit_callback_query()`, and
-    `_handler_rules()` methods need to be overriden in the concrete pager
-    implementation.
+    The items are fetched in fixed-size pages with keyset pagination: the
+    pager only keeps the current page and the cursors the seen pages start
+    after, so moving to another page costs one constant-size query.
+
+    Please, consider that `render_item()`, `handle_edit_callback_query()`,
+    `_get_cursor()` and `_handler_rules()` methods need to be overriden in
+    the concrete pager implementation. The get usecase must accept the
+    cursor of the last item of the previous page as the `after` argument.
+    Items that can't be deleted are paged with `None` as the delete
+    usecase and a markup without the delete and edit buttons.
 
     Once the concrete pager is implemented, bind a router to it via instantiating
     the class first, and then calling `register_handlers()` method by suppling
@@ -39,23 +47,51 @@ class Pager[T: Any](AbstractPager[T], ABC):
     @override
     def __init__(
         self,
-        get_usecase: AbstractUsecase,
-        delete_usecase: AbstractUsecase,
+        get_usecase: type[AbstractUsecase],
+        delete_usecase: Optional[type[AbstractUsecase]],
         markup: InlineKeyboardMarkup,
         states_group: type[PagerStatesGroup],
     ) -> None:
         super().__init__(get_usecase, delete_usecase, markup, states_group)
-        self._INITIAL_FETCH_COUNT = 16
+        self._PAGE_SIZE = 16
+
+    @abstractmethod
+    def _get_cursor(self, item: T) -> Any:
+        """
+        Get the keyset cursor of the item, i.e. the values of the columns
+        the get usecase orders the items by.
+
+        :return: cursor passed as `after` to get the items following `item`
+        :rtype: Any
+        """
+        pass
+
+    async def _fetch_page(
+        self, session: AsyncSession, user_id: int, after: Any
+    ) -> list[T]:
+        usecase = self.get_usecase(session)
+        return list(await usecase.execute(user_id, self._PAGE_SIZE, after=after))
+
+    async def _delete_item(self, session: AsyncSession, item: T) -> None:
+        """
+        Delete the item with the delete usecase. By default the usecase is
+        passed the item's id, override this method to pass more.
+        """
+        assert self.delete_usecase is not None, "the items can't be deleted"
+        await self.delete_usecase(session).execute(getattr(item, "id"))
 
     @override
     async def handle_init_pagination_command(
-        self, message: Message, state: FSMContext, user: CachedUser
+        self,
+        message: Message,
+        state: FSMContext,
+        user: CachedUser,
+        session: AsyncSession,
     ) -> None:
         aiogram_logger.info(f"Received init pagination command: {self=}")
 
         current = 0
-        max_items = self._INITIAL_FETCH_COUNT
-        items: list[T] = await self.get_usecase.execute(user.id, max_items)
+        items = await self._fetch_page(session, user.id, None)
 
         if len(items) == 0:
             await state.clear()
@@ -63,9 +99,8 @@ class Pager[T: Any](AbstractPager[T], ABC):
             return
 
         await remove_menu(message, state)
-        await state.update_data(
-            user=user, items=items, current=current, max_items=max_items
-        )
+        # `cursors[-1]` is the cursor the current page starts after
+        await state.update_data(user=user, items=items, current=current, cursors=[None])
         await state.set_state(self.states_group.show)
 
         item = items[current]
@@ -74,25 +109,25 @@ class Pager[T: Any](AbstractPager[T], ABC):
 
     @override
     async def handle_next_callback_query(
-        self, query: CallbackQuery, state: FSMContext
+        self, query: CallbackQuery, state: FSMContext, session: AsyncSession
     ) -> None:
         data = await state.get_data()
         user: CachedUser = data["user"]
         current: int = data["current"]
-        max_items: int = data["max_items"]
         items: list[T] = data["items"]
+        cursors: list[Any] = data["cursors"]
 
         current += 1
         if current >= len(items):
-            max_items *= 2
-            items = await self.get_usecase.execute(user.id, max_items)
-            # if after refetch the initial condition is still met, there are
-            # no new items to display.
-            if current >= len(items):
+            cursor = self._get_cursor(items[-1])
+            page = await self._fetch_page(session, user.id, cursor)
+            if len(page) == 0:
                 await query.answer("No more items available.")
                 return
 
-            await state.update_data(max_items=max_items, items=items)
+            items, current = page, 0
+            cursors.append(cursor)
+            await state.update_data(items=items, cursors=cursors)
         await state.update_data(current=current)
 
         item = items[current]
@@ -100,16 +135,23 @@ class Pager[T: Any](AbstractPager[T], ABC):
 
     @override
     async def handle_prev_callback_query(
-        self, query: CallbackQuery, state: FSMContext
+        self, query: CallbackQuery, state: FSMContext, session: AsyncSession
     ) -> None:
         data = await state.get_data()
         user: CachedUser = data["user"]
         current: int = data["current"]
         items: list[T] = data["items"]
+        cursors: list[Any] = data["cursors"]
 
         if current == 0:
-            await query.answer("Already at the first item.")
-            return
+            if len(cursors) == 1:
+                await query.answer("Already at the first item.")
+                return
+
+            cursors.pop()
+            items = await self._fetch_page(session, user.id, cursors[-1])
+            current = len(items)
+            await state.update_data(items=items, cursors=cursors)
 
         current -= 1
         await state.update_data(current=current)
@@ -135,24 +177,36 @@ class Pager[T: Any](AbstractPager[T], ABC):
         )
 
     @override
-    async def handle_confirm_delete(self, message: Message, state: FSMContext) -> None:
+    async def handle_confirm_delete(
+        self, message: Message, state: FSMContext, session: AsyncSession
+    ) -> None:
         data = await state.get_data()
         user: CachedUser = data["user"]
         current: int = data["current"]
         items: list[T] = data["items"]
+        cursors: list[Any] = data["cursors"]
         deleted_item = items[current]
 
         aiogram_logger.info(f"Received item delete command: {user.id} - {deleted_item}")
-        await self.delete_usecase.execute(getattr(deleted_item, "id"))
+        await self._delete_item(session, deleted_item)
+
+        items.pop(current)
+        current -= 1 if current != 0 else 0
+        # the page got empty, refill it with the following items or go back
+        # to the previous page
+        if len(items) == 0:
+            items = await self._fetch_page(session, user.id, cursors[-1])
+        while len(items) == 0 and len(cursors) > 1:
+            cursors.pop()
+            items = await self._fetch_page(session, user.id, cursors[-1])
+            current = len(items) - 1
 
-        if len(items) == 1:
+        if len(items) == 0:
             await state.clear()
             await send_main_menu(message, state, "Nothing to display ☹️")
             return
 
-        items.pop(current)
-        current -= 1 if current != 0 else 0
-        await state.update_data(current=current, items=items)
+        await state.update_data(current=current, items=items, cursors=cursors)
         await state.set_state(self.states_group.show)
         await message.answer("👍", reply_markup=ReplyKeyboardRemove())
 
@@ -0,0 +1,22 @@
+from datetime import date, datetime
+
+DATE_FORMAT = "%d/%m/%Y"  # 25/12/2025
+
+
+def validate_date_range(text: str) -> tuple[date, date]:
+    """
+    Check if text is a pair of dates in `DATE_FORMAT` separated by
+    whitespace, the first one not after the second one.
+
+    :return: first and last day of the range
+    :rtype: tuple[date, date]
+    :raise ValueError: if text is not a valid date range
+    """
+    parts = text.split()
+    if len(parts) != 2:
+        raise ValueError(f"`{text}` is not a pair of dates")
+
+    start, end = (datetime.strptime(part, DATE_FORMAT).date() for part in parts)
+    if start > end:
+        raise ValueError(f"`{text}` starts after it ends")
+    return start, end
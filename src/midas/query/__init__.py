@@ -1,5 +1,10 @@
 from .generic_repository import GenericRepository
-from .session import create_session
+from .session import create_session, route_read_only, session_factory
 
 
-__all__ = ("create_session", "GenericRepository")
+__all__ = (
+    "create_session",
+    "route_read_only",
+    "session_factory",
+    "GenericRepository",
+)
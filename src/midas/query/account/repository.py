@@ -1,15 +1,23 @@
-from typing import Optional, Sequence, override
-from sqlalchemy import delete, select
+from typing import Iterable, Optional, Sequence, override
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.db.schemas.account import Account
-from midas.db.schemas.user import User
 from midas.query.interface.eager_loadable import EagerLoadable
 from midas.query.interface.purgeable import Purgeable
 from midas.query import GenericRepository
 from midas.util.enums import TransactionType
 
+_GET_BY_TRANSACTION_TYPE = (
+    select(Account)
+    .where(Account.user_id == bindparam("user_id"))
+    .where(Account.transaction_type_id == bindparam("transaction_type"))
+)
+_GET_BY_TRANSACTION_TYPE_EAGER = _GET_BY_TRANSACTION_TYPE.options(
+    selectinload(Account.user)
+)
+
 
 class AccountRepository(
     GenericRepository[Account, int],
@@ -62,14 +70,18 @@ class AccountRepository(
         return await super().get_by_id(id)
 
     @override
-    async def purge_by_user_id(self, user_id: int) -> None:
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
         """
         DELETE all rows where `accounts.user_id` = `user_id`.
 
         :param user_id: user's telegram id
         :type user_id: int
+        :param limit: maximal number of rows to delete, `None` deletes all.
+        :type limit: Optional[int]
+        :return: number of deleted rows
+        :rtype: int
         """
-        await self._session.execute(delete(Account).where(Account.user_id == user_id))
+        return await self.delete_where(Account.user_id == user_id, limit)
 
     async def get_user_account_by_transaction_type(
         self, user_id: int, transaction_type: TransactionType, eager: bool = False
@@ -91,15 +103,9 @@ class AccountRepository(
         :return: user's account or `None` if user doesn't exist
         :rtype: Optional[Account]
         """
-        stmt = (
-            select(Account)
-            .where(Account.user_id == user_id)
-            .where(Account.transaction_type_id == transaction_type)
-        )
-        if eager:
-            stmt = stmt.options(selectinload(Account.user))
-
-        return (await self._session.scalars(stmt)).one_or_none()
+        stmt = _GET_BY_TRANSACTION_TYPE_EAGER if eager else _GET_BY_TRANSACTION_TYPE
+        params = {"user_id": user_id, "transaction_type": transaction_type}
+        return (await self._session.scalars(stmt, params)).one_or_none()
 
     async def get_all_by_user_id(
         self, user_id: int, eager: bool = False
@@ -120,3 +126,21 @@ class AccountRepository(
             stmt = stmt.options(selectinload(Account.user))
 
         return (await self._session.scalars(stmt)).fetchall()
+
+    async def get_ids_by_user_ids(
+        self, user_ids: Iterable[int]
+    ) -> dict[tuple[int, int], int]:
+        """
+        SELECT account ids of all users in `user_ids`.
+
+        :param user_ids: users' telegram ids
+        :type user_ids: Iterable[int]
+        :return: mapping of `(user_id, transaction_type_id)` pairs to the
+        account id.
+        :rtype: dict[tuple[int, int], int]
+        """
+        stmt = select(Account.id, Account.user_id, Account.transaction_type_id).where(
+            Account.user_id.in_(set(user_ids))
+        )
+        rows = (await self._session.execute(stmt)).all()
+        return {(row.user_id, row.transaction_type_id): row.id for row in rows}
@@ -0,0 +1,3 @@
+from .repository import AccountPeriodRepository
+
+__all__ = ("AccountPeriodRepository",)
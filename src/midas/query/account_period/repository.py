@@ -0,0 +1,221 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, AsyncIterator, Mapping, Optional, Sequence, override
+from sqlalchemy import (
+    Numeric,
+    Row,
+    and_,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.account import Account
+from midas.db.schemas.account_period import AccountPeriod
+from midas.db.schemas.report import Report
+from midas.db.schemas.transaction import Transaction
+from midas.db.schemas.user import User
+from midas.query import GenericRepository
+from midas.query.interface.purgeable import Purgeable
+from midas.query.util import get_month
+
+type AccountPeriodDeltas = Mapping[tuple[int, date], tuple[Decimal, Decimal]]
+
+
+class AccountPeriodRepository(
+    GenericRepository[AccountPeriod, tuple[int, date]], Purgeable
+):
+    """
+    Account period repository class.
+
+    This class inherits from `GenericRepository` thus has all
+    the features it provides by default. This class is more specific
+    to `account_periods` database table and provides methods to apply
+    the changes of transactions as deltas, to read the balances of
+    accounts in a month and to rebuild the table from `transactions`.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(AccountPeriod, session)
+
+    @override
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
+        return await self.delete_where(
+            AccountPeriod.account_id.in_(
+                select(Account.id).where(Account.user_id == user_id)
+            ),
+            limit,
+        )
+
+    async def apply_deltas(self, deltas: AccountPeriodDeltas) -> None:
+        """
+        Add deltas to the debit and credit amounts of many accounts with
+        a single `INSERT ... ON CONFLICT DO UPDATE`. Missing rows, e.g.
+        the first posting of an account in a month, are created with the
+        delta as their value.
+
+        :param deltas: mapping of `(account_id, period)` to `(debit,
+        credit)` deltas
+        :type deltas: AccountPeriodDeltas
+        """
+        if len(deltas) == 0:
+            return
+
+        values = [
+            {
+                "account_id": account_id,
+                "period": period,
+                "debit_amount": debit,
+                "credit_amount": credit,
+            }
+            for (account_id, period), (debit, credit) in deltas.items()
+        ]
+        dialect = (
+            postgresql if self._session.bind.dialect.name == "postgresql" else sqlite
+        )
+        stmt = dialect.insert(AccountPeriod).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AccountPeriod.account_id, AccountPeriod.period],
+            set_={
+                "debit_amount": AccountPeriod.debit_amount + stmt.excluded.debit_amount,
+                "credit_amount": AccountPeriod.credit_amount
+                + stmt.excluded.credit_amount,
+            },
+        )
+        await self._session.execute(stmt)
+
+    def _select_balances(self, period: date) -> Any:
+        # accounts without postings in the month have no row and a zero
+        # balance
+        return (
+            select(
+                Account.user_id,
+                Account.transaction_type_id,
+                func.coalesce(
+                    AccountPeriod.debit_amount - AccountPeriod.credit_amount,
+                    literal(Decimal("0.00"), Numeric(12, 2)),
+                ).label("balance"),
+            )
+            .select_from(Account)
+            .outerjoin(
+                AccountPeriod,
+                and_(
+                    AccountPeriod.account_id == Account.id,
+                    AccountPeriod.period == period,
+                ),
+            )
+        )
+
+    async def get_balances(self, user_id: int, period: date) -> Sequence[Row[Any]]:
+        """
+        SELECT the balance (`debit_amount` - `credit_amount`) of every
+        account of the user in the month.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param period: first day of the month
+        :type period: date
+        :return: rows with `user_id`, `transaction_type_id` and `balance`
+        columns ordered by transaction type.
+        :rtype: Sequence[Row[Any]]
+        """
+        stmt = (
+            self._select_balances(period)
+            .where(Account.user_id == user_id)
+            .order_by(Account.transaction_type_id)
+        )
+        return (await self._session.execute(stmt)).all()
+
+    async def stream_balances_of_all_users(
+        self,
+        period: date,
+        chunk_size: int = GenericRepository.DEFAULT_CHUNK_SIZE,
+        unreported: bool = False,
+    ) -> AsyncIterator[Row[Any]]:
+        """
+        Stream the balance (`debit_amount` - `credit_amount`) of every
+        account in the month joined with the owner's currency and
+        notification flag. Accounts of users marked deleted are left out.
+        With `unreported` the accounts of users who already have a report
+        of the month are left out too.
+
+        The rows are ordered by `user_id`, so accounts of the same user
+        are adjacent.
+
+        :param period: first day of the month
+        :type period: date
+        :param chunk_size: number of rows fetched at once.
+        :type chunk_size: int
+        :param unreported: skip the users with a stored report of the month
+        :type unreported: bool
+        :return: rows with `user_id`, `transaction_type_id`, `balance`,
+        `currency_id` and `send_notifications` columns.
+        :rtype: AsyncIterator[Row[Any]]
+        """
+        stmt = (
+            self._select_balances(period)
+            .add_columns(User.currency_id, User.send_notifications)
+            .join(User, User.id == Account.user_id)
+            .where(User.deleted_at.is_(None))
+            .order_by(Account.user_id, Account.transaction_type_id)
+        )
+        if unreported:
+            stmt = stmt.where(
+                ~exists().where(Report.user_id == User.id, Report.period == period)
+            )
+        async for row in self.stream_rows(stmt, chunk_size):
+            yield row
+
+    async def rebuild(self) -> int:
+        """
+        Replace the content of the table with the amounts computed from
+        all folded transactions with one `INSERT ... SELECT ... GROUP BY`,
+        see `MonthlyAggregateRepository.rebuild()`.
+
+        :return: number of rows inserted
+        :rtype: int
+        """
+        if self._session.bind.dialect.name == "postgresql":
+            await self._session.execute(text("LOCK TABLE transactions IN SHARE MODE"))
+        await self._session.execute(delete(AccountPeriod))
+
+        period = get_month(Transaction.created_at, self._session.bind.dialect.name)
+        zero = literal(Decimal(), Numeric(12, 2))
+        entries = union_all(
+            select(
+                Transaction.debit_account_id.label("account_id"),
+                period.label("period"),
+                Transaction.amount.label("debit"),
+                zero.label("credit"),
+            ).where(Transaction.folded),
+            select(
+                Transaction.credit_account_id, period, zero, Transaction.amount
+            ).where(Transaction.folded, Transaction.credit_account_id.is_not(None)),
+        ).subquery()
+        rows = select(
+            entries.c.account_id,
+            entries.c.period,
+            func.sum(entries.c.debit),
+            func.sum(entries.c.credit),
+        ).group_by(entries.c.account_id, entries.c.period)
+
+        result = await self._session.execute(
+            insert(AccountPeriod).from_select(
+                [
+                    AccountPeriod.account_id,
+                    AccountPeriod.period,
+                    AccountPeriod.debit_amount,
+                    AccountPeriod.credit_amount,
+                ],
+                rows,
+            )
+        )
+        return result.rowcount  # type: ignore
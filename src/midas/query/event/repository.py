@@ -1,6 +1,6 @@
-from datetime import date
-from typing import Sequence, override
-from sqlalchemy import delete, select
+from datetime import date, timedelta
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional, Sequence, override
+from sqlalchemy import bindparam, case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -9,6 +9,14 @@ from midas.query import GenericRepository
 from midas.query.interface.purgeable import Purgeable
 from midas.query.interface.retrievable_by_user_id import RetrievableByUserId
 
+_GET_BY_USER_ID = (
+    select(Event)
+    .where(Event.user_id == bindparam("user_id"))
+    .order_by(Event.id.desc())
+    .limit(bindparam("count"))
+)
+_GET_BY_USER_ID_AFTER = _GET_BY_USER_ID.where(Event.id < bindparam("after"))
+
 
 class EventRepository(GenericRepository[Event, int], Purgeable, RetrievableByUserId):
     """
@@ -25,38 +33,155 @@ class EventRepository(GenericRepository[Event, int], Purgeable, RetrievableByUse
         super().__init__(Event, session)
 
     @override
-    async def get_by_user_id(self, user_id: int, count: int = 16) -> Sequence[Event]:
+    async def get_by_user_id(
+        self, user_id: int, count: int = 16, after: Optional[int] = None
+    ) -> Sequence[Event]:
         """
-        Get `count` events associated with `user_id` user.
+        Get `count` events associated with `user_id` user, from the newest
+        to the oldest one.
 
         :param user_id: user's telegram id.
         :type user_id: int
         :param count: number of events to get.
         :type count: int
+        :param after: id of the last event of the previous page. `None`
+        starts from the newest event.
+        :type after: Optional[int]
         :return: list of events. Can be empty if `user_id` is invalid.
         :rtype: Sequence[Event]
         """
-        return (
-            await self._session.scalars(
-                select(Event).where(Event.user_id == user_id).order_by(Event.id.desc())
-            )
-        ).fetchmany(count)
+        if after is None:
+            stmt, params = _GET_BY_USER_ID, {"user_id": user_id, "count": count}
+        else:
+            stmt = _GET_BY_USER_ID_AFTER
+            params = {"user_id": user_id, "count": count, "after": after}
+
+        return (await self._session.scalars(stmt, params)).fetchall()
 
     @override
-    async def purge_by_user_id(self, user_id: int) -> None:
-        await self._session.execute(delete(Event).where(Event.user_id == user_id))
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
+        return await self.delete_where(Event.user_id == user_id, limit)
 
-    async def get_upcoming_events(self, eager: bool = False) -> Sequence[Event]:
+    async def get_upcoming_events(
+        self, eager: bool = False, claim: Optional[int] = None
+    ) -> Sequence[Event]:
         """
         Get events with `next_run_on` date set to today or prior.
 
+        In claim mode at most `claim` events are returned and their rows are
+        locked with `FOR UPDATE SKIP LOCKED` until the end of the current
+        transaction. Rows already locked by other transactions are skipped,
+        so concurrent workers claim disjoint sets of events.
+
+        :param eager: load `Event.user` relationship as well.
+        :type eager: bool
+        :param claim: maximal number of events to claim. `None` fetches all
+        due events without locking them.
+        :type claim: Optional[int]
         :return: list of events to execute
         :rtype: Sequence[Event]
         """
         today = date.today()
         stmt = select(Event).where(Event.next_run_on <= today)
 
+        if claim is not None:
+            stmt = (
+                stmt.order_by(Event.next_run_on, Event.id)
+                .limit(claim)
+                .with_for_update(skip_locked=True, of=Event)
+            )
+
         if eager:
             stmt = stmt.options(selectinload(Event.user))
 
         return (await self._session.scalars(stmt)).fetchall()
+
+    async def stream_upcoming_events(
+        self,
+        eager: bool = False,
+        chunk_size: int = GenericRepository.DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[Event]:
+        """
+        Stream events with `next_run_on` date set to today or prior.
+
+        :param eager: load `Event.user` relationship as well.
+        :type eager: bool
+        :param chunk_size: number of events fetched at once.
+        :type chunk_size: int
+        :return: async iterator of events to execute
+        :rtype: AsyncIterator[Event]
+        """
+        stmt = select(Event).where(Event.next_run_on <= date.today())
+        if eager:
+            stmt = stmt.options(selectinload(Event.user))
+
+        async for event in self.stream(stmt, chunk_size):
+            yield event
+
+    async def get_earliest_next_run_on(self) -> Optional[date]:
+        """
+        Get the earliest `next_run_on` date among all events.
+
+        :return: the date or `None` if there are no events.
+        :rtype: Optional[date]
+        """
+        return await self._session.scalar(select(func.min(Event.next_run_on)))
+
+    async def advance_after_run(
+        self, ids: Iterable[int], today: date, deltas: Mapping[int, int]
+    ) -> None:
+        """
+        Set `last_run_on` to `today` and move `next_run_on` forward for
+        all events in `ids` with a single `UPDATE`.
+
+        :param ids: event ids
+        :type ids: Iterable[int]
+        :param today: date of the run
+        :type today: date
+        :param deltas: mapping of event `interval` to the number of days
+        until the next run (see `determine_timedelta`).
+        :type deltas: Mapping[int, int]
+        """
+        await self._move_next_run_on(ids, today, deltas, last_run_on=today)
+
+    async def postpone(
+        self, ids: Iterable[int], today: date, deltas: Mapping[int, int]
+    ) -> None:
+        """
+        Move `next_run_on` forward as if the events in `ids` ran `today`,
+        without changing `last_run_on`, with a single `UPDATE`.
+
+        :param ids: event ids
+        :type ids: Iterable[int]
+        :param today: date the events were due on
+        :type today: date
+        :param deltas: mapping of event `interval` to the number of days
+        until the next run (see `determine_timedelta`).
+        :type deltas: Mapping[int, int]
+        """
+        await self._move_next_run_on(ids, today, deltas)
+
+    async def _move_next_run_on(
+        self,
+        ids: Iterable[int],
+        today: date,
+        deltas: Mapping[int, int],
+        **values: Any,
+    ) -> None:
+        ids = list(ids)
+        if len(ids) == 0:
+            return
+
+        next_run_on = case(
+            {
+                interval: today + timedelta(days=days)
+                for interval, days in deltas.items()
+            },
+            value=Event.interval,
+        )
+        await self._session.execute(
+            update(Event)
+            .where(Event.id.in_(ids))
+            .values(next_run_on=next_run_on, **values)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,4 +1,5 @@
-from typing import Iterable, Optional
+from typing import Any, AsyncIterator, Iterable, Optional
+from sqlalchemy import ColumnElement, Row, Select, delete, inspect, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.db import Base
@@ -25,8 +26,14 @@ class GenericRepository[T: Base, ID]:
     >>>     user = User(name="detectivekaktus", email="artiomastashonak@gmail.com")
     >>>     repo.add(user)
     >>>     await session.commit()
+
+    Use `stream*()` methods for queries over whole tables: rows are fetched
+    from a server-side cursor in chunks of `chunk_size`, so memory usage
+    doesn't grow with the size of the result set.
     """
 
+    DEFAULT_CHUNK_SIZE = 1000
+
     def __init__(self, model: type[T], session: AsyncSession) -> None:
         """
         Initialize the Repository class.
@@ -94,3 +101,81 @@ class GenericRepository[T: Base, ID]:
             raise ValueError(f"No entity with id {id=} exists")
 
         await self._session.delete(entity)
+
+    async def delete_where(
+        self, condition: ColumnElement[bool], limit: Optional[int] = None
+    ) -> int:
+        """
+        Delete entities matching `condition` with a single `DELETE`.
+
+        With `limit` set at most `limit` rows are deleted with
+        `DELETE ... WHERE <primary key> IN (SELECT ... LIMIT n)`, so big
+        deletions can be split into short transactions.
+
+        :param condition: WHERE clause of the entities to delete.
+        :type condition: ColumnElement[bool]
+        :param limit: maximal number of rows to delete, `None` deletes all.
+        :type limit: Optional[int]
+        :return: number of deleted rows
+        :rtype: int
+        """
+        stmt = delete(self._model).where(condition)
+        if limit is not None:
+            key = inspect(self._model).primary_key
+            stmt = stmt.where(
+                tuple_(*key).in_(select(*key).where(condition).limit(limit))
+            )
+
+        result = await self._session.execute(
+            stmt.execution_options(synchronize_session=False)
+        )
+        return result.rowcount  # type: ignore
+
+    async def stream(
+        self,
+        stmt: Optional[Select[tuple[T]]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[T]:
+        """
+        Iterate over entities returned by `stmt` without loading all of
+        them in memory.
+
+        The session must be kept open until the iteration is over.
+
+        :param stmt: SELECT of the repository model. All entities are
+        streamed if `None`.
+        :type stmt: Optional[Select[tuple[T]]]
+        :param chunk_size: number of rows fetched at once.
+        :type chunk_size: int
+        :return: async iterator of entities.
+        :rtype: AsyncIterator[T]
+        """
+        if stmt is None:
+            stmt = select(self._model)
+
+        result = await self._session.stream_scalars(
+            stmt.execution_options(yield_per=chunk_size)
+        )
+        async for entity in result:
+            yield entity
+
+    async def stream_rows(
+        self, stmt: Select[Any], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[Row[Any]]:
+        """
+        Iterate over rows returned by `stmt` without loading all of
+        them in memory. Use this method for queries that don't return
+        entities, e.g. aggregates.
+
+        :param stmt: SELECT statement
+        :type stmt: Select[Any]
+        :param chunk_size: number of rows fetched at once.
+        :type chunk_size: int
+        :return: async iterator of rows.
+        :rtype: AsyncIterator[Row[Any]]
+        """
+        result = await self._session.stream(
+            stmt.execution_options(yield_per=chunk_size)
+        )
+        async for row in result:
+            yield row
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 
 class Purgeable(ABC):
@@ -8,11 +9,16 @@ class Purgeable(ABC):
     """
 
     @abstractmethod
-    async def purge_by_user_id(self, user_id: int) -> None:
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
         """
-        Delete all rows bound to user with `user_id`.
+        Delete all rows bound to user with `user_id`, or at most `limit`
+        of them to purge a user in batches.
 
         :param user_id: user's telegram id
         :type user_id: int
+        :param limit: maximal number of rows to delete, `None` deletes all.
+        :type limit: Optional[int]
+        :return: number of deleted rows
+        :rtype: int
         """
         pass
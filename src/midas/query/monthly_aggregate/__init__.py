@@ -0,0 +1,3 @@
+from .repository import MonthlyAggregateRepository
+
+__all__ = ("MonthlyAggregateRepository",)
@@ -0,0 +1,156 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Mapping, Optional, Sequence, override
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.monthly_aggregate import MonthlyAggregate
+from midas.db.schemas.transaction import Transaction
+from midas.query import GenericRepository
+from midas.query.interface.purgeable import Purgeable
+from midas.query.util import get_month
+
+
+class MonthlyAggregateRepository(
+    GenericRepository[MonthlyAggregate, tuple[int, date, int]], Purgeable
+):
+    """
+    Monthly aggregate repository class.
+
+    This class inherits from `GenericRepository` thus has all
+    the features it provides by default. This class is more specific
+    to `monthly_aggregates` database table and provides methods to
+    apply the changes of transactions as deltas and to rebuild the table
+    from `transactions`.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(MonthlyAggregate, session)
+
+    @override
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
+        return await self.delete_where(MonthlyAggregate.user_id == user_id, limit)
+
+    def _get_period(self, created_at: Any) -> Any:
+        return get_month(created_at, self._session.bind.dialect.name)
+
+    async def apply_deltas(
+        self, deltas: Mapping[tuple[int, date, int], tuple[Decimal, int]]
+    ) -> None:
+        """
+        Add deltas to the sums and the numbers of transactions with a
+        single `INSERT ... ON CONFLICT DO UPDATE`. Missing rows are
+        created with the delta as their value.
+
+        :param deltas: mapping of `(user_id, period, transaction_type_id)`
+        to `(total, count)` deltas
+        :type deltas: Mapping[tuple[int, date, int], tuple[Decimal, int]]
+        """
+        if len(deltas) == 0:
+            return
+
+        values = [
+            {
+                "user_id": user_id,
+                "period": period,
+                "transaction_type_id": type_id,
+                "total": total,
+                "count": count,
+            }
+            for (user_id, period, type_id), (total, count) in deltas.items()
+        ]
+        dialect = (
+            postgresql if self._session.bind.dialect.name == "postgresql" else sqlite
+        )
+        stmt = dialect.insert(MonthlyAggregate).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                MonthlyAggregate.user_id,
+                MonthlyAggregate.period,
+                MonthlyAggregate.transaction_type_id,
+            ],
+            set_={
+                "total": MonthlyAggregate.total + stmt.excluded.total,
+                "count": MonthlyAggregate.count + stmt.excluded.count,
+            },
+        )
+        await self._session.execute(stmt)
+
+    async def get_by_period(
+        self, user_id: int, start: date, end: date
+    ) -> Sequence[MonthlyAggregate]:
+        """
+        SELECT aggregates of the user for the months from `start` up to,
+        but not including, `end`.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param start: first day of the first month
+        :type start: date
+        :param end: first day of the month after the last one
+        :type end: date
+        :return: aggregates ordered by period and transaction type
+        :rtype: Sequence[MonthlyAggregate]
+        """
+        stmt = (
+            select(MonthlyAggregate)
+            .where(
+                MonthlyAggregate.user_id == user_id,
+                MonthlyAggregate.period >= start,
+                MonthlyAggregate.period < end,
+            )
+            .order_by(MonthlyAggregate.period, MonthlyAggregate.transaction_type_id)
+        )
+        return (await self._session.scalars(stmt)).fetchall()
+
+    async def rebuild(self) -> int:
+        """
+        Replace the content of the table with aggregates computed from all
+        folded transactions with one `INSERT ... SELECT ... GROUP BY`, the
+        journal tail is counted in once it's folded, see
+        `Transaction.folded`.
+
+        On PostgreSQL `transactions` are locked in `SHARE` mode until the
+        end of the database transaction, so no transaction created,
+        edited or deleted meanwhile is counted twice or lost.
+
+        :return: number of rows inserted
+        :rtype: int
+        """
+        if self._session.bind.dialect.name == "postgresql":
+            await self._session.execute(text("LOCK TABLE transactions IN SHARE MODE"))
+        await self._session.execute(delete(MonthlyAggregate))
+
+        months = (
+            select(
+                Transaction.user_id,
+                self._get_period(Transaction.created_at).label("period"),
+                Transaction.transaction_type_id,
+                Transaction.amount,
+            )
+            .where(Transaction.folded)
+            .subquery()
+        )
+        rows = select(
+            months.c.user_id,
+            months.c.period,
+            months.c.transaction_type_id,
+            func.sum(months.c.amount),
+            func.count(),
+        ).group_by(months.c.user_id, months.c.period, months.c.transaction_type_id)
+
+        result = await self._session.execute(
+            insert(MonthlyAggregate).from_select(
+                [
+                    MonthlyAggregate.user_id,
+                    MonthlyAggregate.period,
+                    MonthlyAggregate.transaction_type_id,
+                    MonthlyAggregate.total,
+                    MonthlyAggregate.count,
+                ],
+                rows,
+            )
+        )
+        return result.rowcount  # type: ignore
@@ -0,0 +1,3 @@
+from .repository import NotificationRepository
+
+__all__ = ("NotificationRepository",)
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Optional, Sequence, override
+from sqlalchemy import Row, delete, insert, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.notification import Notification
+from midas.query import GenericRepository
+from midas.query.interface.purgeable import Purgeable
+
+
+class NotificationRepository(GenericRepository[Notification, int], Purgeable):
+    """
+    Notification repository class.
+
+    This class inherits from `GenericRepository` thus has all
+    the features it provides by default. This class is more specific
+    to `notifications_outbox` database table and provides methods to
+    enqueue notifications and lease them out in batches.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(Notification, session)
+
+    @override
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
+        return await self.delete_where(Notification.user_id == user_id, limit)
+
+    async def insert_many(self, messages: Iterable[tuple[int, str]]) -> None:
+        """
+        INSERT many notifications with a single statement.
+
+        :param messages: pairs of user's telegram id and the message
+        :type messages: Iterable[tuple[int, str]]
+        """
+        values = [
+            {"user_id": user_id, "message": message} for user_id, message in messages
+        ]
+        if len(values) == 0:
+            return
+
+        await self._session.execute(insert(Notification), values)
+
+    async def claim_batch(self, limit: int, lease: timedelta) -> Sequence[Row]:
+        """
+        Claim the oldest `limit` notifications that aren't claimed yet or
+        whose lease expired, by setting their `claimed_until` to `lease`
+        from now. The rows are picked with `FOR UPDATE SKIP LOCKED`, so
+        concurrent dispatchers never claim the same notification.
+
+        Commit right after claiming, the lease keeps the rows away from
+        other dispatchers while they're delivered outside the transaction.
+
+        :param limit: maximal number of notifications to claim
+        :type limit: int
+        :param lease: time the notifications are kept claimed for
+        :type lease: timedelta
+        :return: id, user_id and message of the claimed notifications,
+        the oldest first.
+        :rtype: Sequence[Row]
+        """
+        now = datetime.now(timezone.utc)
+        claimable = (
+            select(Notification.id)
+            .where(
+                or_(
+                    Notification.claimed_until.is_(None),
+                    Notification.claimed_until < now,
+                )
+            )
+            .order_by(Notification.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(Notification)
+            .where(Notification.id.in_(claimable.scalar_subquery()))
+            .values(claimed_until=now + lease)
+            .returning(Notification.id, Notification.user_id, Notification.message)
+            .execution_options(synchronize_session=False)
+        )
+        rows = (await self._session.execute(stmt)).fetchall()
+        return sorted(rows, key=lambda row: row.id)
+
+    async def release_many(self, ids: Iterable[int]) -> None:
+        """
+        Release the lease on all notifications in `ids`, so they're
+        claimed again right away.
+
+        :param ids: notification ids
+        :type ids: Iterable[int]
+        """
+        ids = list(ids)
+        if len(ids) == 0:
+            return
+
+        await self._session.execute(
+            update(Notification)
+            .where(Notification.id.in_(ids))
+            .values(claimed_until=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def delete_many(self, ids: Iterable[int]) -> None:
+        """
+        DELETE all notifications in `ids` with a single statement.
+
+        :param ids: notification ids
+        :type ids: Iterable[int]
+        """
+        ids = list(ids)
+        if len(ids) == 0:
+            return
+
+        await self._session.execute(
+            delete(Notification)
+            .where(Notification.id.in_(ids))
+            .execution_options(synchronize_session=False)
+        )
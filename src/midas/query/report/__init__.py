@@ -0,0 +1,3 @@
+from .repository import ReportRepository
+
+__all__ = ("ReportRepository",)
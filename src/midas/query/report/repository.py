@@ -0,0 +1,110 @@
+from datetime import date
+from decimal import Decimal
+from typing import Any, Mapping, Optional, Sequence, override
+from sqlalchemy import Date, bindparam, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.report import Report
+from midas.query import GenericRepository
+from midas.query.interface.purgeable import Purgeable
+from midas.query.interface.retrievable_by_user_id import RetrievableByUserId
+
+# both are served by a backward scan of the primary key index
+_GET_BY_USER_ID = (
+    select(Report)
+    .where(Report.user_id == bindparam("user_id"))
+    .order_by(Report.period.desc())
+    .limit(bindparam("count"))
+)
+_GET_BY_USER_ID_AFTER = _GET_BY_USER_ID.where(
+    Report.period < bindparam("after", type_=Date)
+)
+
+
+class ReportRepository(
+    GenericRepository[Report, tuple[int, date]], Purgeable, RetrievableByUserId
+):
+    """
+    Report repository class.
+
+    This class inherits from `GenericRepository` thus has all
+    the features it provides by default. This class is more specific
+    to `reports` database table and provides methods to store generated
+    reports and to page through the reports of a user.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession) -> None:
+        super().__init__(Report, session)
+
+    @override
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
+        return await self.delete_where(Report.user_id == user_id, limit)
+
+    @override
+    async def get_by_user_id(
+        self, user_id: int, count: int = 16, after: Optional[date] = None
+    ) -> Sequence[Report]:
+        """
+        Get `count` reports of `user_id` user, from the latest month to
+        the earliest one.
+
+        :param user_id: user's telegram id.
+        :type user_id: int
+        :param count: number of reports to get.
+        :type count: int
+        :param after: period of the last report of the previous page.
+        `None` starts from the latest report.
+        :type after: Optional[date]
+        :return: list of reports. Can be empty if `user_id` is invalid.
+        :rtype: Sequence[Report]
+        """
+        if after is None:
+            stmt, params = _GET_BY_USER_ID, {"user_id": user_id, "count": count}
+        else:
+            stmt = _GET_BY_USER_ID_AFTER
+            params = {"user_id": user_id, "count": count, "after": after}
+
+        return (await self._session.scalars(stmt, params)).fetchall()
+
+    async def insert_many(
+        self, period: date, reports: Mapping[int, dict[str, Any]]
+    ) -> set[int]:
+        """
+        INSERT the reports of many users in the month with a single
+        `INSERT ... ON CONFLICT DO NOTHING`. Reports already stored for
+        the month are kept as they are.
+
+        :param period: first day of the reported month
+        :type period: date
+        :param reports: mapping of user's telegram id to the report, which
+        has the shape of the dictionary returned by `GenerateReportUsecase`
+        :type reports: Mapping[int, dict[str, Any]]
+        :return: ids of the users whose report was inserted
+        :rtype: set[int]
+        """
+        if len(reports) == 0:
+            return set()
+
+        values = [
+            {
+                "user_id": user_id,
+                "period": period,
+                "accounts": {
+                    name: str(amount) for name, amount in report["accounts"].items()
+                },
+                "result": Decimal(report["result"]),
+            }
+            for user_id, report in reports.items()
+        ]
+        dialect = (
+            postgresql if self._session.bind.dialect.name == "postgresql" else sqlite
+        )
+        stmt = (
+            dialect.insert(Report)
+            .values(values)
+            .on_conflict_do_nothing(index_elements=[Report.user_id, Report.period])
+            .returning(Report.user_id)
+        )
+        return set((await self._session.scalars(stmt)).all())
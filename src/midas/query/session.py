@@ -1,23 +1,111 @@
 from typing import Optional
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
-from midas.db import engine
+from midas.db import engine, replica_router
 
 
-def create_session(custom_engine: Optional[AsyncEngine] = None) -> AsyncSession:
+class _Session(Session):
+    pass
+
+
+# https://docs.sqlalchemy.org/en/20/orm/session_basics.html#using-a-sessionmaker
+# Every unit of work (a bot update, a scheduled job run) gets its own
+# session from this factory, sessions are never shared between concurrent
+# tasks.
+session_factory = async_sessionmaker(engine, sync_session_class=_Session)
+
+
+@event.listens_for(_Session, "after_commit")
+def _remember_commit(session: Session) -> None:
+    # reads following a write of the same unit of work stay on the primary
+    session.info["committed"] = True
+
+
+def create_session(
+    custom_engine: Optional[AsyncEngine] = None, read_only: bool = False
+) -> AsyncSession:
     """
     Create async sqlalchemy session.
 
     This method obscures the sqlalchemy calls from the end
     user to provide a simpler interface for accessing session.
 
+    Read-only sessions are bound to the read replica while it is
+    available, see `ReplicaRouter`, and to the primary otherwise.
+
     Note that `custom_engine` argument is meant only for
     testing purposes and should remain `None` in production.
 
     :param custom_engine: custom testing `AsyncEngine` object.
     :type custom_engine: AsyncEngine
+    :param read_only: whether the session never writes to the database.
+    :type read_only: bool
     :return: new sqlalchemy session
     :rtype: AsyncSession
     """
-    session = AsyncSession(custom_engine or engine)
-    return session
+    if custom_engine is not None:
+        return AsyncSession(custom_engine)
+
+    replica = replica_router.engine if read_only else None
+    if replica is not None:
+        return session_factory(bind=replica)
+    return session_factory()
+
+
+def route_read_only(session: AsyncSession) -> AsyncSession:
+    """
+    Get the session a read-only usecase handed `session` should run in.
+
+    A new replica session is returned while the replica is available and
+    `session` is a primary session that didn't commit anything yet, so the
+    reads of a unit of work always see its own writes. Otherwise `session`
+    is returned as is.
+
+    :param session: session passed to the usecase
+    :type session: AsyncSession
+    :return: session to run the usecase in
+    :rtype: AsyncSession
+    """
+    if session.bind is not engine or session.info.get("committed", False):
+        return session
+
+    replica = replica_router.engine
+    if replica is None:
+        return session
+    return session_factory(bind=replica)
+
+
+def fall_back_to_primary(
+    session: AsyncSession, error: BaseException
+) -> Optional[AsyncSession]:
+    """
+    Get the session to run a read-only unit of work in again, after it
+    failed with `error` in `session`.
+
+    When `session` is bound to the replica and `error` is a connection
+    level error, e.g. the replica went down, the replica is marked
+    unavailable and a new primary session is returned. Other errors
+    aren't worth another run.
+
+    :param session: session the unit of work failed in
+    :type session: AsyncSession
+    :param error: error the unit of work failed with
+    :type error: BaseException
+    :return: new primary session or `None` if the error should be raised
+    :rtype: Optional[AsyncSession]
+    """
+    replica = replica_router.replica
+    if replica is None or session.bind is not replica:
+        return None
+
+    connection_error = isinstance(
+        error, (OSError, OperationalError, InterfaceError)
+    ) or (isinstance(error, DBAPIError) and error.connection_invalidated)
+    if not connection_error:
+        return None
+
+    replica_router.mark_unavailable(f"read on the replica failed ({error!r})")
+    return session_factory(bind=engine)
@@ -1,14 +1,120 @@
-from typing import Optional, Sequence, override
-from uuid import UUID
-from sqlalchemy import delete, select
-from sqlalchemy.orm import selectinload
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, AsyncIterable, Iterable, Optional, Sequence, override
+from uuid import UUID, uuid4
+from sqlalchemy import (
+    TIMESTAMP,
+    Column,
+    Date,
+    Integer,
+    MetaData,
+    Numeric,
+    Row,
+    Select,
+    String,
+    Table,
+    Uuid,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    null,
+    select,
+    text,
+    true,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.sql.dml import Delete, Update
+from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.schema import CreateTable
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.db.schemas.account import Account
+from midas.db.schemas.account_period import AccountPeriod
+from midas.db.schemas.monthly_aggregate import MonthlyAggregate
 from midas.db.schemas.transaction import Transaction
+from midas.db.schemas.user import User
 from midas.query.interface.eager_loadable import EagerLoadable
 from midas.query import GenericRepository
 from midas.query.interface.purgeable import Purgeable
+from midas.query.util import get_month
+from midas.util.dates import month_of, next_month
+from midas.util.enums import TransactionType
+
+# Bank statement rows are copied here before they're inserted into
+# `transactions`. The table is temporary and dropped on commit, so it's
+# kept out of `Base.metadata`.
+_IMPORT_STAGING = Table(
+    "transaction_import_staging",
+    MetaData(),
+    Column("import_hash", String(64), nullable=False),
+    Column("transaction_type_id", Integer, nullable=False),
+    Column("created_at", TIMESTAMP(timezone=True), nullable=False),
+    Column("title", String(64), nullable=False),
+    Column("description", String(256)),
+    Column("amount", Numeric(12, 2), nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+def _get_recent_statement(after: bool, eager: bool) -> Select[tuple[Transaction]]:
+    created_at = bindparam("created_at", type_=TIMESTAMP(timezone=True))
+    stmt = (
+        select(Transaction)
+        .where(Transaction.user_id == bindparam("user_id"))
+        .order_by(Transaction.created_at.desc(), Transaction.id.desc())
+        .limit(bindparam("limit"))
+    )
+    if after:
+        # the row comparison can't prune partitions, the bound on
+        # `created_at` alone can
+        stmt = stmt.where(
+            Transaction.created_at <= created_at,
+            tuple_(Transaction.created_at, Transaction.id)
+            < tuple_(created_at, bindparam("id", type_=Uuid)),
+        )
+    if eager:
+        stmt = stmt.options(
+            selectinload(Transaction.debit_account).selectinload(Account.user),
+            selectinload(Transaction.credit_account),
+        )
+    return stmt
+
+
+# Hot queries of the repositories are built once as module-level constants,
+# the arguments are passed as bound parameters. Building a statement and
+# computing its cache key costs more than running it with the compiled form
+# and the prepared statement cached.
+_GET_RECENT = {
+    (after, eager): _get_recent_statement(after, eager)
+    for after in (False, True)
+    for eager in (False, True)
+}
+
+
+# the columns are in the `(user_id, created_at)` index, so the sums are
+# computed with an index-only scan
+_SUM_BY_TYPE = (
+    select(
+        Transaction.transaction_type_id,
+        func.sum(Transaction.amount).label("total"),
+        func.count().label("entries"),
+    )
+    .where(
+        Transaction.user_id == bindparam("user_id"),
+        Transaction.created_at >= bindparam("start", type_=TIMESTAMP(timezone=True)),
+        Transaction.created_at < bindparam("end", type_=TIMESTAMP(timezone=True)),
+    )
+    .group_by(Transaction.transaction_type_id)
+    .order_by(Transaction.transaction_type_id)
+)
+# the journal tail only, see `Transaction.folded`
+_SUM_UNFOLDED_BY_TYPE = _SUM_BY_TYPE.where(Transaction.folded.is_(False))
 
 
 class TransactionRepository(
@@ -28,8 +134,14 @@ class TransactionRepository(
     The class also implements interface `EagerLoadable`, so
     the fetch method can use eager loading mechanisms of
     sqlalchemy.
+
+    On PostgreSQL `transactions` is partitioned by month on `created_at`.
+    Queries bound `created_at` wherever the bounds are known, so only the
+    partitions that may hold the rows are read.
     """
 
+    PARTITION_NAME_FORMAT = "transactions_y%Ym%m"
+
     @override
     def __init__(self, session: AsyncSession) -> None:
         super().__init__(Transaction, session)
@@ -42,6 +154,9 @@ class TransactionRepository(
         If this method is used with eager loading, credit and debit accounts
         used in the transaction are loaded upfront.
 
+        The primary key is `(id, created_at)`, but the id alone is unique,
+        so the transaction is looked up by the id only.
+
         :param id: transaction id.
         :type id: UUID
         :param eager: use eager loading.
@@ -50,42 +165,209 @@ class TransactionRepository(
         exists with the provided id.
         :rtype: Optional[Transaction]
         """
+        stmt = select(Transaction).where(Transaction.id == id)
         if eager:
-            return (
-                await self._session.scalars(
-                    select(Transaction)
-                    .where(Transaction.id == id)
-                    .options(
-                        selectinload(Transaction.debit_account).selectinload(
-                            Account.user
-                        ),
-                        selectinload(Transaction.credit_account).selectinload(
-                            Account.user
-                        ),
-                    )
-                )
-            ).one_or_none()
+            stmt = stmt.options(
+                selectinload(Transaction.debit_account).selectinload(Account.user),
+                selectinload(Transaction.credit_account).selectinload(Account.user),
+            )
 
-        return await super().get_by_id(id)
+        return (await self._session.scalars(stmt)).one_or_none()
 
     @override
-    async def purge_by_user_id(self, user_id: int) -> None:
+    async def delete_by_id(
+        self, id: UUID, created_at: Optional[datetime] = None
+    ) -> None:
+        """
+        Delete a transaction by its id.
+
+        :param id: transaction id.
+        :type id: UUID
+        :param created_at: creation time of the transaction. When known,
+        pass it to read a single partition.
+        :type created_at: Optional[datetime]
+        :raise ValueError: if no transaction with `id` exists.
+        """
+        stmt = delete(Transaction).where(Transaction.id == id)
+        if created_at is not None:
+            stmt = stmt.where(Transaction.created_at == created_at)
+
+        if (await self._session.execute(stmt)).rowcount == 0:  # type: ignore
+            raise ValueError(f"No entity with id {id=} exists")
+
+    @override
+    async def purge_by_user_id(self, user_id: int, limit: Optional[int] = None) -> int:
         """
         DELETE all rows where `transactions.user_id` = `user_id`.
 
         :param user_id: user's telegram id
         :type user_id: int
+        :param limit: maximal number of rows to delete, `None` deletes all.
+        :type limit: Optional[int]
+        :return: number of deleted rows
+        :rtype: int
         """
-        await self._session.execute(
-            delete(Transaction).where(Transaction.user_id == user_id)
+        return await self.delete_where(Transaction.user_id == user_id, limit)
+
+    async def _sum_changed(
+        self, change: Delete | Update, conditions: Sequence[Any], by_folded: bool
+    ) -> Sequence[Row[Any]]:
+        """
+        Run `change` on the transactions matching `conditions` and sum up
+        the changed transactions per user, type, month and accounts, and
+        per `folded` if `by_folded` is set.
+
+        On PostgreSQL the change is a data-modifying CTE whose `RETURNING`
+        rows are grouped in the same statement, so the transactions are
+        never read into Python. Other dialects run the grouped `SELECT`
+        and the change one after another.
+        """
+        dialect = self._session.bind.dialect.name
+        columns = [
+            Transaction.user_id,
+            Transaction.transaction_type_id,
+            get_month(Transaction.created_at, dialect).label("period"),
+            Transaction.debit_account_id,
+            Transaction.credit_account_id,
+            Transaction.amount,
+        ]
+        if by_folded:
+            columns.append(Transaction.folded)
+
+        if dialect == "postgresql":
+            changed = change.returning(*columns).cte("changed")
+        else:
+            changed = select(*columns).where(*conditions).subquery("changed")
+
+        keys = [
+            changed.c.user_id,
+            changed.c.transaction_type_id,
+            changed.c.period,
+            changed.c.debit_account_id,
+            changed.c.credit_account_id,
+        ]
+        if by_folded:
+            keys.append(changed.c.folded)
+        stmt = select(
+            *keys,
+            func.count().label("entries"),
+            func.sum(changed.c.amount).label("total"),
+        ).group_by(*keys)
+        rows = (await self._session.execute(stmt)).all()
+
+        if dialect != "postgresql":
+            await self._session.execute(
+                change.execution_options(synchronize_session=False)
+            )
+        return rows
+
+    async def delete_many(
+        self,
+        user_id: Optional[int] = None,
+        ids: Optional[Iterable[UUID]] = None,
+        created_between: Optional[tuple[datetime, datetime]] = None,
+        imported: bool = False,
+    ) -> Sequence[Row[Any]]:
+        """
+        DELETE the transactions matching all of the given filters and sum
+        up what was deleted with a single `DELETE ... RETURNING`, so the
+        caller can revert the effects of the transactions on the balances
+        in bulk.
+
+        :param user_id: user's telegram id
+        :type user_id: Optional[int]
+        :param ids: transaction ids
+        :type ids: Optional[Iterable[UUID]]
+        :param created_between: inclusive bounds of the creation time. When
+        known, pass them to read only the partitions that may hold the rows.
+        :type created_between: Optional[tuple[datetime, datetime]]
+        :param imported: delete imported transactions only
+        :type imported: bool
+        :return: rows of `(user_id, transaction_type_id, period,
+        debit_account_id, credit_account_id, folded, entries, total)`, i.e.
+        the number and the sum of amounts of deleted transactions per user,
+        type, month, accounts and whether they were folded.
+        :rtype: Sequence[Row[Any]]
+        :raise ValueError: if neither `user_id` nor `ids` is given.
+        """
+        if user_id is None and ids is None:
+            raise ValueError("Either `user_id` or `ids` must be given")
+
+        conditions = []
+        if user_id is not None:
+            conditions.append(Transaction.user_id == user_id)
+        if ids is not None:
+            conditions.append(Transaction.id.in_(set(ids)))
+        if created_between is not None:
+            conditions.append(Transaction.created_at.between(*created_between))
+        if imported:
+            conditions.append(Transaction.import_hash.is_not(None))
+
+        return await self._sum_changed(
+            delete(Transaction).where(*conditions), conditions, by_folded=True
+        )
+
+    async def fold(
+        self,
+        user_id: Optional[int] = None,
+        ids: Optional[Iterable[UUID]] = None,
+        limit: Optional[int] = None,
+    ) -> Sequence[Row[Any]]:
+        """
+        Mark the journal tail, i.e. the transactions not folded yet, as
+        folded with a single `UPDATE ... RETURNING` and sum up what was
+        folded, so the caller can add the transactions to the account
+        amounts and the balances in bulk.
+
+        Rows inserted by transactions that didn't commit yet aren't seen
+        and stay in the tail, so concurrent postings are never lost.
+
+        :param user_id: fold the transactions of this user only
+        :type user_id: Optional[int]
+        :param ids: fold these transactions only
+        :type ids: Optional[Iterable[UUID]]
+        :param limit: maximal number of transactions to fold, `None` folds
+        all.
+        :type limit: Optional[int]
+        :return: rows of `(user_id, transaction_type_id, period,
+        debit_account_id, credit_account_id, entries, total)`, i.e. the
+        number and the sum of amounts of folded transactions per user,
+        type, month and accounts.
+        :rtype: Sequence[Row[Any]]
+        """
+        conditions = [Transaction.folded.is_(False)]
+        if user_id is not None:
+            conditions.append(Transaction.user_id == user_id)
+        if ids is not None:
+            conditions.append(Transaction.id.in_(set(ids)))
+        if limit is not None:
+            key = (Transaction.id, Transaction.created_at)
+            conditions.append(
+                tuple_(*key).in_(select(*key).where(*conditions).limit(limit))
+            )
+
+        return await self._sum_changed(
+            update(Transaction).where(*conditions).values(folded=True),
+            conditions,
+            by_folded=False,
         )
 
     async def get_recent(
-        self, user_id: int, limit: int = 10, eager: bool = False
+        self,
+        user_id: int,
+        limit: int = 10,
+        eager: bool = False,
+        after: Optional[tuple[datetime, UUID]] = None,
     ) -> Sequence[Transaction]:
         """
         Get recent user transactions.
 
+        The transactions are ordered by `(created_at, id)` from the newest
+        to the oldest. To get the next page pass the `(created_at, id)` pair
+        of the last transaction of the previous page as `after`: the page
+        is then found with a seek over the `(user_id, created_at, id)` index
+        instead of skipping the rows already seen.
+
         If used with eager loading, debit and credit accounts associated
         with the transaction are loaded.
 
@@ -95,19 +377,546 @@ class TransactionRepository(
         :type limit: int
         :param eager: use eager loading
         :type eager: bool
+        :param after: `(created_at, id)` cursor of the last transaction of
+        the previous page. `None` starts from the newest transaction.
+        :type after: Optional[tuple[datetime, UUID]]
         :return: list of transactions
         :rtype: Sequence[Transaction]
         """
+        stmt = _GET_RECENT[(after is not None, eager)]
+        params: dict[str, Any] = {"user_id": user_id, "limit": limit}
+        if after is not None:
+            params["created_at"], params["id"] = after
+
+        return (await self._session.scalars(stmt, params)).fetchall()
+
+    async def sum_by_type(
+        self, user_id: int, start: datetime, end: datetime, unfolded: bool = False
+    ) -> Sequence[Row[Any]]:
+        """
+        SELECT the sum and the number of the user's transactions of each
+        type created from `start` up to, but not including, `end` with one
+        `GROUP BY` query. Types without transactions in the range have no
+        row.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param start: inclusive lower bound of the creation time
+        :type start: datetime
+        :param end: exclusive upper bound of the creation time
+        :type end: datetime
+        :param unfolded: sum up only the transactions not folded yet, see
+        `Transaction.folded`
+        :type unfolded: bool
+        :return: rows with `transaction_type_id`, `total` and `entries`
+        columns ordered by transaction type.
+        :rtype: Sequence[Row[Any]]
+        """
+        stmt = _SUM_UNFOLDED_BY_TYPE if unfolded else _SUM_BY_TYPE
+        params = {"user_id": user_id, "start": start, "end": end}
+        return (await self._session.execute(stmt, params)).all()
+
+    async def insert_many(self, values: Sequence[dict[str, Any]]) -> None:
+        """
+        INSERT many transactions with a single multi-row statement.
+
+        Unlike `add_many()` this method doesn't go through the unit of
+        work, so no `Transaction` objects are created in the session.
+        Each dictionary must contain the same set of keys named after
+        `Transaction` attributes.
+
+        :param values: rows to insert
+        :type values: Sequence[dict[str, Any]]
+        """
+        if len(values) == 0:
+            return
+
+        await self._session.execute(insert(Transaction), values)
+
+    def _get_dialect(self) -> Any:
+        return postgresql if self._session.bind.dialect.name == "postgresql" else sqlite
+
+    def _add_to_period(
+        self,
+        account: Sequence[Any],
+        period: date,
+        debit: Decimal,
+        credit: Decimal,
+    ) -> Any:
+        # `INSERT ... ON CONFLICT DO UPDATE` adding to the month of the
+        # account matching `account`, returning the account id as `id`
+        rows = select(
+            Account.id,
+            literal(period, Date),
+            literal(debit, Numeric(12, 2)),
+            literal(credit, Numeric(12, 2)),
+        ).where(*account)
         stmt = (
-            select(Transaction)
-            .where(Transaction.user_id == user_id)
-            .order_by(Transaction.created_at.desc())
-            .limit(limit)
+            self._get_dialect()
+            .insert(AccountPeriod)
+            .from_select(
+                [
+                    AccountPeriod.account_id,
+                    AccountPeriod.period,
+                    AccountPeriod.debit_amount,
+                    AccountPeriod.credit_amount,
+                ],
+                rows,
+            )
         )
-        if eager:
-            stmt = stmt.options(
-                selectinload(Transaction.debit_account).selectinload(Account.user),
-                selectinload(Transaction.credit_account),
+        return stmt.on_conflict_do_update(
+            index_elements=[AccountPeriod.account_id, AccountPeriod.period],
+            set_={
+                "debit_amount": AccountPeriod.debit_amount + stmt.excluded.debit_amount,
+                "credit_amount": AccountPeriod.credit_amount
+                + stmt.excluded.credit_amount,
+            },
+        ).returning(AccountPeriod.account_id.label("id"))
+
+    def _add_to_aggregate(
+        self,
+        user_id: int,
+        period: date,
+        transaction_type: TransactionType,
+        amount: Decimal,
+    ) -> Any:
+        # `INSERT ... ON CONFLICT DO UPDATE` counting the transaction in
+        # the monthly aggregate of the user, returning the user id as `id`
+        rows = select(
+            User.id,
+            literal(period, Date),
+            literal(int(transaction_type)),
+            literal(amount, Numeric(14, 2)),
+            literal(1),
+        ).where(User.id == user_id)
+        stmt = (
+            self._get_dialect()
+            .insert(MonthlyAggregate)
+            .from_select(
+                [
+                    MonthlyAggregate.user_id,
+                    MonthlyAggregate.period,
+                    MonthlyAggregate.transaction_type_id,
+                    MonthlyAggregate.total,
+                    MonthlyAggregate.count,
+                ],
+                rows,
             )
+        )
+        return stmt.on_conflict_do_update(
+            index_elements=[
+                MonthlyAggregate.user_id,
+                MonthlyAggregate.period,
+                MonthlyAggregate.transaction_type_id,
+            ],
+            set_={
+                "total": MonthlyAggregate.total + stmt.excluded.total,
+                "count": MonthlyAggregate.count + stmt.excluded.count,
+            },
+        ).returning(MonthlyAggregate.user_id.label("id"))
+
+    async def post(
+        self,
+        user_id: int,
+        transaction_type: TransactionType,
+        title: str,
+        amount: Decimal,
+        description: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        folded: bool = True,
+    ) -> Optional[UUID]:
+        """
+        Insert a transaction, apply its double-entry effects and count it
+        in its monthly aggregate.
+
+        The upserts of the current `AccountPeriod` rows of the accounts
+        and of the `MonthlyAggregate` row, and the `users.balance` update,
+        are statements returning the ids the transaction refers to, so no
+        rows are read into Python. On PostgreSQL they're data-modifying
+        CTEs feeding the `INSERT`, so posting costs a single round trip.
+        Other dialects have no data-modifying CTEs and run them one by
+        one before the `INSERT`. The transaction is only inserted if the
+        user and their accounts exist.
+
+        An unfolded transaction is only appended to the journal, the
+        accounts, the balance and the aggregate are left untouched, see
+        `Transaction.folded`.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param transaction_type: transaction type
+        :type transaction_type: TransactionType
+        :param title: transaction title
+        :type title: str
+        :param amount: transaction amount
+        :type amount: Decimal
+        :param description: transaction description
+        :type description: Optional[str]
+        :param created_at: creation time, defaults to now
+        :type created_at: Optional[datetime]
+        :param folded: apply the effects to the accounts, the balance and
+        the aggregate
+        :type folded: bool
+        :return: id of the new transaction or `None` if the user doesn't exist
+        :rtype: Optional[UUID]
+        """
+        is_income = transaction_type == TransactionType.INCOME
+        created_at = created_at or datetime.now(timezone.utc)
+        period = month_of(created_at)
+        debit_account = (
+            Account.user_id == user_id,
+            Account.transaction_type_id == transaction_type,
+        )
+        credit_account = (
+            Account.user_id == user_id,
+            Account.transaction_type_id == TransactionType.INCOME,
+        )
 
-        return (await self._session.scalars(stmt)).fetchall()
+        # every step returns the id of the row it touched as `id`
+        steps: dict[str, Any] = {}
+        if folded:
+            steps["debit"] = self._add_to_period(
+                debit_account, period, amount, Decimal()
+            )
+            steps["balance"] = (
+                update(User)
+                .where(User.id == user_id)
+                .values(
+                    balance=User.balance + (amount if is_income else -amount),
+                    version=User.version + 1,
+                )
+                .returning(User.id)
+            )
+            if not is_income:
+                steps["credit"] = self._add_to_period(
+                    credit_account, period, Decimal(), amount
+                )
+            steps["aggregate"] = self._add_to_aggregate(
+                user_id, period, transaction_type, amount
+            )
+        else:
+            # the hot rows are left alone, the compactor folds the
+            # transaction in later
+            steps["debit"] = select(Account.id).where(*debit_account)
+            steps["balance"] = select(User.id).where(User.id == user_id)
+            if not is_income:
+                steps["credit"] = select(Account.id).where(*credit_account)
+
+        transaction_id = uuid4()
+        if self._session.bind.dialect.name != "postgresql":
+            ids: dict[str, Any] = {}
+            for name, step in steps.items():
+                ids[name] = (await self._session.execute(step)).scalar_one_or_none()
+                if ids[name] is None:
+                    return None
+
+            await self._session.execute(
+                insert(Transaction).values(
+                    id=transaction_id,
+                    user_id=ids["balance"],
+                    transaction_type_id=int(transaction_type),
+                    created_at=created_at,
+                    title=title,
+                    description=description,
+                    amount=amount,
+                    debit_account_id=ids["debit"],
+                    credit_account_id=ids.get("credit"),
+                    folded=folded,
+                )
+            )
+            return transaction_id
+
+        ctes = {name: step.cte(name) for name, step in steps.items()}
+        credit_account_id: Any = null()
+        if not is_income:
+            credit_account_id = select(ctes["credit"].c.id).scalar_subquery()
+
+        rows = select(
+            literal(transaction_id, Uuid),
+            ctes["balance"].c.id,
+            literal(int(transaction_type)),
+            literal(created_at, Transaction.created_at.type),
+            literal(title, String),
+            literal(description, String),
+            literal(amount, Numeric(12, 2)),
+            ctes["debit"].c.id,
+            credit_account_id,
+            literal(folded),
+        ).select_from(ctes["balance"].join(ctes["debit"], true()))
+
+        stmt = (
+            insert(Transaction)
+            .from_select(
+                [
+                    Transaction.id,
+                    Transaction.user_id,
+                    Transaction.transaction_type_id,
+                    Transaction.created_at,
+                    Transaction.title,
+                    Transaction.description,
+                    Transaction.amount,
+                    Transaction.debit_account_id,
+                    Transaction.credit_account_id,
+                    Transaction.folded,
+                ],
+                rows,
+            )
+            .returning(Transaction.id)
+        )
+        for cte in ctes.values():
+            stmt = stmt.add_cte(cte)
+
+        return (await self._session.execute(stmt)).scalar_one_or_none()
+
+    async def stage_imports(
+        self, records: Iterable[tuple[Any, ...]] | AsyncIterable[tuple[Any, ...]]
+    ) -> None:
+        """
+        Create the temporary import staging table and fill it with binary
+        `COPY`. `records` are consumed as they're sent, so they may be
+        produced lazily from a file of any size. The staging table is
+        dropped when the transaction ends.
+
+        Each record is a tuple of `(import_hash, transaction_type_id,
+        created_at, title, description, amount)`.
+
+        This method relies on asyncpg and can only be used with PostgreSQL.
+
+        :param records: rows to stage
+        :type records: Iterable[tuple[Any, ...]] | AsyncIterable[tuple[Any, ...]]
+        """
+        await self._session.execute(CreateTable(_IMPORT_STAGING))
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(  # type: ignore
+            _IMPORT_STAGING.name,
+            records=records,
+            columns=[column.name for column in _IMPORT_STAGING.columns],
+        )
+
+    async def insert_staged_imports(
+        self, user_id: int, folded: bool = True
+    ) -> Sequence[Row[Any]]:
+        """
+        Move the rows staged with `stage_imports()` to `transactions` in a
+        single `INSERT ... SELECT`. Rows whose `import_hash` the user
+        already has are skipped with `ON CONFLICT DO NOTHING`.
+
+        The debit and credit accounts are resolved by joining `accounts`,
+        the account balances are left untouched.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param folded: value of `Transaction.folded` of the new rows
+        :type folded: bool
+        :return: rows of `(transaction_type_id, period, imported, total)`,
+        i.e. the number and the sum of amounts of inserted transactions per
+        type and month, see `MonthlyAggregate`.
+        :rtype: Sequence[Row[Any]]
+        """
+        staged = _IMPORT_STAGING
+        debit = aliased(Account)
+        credit = aliased(Account)
+
+        rows = (
+            select(
+                func.gen_random_uuid(),
+                literal(user_id),
+                staged.c.transaction_type_id,
+                staged.c.created_at,
+                staged.c.title,
+                staged.c.description,
+                staged.c.amount,
+                debit.id,
+                credit.id,
+                staged.c.import_hash,
+                literal(folded),
+            )
+            .select_from(staged)
+            .join(
+                debit,
+                and_(
+                    debit.user_id == user_id,
+                    debit.transaction_type_id == staged.c.transaction_type_id,
+                ),
+            )
+            .outerjoin(
+                credit,
+                and_(
+                    credit.user_id == user_id,
+                    credit.transaction_type_id == TransactionType.INCOME,
+                    staged.c.transaction_type_id != TransactionType.INCOME,
+                ),
+            )
+        )
+        inserted = (
+            postgresql.insert(Transaction)
+            .from_select(
+                [
+                    Transaction.id,
+                    Transaction.user_id,
+                    Transaction.transaction_type_id,
+                    Transaction.created_at,
+                    Transaction.title,
+                    Transaction.description,
+                    Transaction.amount,
+                    Transaction.debit_account_id,
+                    Transaction.credit_account_id,
+                    Transaction.import_hash,
+                    Transaction.folded,
+                ],
+                rows,
+            )
+            .on_conflict_do_nothing(
+                index_elements=["user_id", "import_hash", "created_at"]
+            )
+            .returning(
+                Transaction.transaction_type_id,
+                get_month(Transaction.created_at, "postgresql").label("period"),
+                Transaction.amount,
+            )
+            .cte("inserted")
+        )
+
+        stmt = select(
+            inserted.c.transaction_type_id,
+            inserted.c.period,
+            func.count().label("imported"),
+            func.sum(inserted.c.amount).label("total"),
+        ).group_by(inserted.c.transaction_type_id, inserted.c.period)
+        return (await self._session.execute(stmt)).all()
+
+    async def get_import_hashes(
+        self,
+        user_id: int,
+        hashes: Iterable[str],
+        created_between: Optional[tuple[datetime, datetime]] = None,
+    ) -> set[str]:
+        """
+        SELECT the import hashes in `hashes` the user already has.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param hashes: import hashes to look up
+        :type hashes: Iterable[str]
+        :param created_between: inclusive bounds of the creation time of
+        the transactions the hashes belong to
+        :type created_between: Optional[tuple[datetime, datetime]]
+        :return: hashes of previously imported transactions
+        :rtype: set[str]
+        """
+        stmt = select(Transaction.import_hash).where(
+            Transaction.user_id == user_id, Transaction.import_hash.in_(set(hashes))
+        )
+        if created_between is not None:
+            stmt = stmt.where(Transaction.created_at.between(*created_between))
+        return set((await self._session.scalars(stmt)).all())  # type: ignore
+
+    @classmethod
+    def get_partition_name(cls, month: date) -> str:
+        """
+        Get name of the partition of `transactions` holding the month.
+
+        :param month: any day of the month
+        :type month: date
+        :return: partition name
+        :rtype: str
+        """
+        return month.strftime(cls.PARTITION_NAME_FORMAT)
+
+    async def get_partitions(self) -> list[str]:
+        """
+        SELECT names of all partitions of `transactions`, including the
+        default one.
+
+        Partitioning is specific to PostgreSQL, this method can't be used
+        with other dialects.
+
+        :return: partition names in alphabetical order
+        :rtype: list[str]
+        """
+        stmt = text(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'transactions'::regclass "
+            "ORDER BY c.relname"
+        )
+        return list((await self._session.scalars(stmt)).all())
+
+    async def create_partitions(self, months: Iterable[date]) -> list[str]:
+        """
+        Create monthly partitions of `transactions` for `months` that
+        don't have one yet. Creating a partition briefly locks the whole
+        table, so create them ahead of time.
+
+        Concurrent callers are serialized with an advisory lock held until
+        the end of the transaction.
+
+        Partitioning is specific to PostgreSQL, this method can't be used
+        with other dialects.
+
+        :param months: first days of the months
+        :type months: Iterable[date]
+        :return: names of created partitions
+        :rtype: list[str]
+        """
+        wanted = {
+            self.get_partition_name(month): month.replace(day=1) for month in months
+        }
+        if wanted.keys() <= set(await self.get_partitions()):
+            return []
+
+        await self._session.execute(
+            text("SELECT pg_advisory_xact_lock(hashtext('transactions_partitions'))")
+        )
+        existing = set(await self.get_partitions())
+
+        created = []
+        for name, month in sorted(wanted.items()):
+            if name in existing:
+                continue
+
+            await self._session.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF transactions "
+                    f"FOR VALUES FROM ('{month} 00:00+00') TO ('{next_month(month)} 00:00+00')"
+                )
+            )
+            created.append(name)
+        return created
+
+    async def detach_partition(self, month: date, lock_timeout: int = 5) -> str:
+        """
+        Detach the partition of `month` from `transactions`. The partition
+        is left as a standalone table that can be archived or dropped, its
+        transactions are no longer visible to the application.
+
+        Detaching only changes the catalog, but it needs a short exclusive
+        lock on `transactions` (`CONCURRENTLY` isn't allowed next to the
+        default partition). The lock is waited for at most `lock_timeout`
+        seconds, so a long running query can't make the whole table wait
+        behind the detach.
+
+        Partitioning is specific to PostgreSQL, this method can't be used
+        with other dialects.
+
+        :param month: any day of the month
+        :type month: date
+        :param lock_timeout: seconds to wait for the lock
+        :type lock_timeout: int
+        :return: name of the detached partition
+        :rtype: str
+        :raise ValueError: if the month has no partition.
+        """
+        name = self.get_partition_name(month)
+        if name not in await self.get_partitions():
+            raise ValueError(f"No partition {name} exists")
+
+        await self._session.execute(
+            text(f"SET LOCAL lock_timeout = '{int(lock_timeout)}s'")
+        )
+        await self._session.execute(
+            text(f"ALTER TABLE transactions DETACH PARTITION {name}")
+        )
+        return name
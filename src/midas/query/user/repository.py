@@ -1,9 +1,13 @@
-from typing import Optional, Sequence, override
-from sqlalchemy import select
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Mapping, Optional, Sequence, override
+from sqlalchemy import Integer, Numeric, case, column, func, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from midas.db.schemas.transaction import Transaction
 from midas.db.schemas.user import User
 from midas.query import GenericRepository
+from midas.util.enums import TransactionType
 
 
 class UserRepository(GenericRepository[User, int]):
@@ -43,4 +47,98 @@ class UserRepository(GenericRepository[User, int]):
         return await super().get_by_id(id)
 
     async def get_all(self) -> Sequence[User]:
-        return (await self._session.scalars(select(User))).fetchall()
+        return (
+            await self._session.scalars(select(User).where(User.deleted_at.is_(None)))
+        ).fetchall()
+
+    async def get_balance(self, user_id: int) -> Optional[Decimal]:
+        """
+        Get the user's balance: the balance folded into `users.balance`
+        plus the journal tail, i.e. the transactions not folded yet, see
+        `Transaction.folded`. The tail is found with a partial index and
+        is kept short by the journal compactor.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :return: balance or `None` if the user doesn't exist
+        :rtype: Optional[Decimal]
+        """
+        tail = (
+            select(
+                func.coalesce(
+                    func.sum(
+                        case(
+                            (
+                                Transaction.transaction_type_id
+                                == TransactionType.INCOME,
+                                Transaction.amount,
+                            ),
+                            else_=-Transaction.amount,
+                        )
+                    ),
+                    0,
+                )
+            )
+            .where(Transaction.user_id == user_id, Transaction.folded.is_(False))
+            .scalar_subquery()
+        )
+        stmt = select((User.balance + tail).label("balance")).where(
+            User.id == user_id, User.deleted_at.is_(None)
+        )
+        return (await self._session.scalars(stmt)).one_or_none()
+
+    async def mark_deleted(self, user_id: int) -> None:
+        """
+        Mark the user deleted. The row is kept until the user's data is
+        purged.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        """
+        await self._session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(deleted_at=datetime.now(timezone.utc), version=User.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_deleted_ids(self) -> Sequence[int]:
+        """
+        Get ids of the users marked deleted, from the earliest deleted one.
+
+        :return: user's telegram ids
+        :rtype: Sequence[int]
+        """
+        stmt = (
+            select(User.id)
+            .where(User.deleted_at.is_not(None))
+            .order_by(User.deleted_at, User.id)
+        )
+        return (await self._session.scalars(stmt)).fetchall()
+
+    async def apply_balance_deltas(self, deltas: Mapping[int, Decimal]) -> None:
+        """
+        Increment `balance` of many users with a single `UPDATE`.
+
+        :param deltas: mapping of user's telegram id to the balance delta
+        :type deltas: Mapping[int, Decimal]
+        """
+        if len(deltas) == 0:
+            return
+
+        rows = (
+            values(
+                column("id", Integer),
+                column("delta", Numeric(12, 2)),
+                name="deltas",
+            )
+            .data(list(deltas.items()))
+            .cte("deltas")
+        )
+
+        await self._session.execute(
+            update(User)
+            .where(User.id == rows.c.id)
+            .values(balance=User.balance + rows.c.delta, version=User.version + 1)
+            .execution_options(synchronize_session=False)
+        )
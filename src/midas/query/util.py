@@ -0,0 +1,25 @@
+from typing import Any
+from sqlalchemy import Date, cast, func, literal_column
+
+
+def get_month(created_at: Any, dialect: str) -> Any:
+    """
+    Get the SQL expression of the first day of the month `created_at`
+    falls in, in UTC, see `midas.util.dates.month_of()`.
+
+    :param created_at: timestamp column or expression
+    :type created_at: Any
+    :param dialect: name of the dialect the expression is compiled for
+    :type dialect: str
+    :return: `DATE` expression
+    :rtype: Any
+    """
+    if dialect == "postgresql":
+        return cast(
+            func.date_trunc(
+                literal_column("'month'"),
+                func.timezone(literal_column("'UTC'"), created_at),
+            ),
+            Date,
+        )
+    return func.date(created_at, literal_column("'start of month'"), type_=Date)
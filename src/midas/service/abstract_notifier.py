@@ -18,3 +18,11 @@ class AbstractNotifier(ABC):
         :type msg: str
         """
         ...
+
+    async def flush(self) -> None:
+        """
+        Wait until every notification passed to `notify()` is either
+        sent or dropped. Notifiers that send right away don't need to
+        override this method.
+        """
+        ...
@@ -0,0 +1,331 @@
+from abc import ABC, abstractmethod
+from asyncio import Server, StreamReader, StreamWriter, start_server
+from bisect import bisect_left
+from math import inf
+from threading import Lock
+from typing import Callable, Optional, override
+
+from midas.loggers import app_logger
+
+type Labels = tuple[tuple[str, str], ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if len(pairs) == 0:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metric(ABC):
+    """
+    Base class of all metrics. Every metric has a name, a help string and
+    a value for each combination of label values it was updated with.
+    """
+
+    TYPE = "untyped"
+
+    def __init__(self, name: str, help: str) -> None:
+        self.name = name
+        self.help = help
+        self._lock = Lock()
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    @abstractmethod
+    def _samples(self) -> list[str]:
+        """
+        Render the sample lines of the metric in the text exposition
+        format, without the `HELP` and `TYPE` comments.
+
+        :return: sample lines
+        :rtype: list[str]
+        """
+
+    def render(self) -> str:
+        """
+        Render the metric in Prometheus text exposition format.
+
+        :return: metric's HELP, TYPE and sample lines
+        :rtype: str
+        """
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        lines.extend(self._samples())
+        return "\n".join(lines)
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing counter. A counter may also read its value
+    from a function returning a running total at render time, see
+    `set_function()`.
+    """
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, help: str) -> None:
+        super().__init__(name, help)
+        self._values: dict[Labels, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """
+        Increment the counter.
+
+        :param amount: non-negative increment
+        :type amount: float
+        :param labels: label values of the incremented series
+        :type labels: str
+        """
+        if amount < 0:
+            raise ValueError("Counters can only be incremented")
+
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Read the counter value from `function` whenever the metric is
+        rendered. The function must return a total that never decreases,
+        except when the counted source is reset.
+
+        :param function: function returning the current total
+        :type function: Callable[[], float]
+        """
+        self._function = function
+
+    def get(self, **labels: str) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._values.get(self._key(labels), 0)
+
+    @override
+    def _samples(self) -> list[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self._function())}"]
+
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Gauge(Metric):
+    """
+    Value that can go up and down. A gauge may also read its value from
+    a function at render time, see `set_function()`.
+    """
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, help: str) -> None:
+        super().__init__(name, help)
+        self._values: dict[Labels, float] = {}
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Read the gauge value from `function` whenever the metric is
+        rendered.
+
+        :param function: function returning the current value
+        :type function: Callable[[], float]
+        """
+        self._function = function
+
+    def get(self, **labels: str) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._values.get(self._key(labels), 0)
+
+    @override
+    def _samples(self) -> list[str]:
+        if self._function is not None:
+            return [f"{self.name} {_format_value(self._function())}"]
+
+        return [
+            f"{self.name}{_format_labels(labels)} {_format_value(value)}"
+            for labels, value in self._values.items()
+        ]
+
+
+class Histogram(Metric):
+    """
+    Histogram of observed values with cumulative buckets.
+    """
+
+    TYPE = "histogram"
+    DEFAULT_BUCKETS = (
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+        30,
+        60,
+        300,
+    )
+
+    def __init__(
+        self, name: str, help: str, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help)
+        self._buckets = tuple(sorted(buckets)) + (inf,)
+        self._counts: dict[Labels, list[int]] = {}
+        self._sums: dict[Labels, float] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        """
+        Observe a value, e.g. duration of an operation in seconds.
+
+        :param value: observed value
+        :type value: float
+        :param labels: label values of the observed series
+        :type labels: str
+        """
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * len(self._buckets))
+            counts[bisect_left(self._buckets, value)] += 1
+            self._sums[key] = self._sums.get(key, 0) + value
+
+    def get_count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), []))
+
+    @override
+    def _samples(self) -> list[str]:
+        lines = []
+        for labels, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip(self._buckets, counts):
+                cumulative += count
+                le = ("le", _format_value(bound))
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}"
+                )
+            lines.append(
+                f"{self.name}_sum{_format_labels(labels)} {_format_value(self._sums[labels])}"
+            )
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of application metrics. Metrics are registered once, usually
+    at module level next to the code that updates them, and rendered
+    together in Prometheus text exposition format.
+
+    :example:
+    >>> EVENTS = registry.counter("midas_events_processed_total", "Events run")
+    >>> EVENTS.inc(10)
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def _register[M: Metric](self, cls: type[M], name: str, *args) -> M:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = cls(name, *args)
+            self._metrics[name] = metric
+        elif not isinstance(metric, cls):
+            raise ValueError(f"Metric {name} is already registered as {metric.TYPE}")
+        return metric
+
+    def counter(self, name: str, help: str) -> Counter:
+        return self._register(Counter, name, help)
+
+    def gauge(self, name: str, help: str) -> Gauge:
+        return self._register(Gauge, name, help)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        buckets: tuple[float, ...] = Histogram.DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram, name, help, buckets)
+
+    def render(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        :return: exposition text
+        :rtype: str
+        """
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+async def _handle_request(reader: StreamReader, writer: StreamWriter) -> None:
+    try:
+        request_line = await reader.readline()
+        # skip the headers, the request body is never used
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[0] == "GET" and parts[1] == "/metrics":
+            status = "200 OK"
+            body = registry.render().encode()
+        else:
+            status = "404 Not Found"
+            body = b"Not Found\n"
+
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                "Content-Type: text/plain; version=0.0.4; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + body
+        )
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def start_metrics_server(host: str = "127.0.0.1", port: int = 9100) -> Server:
+    """
+    Start a small HTTP listener serving `GET /metrics` in Prometheus text
+    exposition format.
+
+    :param host: interface to listen on. Keep it local unless the port
+    is protected otherwise.
+    :type host: str
+    :param port: port to listen on
+    :type port: int
+    :return: running server
+    :rtype: Server
+    """
+    server = await start_server(_handle_request, host, port)
+    app_logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return server
@@ -0,0 +1,83 @@
+from asyncio import Event, wait_for
+from time import perf_counter
+
+from midas.loggers import app_logger
+
+from midas.service.abstract_notifier import AbstractNotifier
+from midas.service.metrics import registry
+from midas.usecase.notification import DispatchNotificationsUsecase
+
+_DISPATCHED = registry.counter(
+    "midas_outbox_dispatched_total", "Number of notifications taken from the outbox"
+)
+_DISPATCH_FAILURES = registry.counter(
+    "midas_outbox_dispatch_failures_total", "Number of failed outbox batches"
+)
+_DISPATCH_TIME = registry.histogram(
+    "midas_outbox_dispatch_seconds",
+    "Seconds spent sending one outbox batch, including the database work",
+)
+
+
+class OutboxDispatcher:
+    """
+    Notifications outbox dispatcher. Drains the `notifications_outbox`
+    table in batches through a notifier.
+
+    Call `wake()` after committing new notifications to have them sent
+    right away. Otherwise the outbox is checked every `poll_interval`
+    seconds, which also picks up notifications written by other processes.
+    """
+
+    def __init__(self, batch_size: int = 100, poll_interval: float = 60) -> None:
+        """
+        Create new outbox dispatcher.
+
+        :param batch_size: number of notifications claimed, sent and
+        deleted at once.
+        :type batch_size: int
+        :param poll_interval: maximal number of seconds between two checks
+        of the outbox.
+        :type poll_interval: float
+        """
+        self._BATCH_SIZE = batch_size
+        self._POLL_INTERVAL = poll_interval
+        self._wakeup = Event()
+
+    def wake(self) -> None:
+        """
+        Make the dispatcher check the outbox right away.
+        """
+        self._wakeup.set()
+
+    async def loop(self, notifier: AbstractNotifier) -> None:
+        """
+        Dispatch the notifications as they appear. This coroutine never
+        returns.
+
+        :param notifier: notifier used to send the notifications
+        :type notifier: AbstractNotifier
+        """
+        while True:
+            self._wakeup.clear()
+            start = perf_counter()
+            try:
+                # every batch runs in a session of its own
+                usecase = DispatchNotificationsUsecase()
+                dispatched = await usecase.execute(notifier, self._BATCH_SIZE)
+            except Exception:
+                _DISPATCH_FAILURES.inc()
+                app_logger.exception("Failed to dispatch notifications")
+                dispatched = 0
+
+            if dispatched > 0:
+                _DISPATCHED.inc(dispatched)
+                _DISPATCH_TIME.observe(perf_counter() - start)
+
+            if dispatched == self._BATCH_SIZE:
+                continue
+
+            try:
+                await wait_for(self._wakeup.wait(), self._POLL_INTERVAL)
+            except TimeoutError:
+                pass
@@ -0,0 +1,94 @@
+from asyncio import sleep
+from typing import Optional
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from midas.loggers import app_logger
+
+from midas.db.pool import InstrumentedPool, PoolStats
+from midas.service.metrics import registry
+
+_POOL_SIZE = registry.gauge(
+    "midas_db_pool_size", "Number of connections the pool keeps open"
+)
+_CHECKED_OUT = registry.gauge(
+    "midas_db_pool_checked_out", "Number of connections currently in use"
+)
+_OVERFLOW = registry.gauge(
+    "midas_db_pool_overflow", "Number of connections opened above the pool size"
+)
+_CHECKOUTS = registry.counter(
+    "midas_db_pool_checkouts_total", "Number of connections handed out by the pool"
+)
+_WAIT_TOTAL = registry.counter(
+    "midas_db_pool_wait_seconds_total",
+    "Total number of seconds spent waiting for a connection",
+)
+_WAIT_MAX = registry.gauge(
+    "midas_db_pool_wait_seconds_max",
+    "Longest number of seconds spent waiting for a connection",
+)
+
+
+class PoolMonitor:
+    """
+    Connection pool monitor. Exposes the statistics of the engine's
+    `InstrumentedPool` to the metrics endpoint and logs them periodically.
+    """
+
+    def __init__(self, engine: AsyncEngine, interval: float = 300) -> None:
+        """
+        Create new pool monitor.
+
+        :param engine: engine whose pool is monitored
+        :type engine: AsyncEngine
+        :param interval: number of seconds between two log records
+        :type interval: float
+        """
+        self._engine = engine
+        self._INTERVAL = interval
+
+        _POOL_SIZE.set_function(lambda: self._get_value("size"))
+        _CHECKED_OUT.set_function(lambda: self._get_value("checked_out"))
+        _OVERFLOW.set_function(lambda: self._get_value("overflow"))
+        _CHECKOUTS.set_function(lambda: self._get_value("checkouts"))
+        _WAIT_TOTAL.set_function(lambda: self._get_value("total_wait"))
+        _WAIT_MAX.set_function(lambda: self._get_value("max_wait"))
+
+    def get_stats(self) -> Optional[PoolStats]:
+        """
+        Get statistics of the engine's pool.
+
+        :return: pool statistics or `None` if the engine doesn't use
+        `InstrumentedPool`.
+        :rtype: Optional[PoolStats]
+        """
+        # the pool is replaced when the engine is disposed
+        pool = self._engine.pool
+        if not isinstance(pool, InstrumentedPool):
+            return None
+        return pool.get_stats()
+
+    def _get_value(self, name: str) -> float:
+        stats = self.get_stats()
+        return getattr(stats, name) if stats is not None else 0
+
+    def log_stats(self) -> None:
+        stats = self.get_stats()
+        if stats is None:
+            return
+
+        app_logger.info(
+            f"Connection pool: {stats.checked_out}/{stats.size} checked out, "
+            f"{stats.overflow} overflow, {stats.checkouts} checkouts, "
+            f"average wait {round(stats.average_wait * 1000, 3)} ms, "
+            f"max wait {round(stats.max_wait * 1000, 3)} ms"
+        )
+
+    async def loop(self) -> None:
+        """
+        Log the pool statistics every `interval` seconds. This coroutine
+        never returns.
+        """
+        while True:
+            await sleep(self._INTERVAL)
+            self.log_stats()
@@ -0,0 +1,241 @@
+from abc import ABC, abstractmethod
+from asyncio import Queue, Task, create_task, sleep
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Optional, override
+
+from midas.loggers import app_logger
+
+from midas.service.abstract_notifier import AbstractNotifier
+from midas.service.metrics import registry
+from midas.service.rate_limiting import KeyedRateLimiter, TokenBucket
+
+_QUEUE_DEPTH = registry.gauge(
+    "midas_notifier_queue_depth", "Number of notifications waiting to be sent"
+)
+_DELIVERED = registry.counter(
+    "midas_notifications_delivered_total", "Number of delivered notifications"
+)
+_FAILED = registry.counter(
+    "midas_notifications_failed_total", "Number of dropped notifications"
+)
+_RETRIED = registry.counter(
+    "midas_notifications_retried_total", "Number of retried notification sends"
+)
+_LATENCY = registry.histogram(
+    "midas_notification_latency_seconds",
+    "Seconds between enqueueing and delivering a notification",
+)
+
+
+@dataclass
+class Delivery:
+    user_id: int
+    msg: str
+    enqueued_at: float = field(default_factory=monotonic)
+    attempts: int = 0
+
+
+@dataclass
+class DeliveryStats:
+    """
+    Counters of the delivery queue. Latency is measured from the moment
+    the message is enqueued until it's accepted by the platform.
+    """
+
+    enqueued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    retried: int = 0
+    total_latency: float = 0
+    max_latency: float = 0
+
+    @property
+    def average_latency(self) -> float:
+        return self.total_latency / self.delivered if self.delivered else 0
+
+
+class QueuedNotifier(AbstractNotifier, ABC):
+    """
+    Notifier backed by an asyncio delivery queue.
+
+    `notify()` only enqueues the message, while a pool of workers sends
+    the messages respecting a global rate (token bucket) and a per-user
+    rate. Failed sends are retried with the delay returned by
+    `_get_retry_delay()`, when `_get_pause()` returns a delay all workers
+    stop sending for that long.
+
+    The rate limits are per process. When several processes send
+    messages, pass each one its share of the global rate via `processes`.
+
+    Concrete notifiers implement the platform specific `_send()` and
+    `_get_retry_delay()` methods.
+    """
+
+    def __init__(
+        self,
+        workers: int = 8,
+        global_rate: float = 25,
+        chat_interval: float = 1,
+        max_attempts: int = 5,
+        processes: int = 1,
+    ) -> None:
+        """
+        Create new queued notifier.
+
+        :param workers: number of concurrent send workers
+        :type workers: int
+        :param global_rate: messages per second sent across all users
+        :type global_rate: float
+        :param chat_interval: minimal number of seconds between two messages
+        sent to the same user
+        :type chat_interval: float
+        :param max_attempts: attempts per message before it's dropped
+        :type max_attempts: int
+        :param processes: number of processes sending messages, each one
+        sends `global_rate / processes` messages per second
+        :type processes: int
+        """
+        self._WORKERS = workers
+        self._MAX_ATTEMPTS = max_attempts
+        self._queue: Queue[Delivery] = Queue()
+        rate = global_rate / max(1, processes)
+        self._bucket = TokenBucket(rate, max(1, int(rate)))
+        self._chat_limiter = KeyedRateLimiter(chat_interval)
+        self._workers: list[Task] = []
+        self.stats = DeliveryStats()
+        _QUEUE_DEPTH.set_function(lambda: self.depth)
+
+    @abstractmethod
+    async def _send(self, user_id: int, msg: str) -> None:
+        """
+        Send the message right away.
+
+        :param user_id: user's id.
+        :type user_id: int
+        :param msg: notification message
+        :type msg: str
+        """
+        ...
+
+    @abstractmethod
+    def _get_retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """
+        Decide what to do with a message that failed to be sent.
+
+        :param error: exception raised by `_send()`
+        :type error: Exception
+        :param attempt: number of the failed attempt, starting from 1
+        :type attempt: int
+        :return: seconds to wait before the next attempt or `None` if the
+        message must be dropped.
+        :rtype: Optional[float]
+        """
+        ...
+
+    def _get_pause(self, error: Exception) -> Optional[float]:
+        """
+        Decide whether a failed send means that all sending must stop for
+        a while, e.g. the platform asked to slow down.
+
+        :param error: exception raised by `_send()`
+        :type error: Exception
+        :return: seconds to stop sending for or `None` to go on.
+        :rtype: Optional[float]
+        """
+        return None
+
+    @property
+    def depth(self) -> int:
+        """
+        Number of messages waiting in the queue.
+        """
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """
+        Start the send workers. Calling this method more than once has
+        no effect.
+        """
+        if self._workers:
+            return
+
+        self._workers = [create_task(self._work()) for _ in range(self._WORKERS)]
+
+    async def join(self) -> None:
+        """
+        Wait until every enqueued message is either delivered or dropped.
+        """
+        await self._queue.join()
+
+    @override
+    async def flush(self) -> None:
+        await self.join()
+
+    async def stop(self) -> None:
+        """
+        Deliver the remaining messages and stop the workers.
+        """
+        if self._workers:
+            await self.join()
+
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+
+    @override
+    async def notify(self, user_id: int, msg: str) -> None:
+        """
+        Enqueue a notification. The method returns right after the
+        message is put in the queue, not when it's delivered.
+
+        :param user_id: user's id.
+        :type user_id: int
+        :param msg: notification message
+        :type msg: str
+        """
+        self.start()
+        self._queue.put_nowait(Delivery(user_id, msg))
+        self.stats.enqueued += 1
+
+    async def _work(self) -> None:
+        while True:
+            delivery = await self._queue.get()
+            try:
+                await self._deliver(delivery)
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, delivery: Delivery) -> None:
+        while True:
+            delivery.attempts += 1
+
+            await self._chat_limiter.acquire(delivery.user_id)
+            await self._bucket.acquire()
+            try:
+                await self._send(delivery.user_id, delivery.msg)
+            except Exception as e:
+                retry_in = self._get_retry_delay(e, delivery.attempts)
+                pause = self._get_pause(e)
+                if pause is not None:
+                    self._bucket.pause(pause)
+            else:
+                latency = monotonic() - delivery.enqueued_at
+                self.stats.delivered += 1
+                self.stats.total_latency += latency
+                self.stats.max_latency = max(self.stats.max_latency, latency)
+                _DELIVERED.inc()
+                _LATENCY.observe(latency)
+                return
+
+            if retry_in is None or delivery.attempts >= self._MAX_ATTEMPTS:
+                self.stats.failed += 1
+                _FAILED.inc()
+                app_logger.warning(
+                    f"Dropped notification to {delivery.user_id} after {delivery.attempts} attempts"
+                )
+                return
+
+            self.stats.retried += 1
+            _RETRIED.inc()
+            await sleep(retry_in)
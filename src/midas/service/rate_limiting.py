@@ -0,0 +1,116 @@
+from asyncio import sleep
+from time import monotonic
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter. The bucket holds at most `capacity` tokens
+    and is refilled with `rate` tokens per second. Each `acquire()` call
+    takes one token, waiting for it if the bucket is empty.
+
+    Tokens are reserved before sleeping, so concurrent coroutines waiting
+    on the same bucket are served in order and never exceed the rate.
+    `pause()` stops handing out tokens for a while, e.g. when the platform
+    asks to slow down.
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        """
+        Create new token bucket.
+
+        :param rate: tokens added per second
+        :type rate: float
+        :param capacity: maximum number of tokens (burst size)
+        :type capacity: int
+        """
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        # the refill starts from here, it's in the future while paused
+        self._updated_at = monotonic()
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated_at:
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+
+    def _reserve(self) -> float:
+        """
+        Take one token and return the number of seconds to wait until
+        the token is actually available.
+        """
+        now = monotonic()
+        self._refill(now)
+        self._tokens -= 1
+
+        delay = self._updated_at - now
+        if self._tokens < 0:
+            delay += -self._tokens / self._rate
+        return delay
+
+    def pause(self, seconds: float) -> None:
+        """
+        Hand out no tokens for `seconds`. The bucket is drained, so the
+        waiting coroutines don't send a burst once the pause is over.
+
+        :param seconds: length of the pause
+        :type seconds: float
+        """
+        now = monotonic()
+        self._refill(now)
+        if now + seconds > self._updated_at:
+            self._tokens = min(self._tokens, 0)
+            self._updated_at = now + seconds
+
+    async def acquire(self) -> None:
+        """
+        Wait until a token is available and take it.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await sleep(delay)
+        # the token might have been reserved before a pause
+        while (delay := self._updated_at - monotonic()) > 0:
+            await sleep(delay)
+
+
+class KeyedRateLimiter:
+    """
+    Per-key rate limiter. Guarantees at least `interval` seconds between
+    two acquisitions for the same key, e.g. two messages sent to the same
+    chat.
+    """
+
+    def __init__(self, interval: float) -> None:
+        """
+        Create new keyed rate limiter.
+
+        :param interval: minimal number of seconds between acquisitions
+        for the same key
+        :type interval: float
+        """
+        self._interval = interval
+        self._next_slot: dict[int, float] = {}
+
+    def _reserve(self, key: int) -> float:
+        now = monotonic()
+        # drop stale keys so the mapping doesn't grow with every chat ever seen
+        if len(self._next_slot) > 4096:
+            self._next_slot = {k: v for k, v in self._next_slot.items() if v > now}
+
+        slot = max(now, self._next_slot.get(key, now))
+        self._next_slot[key] = slot + self._interval
+        return slot - now
+
+    async def acquire(self, key: int) -> None:
+        """
+        Wait until the next slot for `key` and take it.
+
+        :param key: rate limited key
+        :type key: int
+        """
+        delay = self._reserve(key)
+        if delay > 0:
+            await sleep(delay)
@@ -0,0 +1,105 @@
+from collections import OrderedDict
+from copy import deepcopy
+from datetime import date
+from typing import Any, Optional
+
+
+class PeriodReportCache:
+    """
+    Period report cache. This object keeps the reports of closed periods
+    generated by `GetPeriodReportUsecase`, so asking for the same range
+    again doesn't query the transactions.
+
+    A closed period still changes when older transactions are imported,
+    edited or deleted, the usecases doing that call `invalidate()`. The
+    reports of a user are tagged with the user's generation, which
+    `invalidate()` bumps, so a report computed before the change is
+    neither returned nor stored afterwards. The least recently used
+    reports are evicted once `max_size` reports are cached. The reports
+    are copied in and out, so a caller changing its report doesn't change
+    the cached one.
+
+    The cache and the generations are kept in the memory of a single
+    process, `invalidate()` doesn't reach the caches of other processes.
+    Edits, imports and deletions have to run in the bot process serving
+    `/report`. The events run by `poetry run worker` processes only post
+    into the current period, which isn't cached, moving any usecase
+    calling `invalidate()` to a worker needs a shared cache.
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        self._max_size = max_size
+        self._cache: OrderedDict[tuple[int, date, date], tuple[int, Any]] = (
+            OrderedDict()
+        )
+        self._generations: dict[int, int] = {}
+
+    async def generation(self, user_id: int) -> int:
+        """
+        Get the generation of the user's reports. Pass it to `store()`
+        along with the report computed after calling this method.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :return: current generation
+        :rtype: int
+        """
+        return self._generations.get(user_id, 0)
+
+    async def get(self, user_id: int, start: date, end: date) -> Optional[Any]:
+        """
+        Get cached report of the user over the range.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param start: first day of the range
+        :type start: date
+        :param end: last day of the range
+        :type end: date
+        :return: cached report, `None` if it's not cached or outdated.
+        :rtype: Optional[Any]
+        """
+        key = (user_id, start, end)
+        cached = self._cache.get(key)
+        if cached is None or cached[0] != await self.generation(user_id):
+            return None
+
+        self._cache.move_to_end(key)
+        return deepcopy(cached[1])
+
+    async def store(
+        self, user_id: int, start: date, end: date, report: Any, generation: int
+    ) -> None:
+        """
+        Cache report of the user over the range, unless the user's reports
+        were invalidated since `generation` was taken.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param start: first day of the range
+        :type start: date
+        :param end: last day of the range
+        :type end: date
+        :param report: report to cache
+        :type report: Any
+        :param generation: generation taken before computing the report
+        :type generation: int
+        """
+        if generation != await self.generation(user_id):
+            return
+
+        key = (user_id, start, end)
+        self._cache[key] = (generation, deepcopy(report))
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Invalidate all cached reports of the user. The outdated reports
+        are left to be evicted.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        """
+        self._generations[user_id] = await self.generation(user_id) + 1
@@ -1,4 +1,13 @@
 from .event_handler import EventHandler
+from .journal_compaction_handler import JournalCompactionHandler
+from .partition_handler import PartitionHandler
 from .report_handler import ReportHandler
+from .user_purge_handler import UserPurgeHandler
 
-__all__ = ("EventHandler", "ReportHandler")
+__all__ = (
+    "EventHandler",
+    "JournalCompactionHandler",
+    "PartitionHandler",
+    "ReportHandler",
+    "UserPurgeHandler",
+)
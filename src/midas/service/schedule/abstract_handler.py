@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
 
 from midas.service.abstract_notifier import AbstractNotifier
 
@@ -8,24 +10,45 @@ class AbstractHandler(ABC):
     Handlers are supposed to be usecases of main loop.
     The handlers pack the code into a single testable
     unit.
+
+    Handlers don't sleep on their own: they are run by the
+    `midas.service.scheduler.Scheduler` when the deadline returned
+    by `get_next_run_at()` is reached.
     """
 
-    def __init__(self, notifier: AbstractNotifier, update_interval: int = 600) -> None:
+    def __init__(
+        self, notifier: Optional[AbstractNotifier] = None, update_interval: int = 600
+    ) -> None:
         """
         Create new event handler.
 
         :param notifier: concrete notifier implementation of where you want to
-        send notifications.
-        :type notifier: AbstractNotifier
-        :param update_interval: seconds interval between updates
+        send notifications, `None` if the handler doesn't notify users.
+        :type notifier: Optional[AbstractNotifier]
+        :param update_interval: maximal number of seconds between two checks
+        of the handler's next deadline.
         :type update_interval: int
         """
         self._notifier = notifier
         self._UPDATE_INTERVAL = update_interval
 
+    @property
+    def update_interval(self) -> int:
+        return self._UPDATE_INTERVAL
+
+    @abstractmethod
+    async def get_next_run_at(self) -> Optional[datetime]:
+        """
+        Get the moment the handler has to be run next.
+
+        :return: next deadline or `None` if there's nothing to do.
+        :rtype: Optional[datetime]
+        """
+        ...
+
     @abstractmethod
-    async def loop(self) -> None:
+    async def run(self) -> None:
         """
-        Execute handler's block of code after sleeping.
+        Execute handler's block of code once.
         """
         ...
@@ -1,56 +1,145 @@
-from asyncio import sleep
+from asyncio import gather
+from datetime import date, datetime, time, timedelta
 from time import perf_counter
-from typing import Any, override
+from typing import AsyncIterable, Optional, override
 
 from midas.loggers import app_logger
 
 from midas.db.schemas.event import Event
-from midas.service.abstract_notifier import AbstractNotifier
+from midas.service.metrics import registry
 from midas.service.schedule.abstract_handler import AbstractHandler
-from midas.usecase.event import GetUpcomingEventsUsecase, UpdateEventAfterRunUsecase
-from midas.usecase.transaction import CreateTransactionUsecase
+from midas.usecase.event import (
+    GetNextEventRunUsecase,
+    RunDueEventsUsecase,
+    RunEventsBatchUsecase,
+    StreamUpcomingEventsUsecase,
+)
+
+_EVENTS_PROCESSED = registry.counter(
+    "midas_events_processed_total", "Number of executed events"
+)
+_DB_TIME = registry.histogram(
+    "midas_event_db_seconds",
+    "Seconds spent posting events per database transaction",
+)
+_LAG = registry.gauge(
+    "midas_event_lag_seconds",
+    "Seconds between the start of the last event run and the oldest due next_run_on",
+)
 
 
 class EventHandler(AbstractHandler):
     @override
-    def __init__(self, notifier: AbstractNotifier, update_interval: int = 3600) -> None:
-        super().__init__(notifier, update_interval)
-        self._get_events = GetUpcomingEventsUsecase()
-        self._update_event = UpdateEventAfterRunUsecase()
-        self._create_transaction = CreateTransactionUsecase()
+    def __init__(
+        self,
+        update_interval: int = 3600,
+        chunk_size: int = 500,
+        claim: bool = False,
+        claimers: int = 1,
+    ) -> None:
+        """
+        Create new event handler. The due events are posted in chunks, the
+        notifications are written to the notifications outbox together
+        with the postings and sent by the `OutboxDispatcher`.
 
-    def _event_to_transaction_scheme(self, event: Event) -> dict[str, Any]:
-        scheme = {
-            "user_id": event.user_id,
-            "transaction_type": event.transaction_type_id,
-            "title": event.title,
-            "amount": event.amount,
-        }
+        :param update_interval: maximal number of seconds between two checks
+        of the earliest `next_run_on`. Events created in process wake the
+        scheduler right away, this interval only bounds the delay for events
+        created elsewhere.
+        :type update_interval: int
+        :param chunk_size: number of events fetched at once and posted in
+        one database transaction.
+        :type chunk_size: int
+        :param claim: claim chunks of due events with `RunDueEventsUsecase`
+        instead of reading all of them at once. Use this mode whenever more
+        than one process handles events, claimed events are never run twice.
+        :type claim: bool
+        :param claimers: number of coroutines claiming chunks concurrently
+        when `claim` is `True`.
+        :type claimers: int
+        """
+        super().__init__(update_interval=update_interval)
+        self._claim = claim
+        self._CHUNK_SIZE = chunk_size
+        self._CLAIMERS = claimers
+        self._last_run_on: Optional[date] = None
 
-        if event.description:
-            scheme["description"] = event.description
+    def _render(self, event: Event) -> str:
+        return f"New event: {event.title}"
 
-        return scheme
+    async def _run_chunk(self, chunk: list[Event]) -> int:
+        start = perf_counter()
+        executed = len(await RunEventsBatchUsecase().execute(chunk, self._render))
+        _DB_TIME.observe(perf_counter() - start)
+        _EVENTS_PROCESSED.inc(executed)
+        return executed
 
-    @override
-    async def loop(self) -> None:
+    async def _run_in_batches(self, events: AsyncIterable[Event]) -> int:
+        executed = 0
+        chunk: list[Event] = []
+        async for event in events:
+            chunk.append(event)
+            if len(chunk) == self._CHUNK_SIZE:
+                executed += await self._run_chunk(chunk)
+                chunk = []
+
+        if len(chunk) > 0:
+            executed += await self._run_chunk(chunk)
+        return executed
+
+    async def _claim_and_run(self) -> int:
+        # every claimer needs a session of its own
+        run_due_events = RunDueEventsUsecase()
+        executed = 0
         while True:
-            app_logger.info("Started execution of event updates")
             start = perf_counter()
+            chunk_executed = await run_due_events.execute(
+                self._CHUNK_SIZE, self._render
+            )
+            if len(chunk_executed) == 0:
+                return executed
+
+            _DB_TIME.observe(perf_counter() - start)
+            _EVENTS_PROCESSED.inc(len(chunk_executed))
+            executed += len(chunk_executed)
 
-            events = await self._get_events.execute()
-            for event in events:
-                data = self._event_to_transaction_scheme(event)
-                await self._create_transaction.execute(**data)
+    async def _run_claiming(self) -> int:
+        return sum(
+            await gather(*(self._claim_and_run() for _ in range(self._CLAIMERS)))
+        )
 
-                if event.user.send_notifications:
-                    await self._notifier.notify(
-                        event.user_id, f"New event: {event.title}"
-                    )
+    @override
+    async def get_next_run_at(self) -> Optional[datetime]:
+        next_run_on = await GetNextEventRunUsecase().execute()
+        if next_run_on is None:
+            return None
 
-                await self._update_event.execute(event)
+        # events that couldn't be run today (e.g. skipped ones) are retried
+        # tomorrow instead of making the scheduler spin
+        if self._last_run_on is not None and next_run_on <= self._last_run_on:
+            next_run_on = self._last_run_on + timedelta(days=1)
+        return datetime.combine(next_run_on, time.min)
 
-            app_logger.info(
-                f"Finished updating {len(events)} events in {round(perf_counter() - start, 3)} seconds"
-            )
-            await sleep(self._UPDATE_INTERVAL)
+    @override
+    async def run(self) -> None:
+        app_logger.info("Started execution of event updates")
+        start = perf_counter()
+        today = date.today()
+
+        oldest = await GetNextEventRunUsecase().execute()
+        if oldest is not None:
+            lag = datetime.now() - datetime.combine(oldest, time.min)
+            _LAG.set(max(lag.total_seconds(), 0))
+
+        if self._claim:
+            executed = await self._run_claiming()
+        else:
+            events = StreamUpcomingEventsUsecase().execute(self._CHUNK_SIZE)
+            executed = await self._run_in_batches(events)
+        self._last_run_on = today
+
+        elapsed = perf_counter() - start
+        rate = executed / elapsed if elapsed > 0 else 0
+        app_logger.info(
+            f"Finished updating {executed} events in {round(elapsed, 3)} seconds ({round(rate, 1)} events/sec)"
+        )
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from typing import Optional, override
+
+from midas.loggers import app_logger
+
+from midas.service.abstract_notifier import AbstractNotifier
+from midas.service.metrics import registry
+from midas.service.schedule.abstract_handler import AbstractHandler
+from midas.usecase.transaction import CompactJournalUsecase
+
+_FOLDED = registry.counter(
+    "midas_journal_folded_total",
+    "Number of journal transactions folded into the balances",
+)
+
+
+class JournalCompactionHandler(AbstractHandler):
+    @override
+    def __init__(
+        self,
+        notifier: AbstractNotifier,
+        update_interval: int = 60,
+        batch_size: int = 10000,
+        max_batches: int = 10,
+    ) -> None:
+        """
+        Create new journal compaction handler. The handler folds the
+        journal tail into the account amounts and the balances every
+        `update_interval` seconds, and right after the previous run while
+        it didn't fold the whole tail.
+
+        :param notifier: unused, the handler doesn't notify users
+        :type notifier: AbstractNotifier
+        :param update_interval: number of seconds between two runs when
+        the tail was folded completely.
+        :type update_interval: int
+        :param batch_size: maximal number of transactions folded in one
+        transaction
+        :type batch_size: int
+        :param max_batches: maximal number of batches in one run, so the
+        other jobs aren't held up by a long tail.
+        :type max_batches: int
+        """
+        super().__init__(notifier, update_interval)
+        self._BATCH_SIZE = batch_size
+        self._MAX_BATCHES = max_batches
+        self._next_run_at = datetime.now()
+
+    @override
+    async def get_next_run_at(self) -> Optional[datetime]:
+        return self._next_run_at
+
+    @override
+    async def run(self) -> None:
+        folded = await CompactJournalUsecase().execute(
+            self._BATCH_SIZE, self._MAX_BATCHES
+        )
+
+        _FOLDED.inc(folded)
+        if folded > 0:
+            app_logger.info(f"Folded {folded} journal transactions")
+
+        self._next_run_at = datetime.now()
+        if folded < self._BATCH_SIZE * self._MAX_BATCHES:
+            self._next_run_at += timedelta(seconds=self.update_interval)
@@ -0,0 +1,45 @@
+from datetime import date, datetime, time, timedelta
+from typing import Optional, override
+
+from midas.loggers import app_logger
+
+from midas.service.schedule.abstract_handler import AbstractHandler
+from midas.usecase.transaction import CreateTransactionPartitionsUsecase
+
+
+class PartitionHandler(AbstractHandler):
+    @override
+    def __init__(
+        self,
+        update_interval: int = 3600 * 24,
+        months_ahead: int = 3,
+    ) -> None:
+        """
+        Create new partition handler. The handler creates the upcoming
+        monthly partitions of `transactions` once a day, starting right
+        away.
+
+        :param update_interval: maximal number of seconds between two
+        checks of the next deadline.
+        :type update_interval: int
+        :param months_ahead: number of months after the current one that
+        must have a partition.
+        :type months_ahead: int
+        """
+        super().__init__(update_interval=update_interval)
+        self._MONTHS_AHEAD = months_ahead
+        self._last_run_on: Optional[date] = None
+
+    @override
+    async def get_next_run_at(self) -> Optional[datetime]:
+        if self._last_run_on != date.today():
+            return datetime.now()
+        return datetime.combine(date.today() + timedelta(days=1), time.min)
+
+    @override
+    async def run(self) -> None:
+        created = await CreateTransactionPartitionsUsecase().execute(self._MONTHS_AHEAD)
+        self._last_run_on = date.today()
+
+        if len(created) > 0:
+            app_logger.info(f"Created transaction partitions: {', '.join(created)}")
@@ -1,26 +1,41 @@
-from asyncio import sleep
-from calendar import monthrange
-from datetime import date
+from datetime import date, datetime, time, timezone
 from time import perf_counter
-from typing import Any, override
+from typing import Any, Optional, override
 
 from midas.loggers import app_logger
 
-from midas.service.abstract_notifier import AbstractNotifier
+from midas.service.metrics import registry
 from midas.service.schedule.abstract_handler import AbstractHandler
-from midas.usecase.report import GenerateReportUsecase
-from midas.usecase.user import GetAllUsersUsecase
+from midas.usecase.report import GenerateAllReportsUsecase, UserReport
+from midas.util.dates import month_of, next_month, previous_month
 from midas.util.enums import Currency, TransactionType
 
+_REPORTS_GENERATED = registry.counter(
+    "midas_reports_generated_total", "Number of generated monthly reports"
+)
+_REPORT_RUN_TIME = registry.histogram(
+    "midas_report_run_seconds",
+    "Seconds spent generating all monthly reports",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600),
+)
+
 
 class ReportHandler(AbstractHandler):
     @override
-    def __init__(
-        self, notifier: AbstractNotifier, update_interval: int = 3600 * 24
-    ) -> None:
-        super().__init__(notifier, update_interval)
-        self._generate_report = GenerateReportUsecase()
-        self._get_users = GetAllUsersUsecase()
+    def __init__(self, update_interval: int = 3600 * 24) -> None:
+        """
+        Create new report handler. The handler reports the previous month
+        once it's closed, i.e. on the 1st at midnight UTC, so the postings
+        of its last day are included. A month missed while the bot was
+        down is reported on the next start, the users already reported
+        are skipped.
+
+        :param update_interval: maximal number of seconds between two
+        checks of the next deadline.
+        :type update_interval: int
+        """
+        super().__init__(update_interval=update_interval)
+        self._last_period: Optional[date] = None
 
     def _generate_notifier_message(
         self, report: dict[str, Any], currency: Currency
@@ -36,35 +51,37 @@ class ReportHandler(AbstractHandler):
         msg += f"\nOverall monthly balance: {currency.name} {report["result"]}"
         return msg
 
-    @override
-    async def loop(self) -> None:
-        while True:
-            app_logger.info("Started monthly report generation.")
-            start = perf_counter()
+    def _render(self, user_report: UserReport) -> str:
+        return self._generate_notifier_message(user_report.report, user_report.currency)
 
-            today = date.today()
-            last_month_day = monthrange(today.year, today.month)[1]
-            if today.day != last_month_day:
-                app_logger.info(
-                    f"Finished report generation too soon because {today} is not the end of the month."
-                )
-                await sleep(self._UPDATE_INTERVAL)
-                continue
+    def _get_closed_period(self) -> date:
+        return previous_month(month_of(datetime.now(timezone.utc)))
 
-            reports_generated = 0
-            users = await self._get_users.execute()
-            for user in users:
-                report = await self._generate_report.execute(user.id)
+    @override
+    async def get_next_run_at(self) -> Optional[datetime]:
+        if self._last_period != self._get_closed_period():
+            return datetime.now()
 
-                if user.send_notifications:
-                    msg = self._generate_notifier_message(
-                        report, Currency(user.currency_id)
-                    )
-                    await self._notifier.notify(user.id, msg)
+        # the scheduler works with naive local times
+        month_start = datetime.combine(
+            next_month(month_of(datetime.now(timezone.utc))), time.min, timezone.utc
+        )
+        return month_start.astimezone().replace(tzinfo=None)
 
-                reports_generated += 1
+    @override
+    async def run(self) -> None:
+        app_logger.info("Started monthly report generation.")
+        start = perf_counter()
+
+        period = self._get_closed_period()
+        reports_generated = await GenerateAllReportsUsecase().execute(
+            self._render, period
+        )
+        self._last_period = period
 
-            app_logger.info(
-                f"Finished generating {reports_generated} reports in {round(perf_counter() - start, 3)} seconds."
-            )
-            await sleep(self._UPDATE_INTERVAL)
+        elapsed = perf_counter() - start
+        _REPORTS_GENERATED.inc(reports_generated)
+        _REPORT_RUN_TIME.observe(elapsed)
+        app_logger.info(
+            f"Finished generating {reports_generated} reports in {round(elapsed, 3)} seconds."
+        )
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta
+from typing import Optional, override
+
+from midas.loggers import app_logger
+
+from midas.service.metrics import registry
+from midas.service.schedule.abstract_handler import AbstractHandler
+from midas.usecase.user import PurgeDeletedUsersUsecase
+
+_PURGED_ROWS = registry.counter(
+    "midas_user_purge_rows_total", "Number of rows of deleted users purged"
+)
+_PURGED_USERS = registry.counter(
+    "midas_user_purge_users_total", "Number of deleted users purged completely"
+)
+_PENDING_USERS = registry.gauge(
+    "midas_user_purge_pending", "Number of deleted users not purged completely"
+)
+
+
+class UserPurgeHandler(AbstractHandler):
+    @override
+    def __init__(
+        self,
+        update_interval: int = 60,
+        batch_size: int = 1000,
+        max_batches: int = 100,
+    ) -> None:
+        """
+        Create new user purge handler. The handler purges the data of
+        deleted users every `update_interval` seconds, and right after the
+        previous run while it didn't finish the purge.
+
+        :param update_interval: number of seconds between two runs when
+        there's nothing left to purge.
+        :type update_interval: int
+        :param batch_size: maximal number of rows deleted in one transaction
+        :type batch_size: int
+        :param max_batches: maximal number of batches in one run, so the
+        other jobs aren't held up by a big purge.
+        :type max_batches: int
+        """
+        super().__init__(update_interval=update_interval)
+        self._BATCH_SIZE = batch_size
+        self._MAX_BATCHES = max_batches
+        self._next_run_at = datetime.now()
+
+    @override
+    async def get_next_run_at(self) -> Optional[datetime]:
+        return self._next_run_at
+
+    @override
+    async def run(self) -> None:
+        result = await PurgeDeletedUsersUsecase().execute(
+            self._BATCH_SIZE, self._MAX_BATCHES
+        )
+
+        _PURGED_ROWS.inc(result.rows)
+        _PURGED_USERS.inc(result.users)
+        _PENDING_USERS.set(result.pending)
+        if result.rows > 0:
+            app_logger.info(
+                f"Purged {result.rows} rows of deleted users, "
+                f"{result.users} users purged, {result.pending} pending"
+            )
+
+        self._next_run_at = datetime.now()
+        if result.pending == 0:
+            self._next_run_at += timedelta(seconds=self.update_interval)
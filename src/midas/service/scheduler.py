@@ -0,0 +1,178 @@
+from asyncio import Event, wait_for
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from heapq import heappop, heappush
+from itertools import count
+from time import perf_counter
+from typing import Optional, Protocol
+
+from midas.loggers import app_logger
+
+from midas.service.metrics import registry
+
+_JOB_RUNS = registry.histogram(
+    "midas_scheduler_job_seconds", "Duration of scheduled job runs in seconds"
+)
+_JOB_FAILURES = registry.counter(
+    "midas_scheduler_job_failures_total", "Number of failed scheduled job runs"
+)
+_JOB_LAG = registry.histogram(
+    "midas_scheduler_wakeup_lag_seconds",
+    "Seconds between a job's deadline and the moment it was started",
+)
+
+
+class ScheduledJob(Protocol):
+    """
+    Job that can be run by the `Scheduler`. Schedule handlers
+    (see `midas.service.schedule`) implement this protocol.
+    """
+
+    @property
+    def update_interval(self) -> float:
+        """
+        Maximal number of seconds the scheduler sleeps before it asks
+        the job for its next deadline again.
+        """
+        ...
+
+    async def get_next_run_at(self) -> Optional[datetime]:
+        """
+        Get the moment the job is due next, `None` if there's nothing
+        to schedule.
+        """
+        ...
+
+    async def run(self) -> None:
+        """
+        Run the job once.
+        """
+        ...
+
+
+@dataclass(order=True)
+class _Entry:
+    when: datetime
+    seq: int
+    job: ScheduledJob = field(compare=False)
+    # `False` means the entry only caps the sleep and the job's deadline
+    # must be asked for again when it's reached.
+    due: bool = field(compare=False)
+
+
+class Scheduler:
+    """
+    Timer-heap scheduler. The scheduler keeps a min-heap of the jobs'
+    deadlines and sleeps exactly until the earliest one instead of
+    polling at a fixed interval.
+
+    Call `wake()` whenever a change may bring a deadline closer (e.g.
+    a new event is created), so the deadlines are recomputed right away.
+    """
+
+    def __init__(self, retry_delay: float = 60) -> None:
+        """
+        Create new scheduler.
+
+        :param retry_delay: seconds to wait before running a job again
+        after it failed.
+        :type retry_delay: float
+        """
+        self._jobs: list[ScheduledJob] = []
+        self._heap: list[_Entry] = []
+        self._seq = count()
+        self._wakeup = Event()
+        self._RETRY_DELAY = retry_delay
+
+    def add(self, job: ScheduledJob) -> None:
+        """
+        Add a job to the scheduler. The job may be added while the
+        scheduler is already running.
+
+        :param job: job to schedule
+        :type job: ScheduledJob
+        """
+        self._jobs.append(job)
+        self.wake()
+
+    def wake(self) -> None:
+        """
+        Make the scheduler recompute the deadlines of all jobs.
+        """
+        self._wakeup.set()
+
+    async def _schedule(self, job: ScheduledJob, retry: bool = False) -> None:
+        now = datetime.now()
+        cap = now + timedelta(seconds=job.update_interval)
+
+        if retry:
+            when, due = now + timedelta(seconds=self._RETRY_DELAY), True
+        else:
+            try:
+                run_at = await job.get_next_run_at()
+            except Exception:
+                app_logger.exception(f"Couldn't get the next deadline of {job!r}")
+                run_at = None
+                cap = now + timedelta(seconds=self._RETRY_DELAY)
+
+            if run_at is not None and run_at <= cap:
+                when, due = run_at, True
+            else:
+                when, due = cap, False
+
+        heappush(self._heap, _Entry(when, next(self._seq), job, due))
+
+    async def _reschedule_all(self) -> None:
+        self._wakeup.clear()
+        self._heap = []
+        for job in self._jobs:
+            await self._schedule(job)
+
+    async def _sleep_until(self, when: datetime) -> None:
+        delay = (when - datetime.now()).total_seconds()
+        if delay <= 0:
+            return
+
+        try:
+            await wait_for(self._wakeup.wait(), delay)
+        except TimeoutError:
+            pass
+
+    async def loop(self) -> None:
+        """
+        Run the jobs as they become due. This coroutine never returns.
+        """
+        await self._reschedule_all()
+        while True:
+            if len(self._heap) == 0:
+                await self._wakeup.wait()
+                await self._reschedule_all()
+                continue
+
+            await self._sleep_until(self._heap[0].when)
+            if self._wakeup.is_set():
+                await self._reschedule_all()
+                continue
+
+            entry = heappop(self._heap)
+            if not entry.due:
+                await self._schedule(entry.job)
+                continue
+
+            job_name = type(entry.job).__name__
+            lag = (datetime.now() - entry.when).total_seconds()
+            _JOB_LAG.observe(lag, job=job_name)
+            app_logger.debug(f"Running {entry.job!r} {round(lag, 3)} seconds late")
+
+            start = perf_counter()
+            try:
+                await entry.job.run()
+            except Exception:
+                _JOB_FAILURES.inc(job=job_name)
+                app_logger.exception(f"Failed to run {entry.job!r}")
+                await self._schedule(entry.job, retry=True)
+                continue
+            finally:
+                _JOB_RUNS.observe(perf_counter() - start, job=job_name)
+
+            await self._schedule(entry.job)
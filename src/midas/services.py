@@ -1,4 +1,10 @@
+from midas.service.outbox_dispatcher import OutboxDispatcher
+from midas.service.report_caching import PeriodReportCache
+from midas.service.scheduler import Scheduler
 from midas.service.user_caching import UserCacheStorage
 
 
 user_storage = UserCacheStorage()
+scheduler = Scheduler()
+outbox_dispatcher = OutboxDispatcher()
+period_report_cache = PeriodReportCache()
@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from midas.query.session import create_session
+from midas.query.session import create_session, route_read_only
 
 
 class AbstractUsecase[T](ABC):
@@ -24,18 +24,29 @@ class AbstractUsecase[T](ABC):
     >>> usecase.execute()
     """
 
+    # read-only usecases never write and may run on the read replica
+    READ_ONLY = False
+
     def __init__(self, session: Optional[AsyncSession] = None) -> None:
         """
         Initialize a new Usecase object.
 
-        Note that `session` argument is here only for testing
-        purposes and must be left blank when this class is used
-        in production.
+        `session` is the unit of work the usecase runs in: the bot
+        passes the session opened for the current update. If left
+        blank, a new session is created for the usecase. Never share
+        a session between usecases that run concurrently.
+
+        `READ_ONLY` usecases run in a replica session instead while
+        the replica is available, see `route_read_only()`.
 
-        :param session: testing session.
+        :param session: database session.
         :type session: Optional[AsyncSession]
         """
-        self._session = session or create_session()
+        if session is None:
+            session = create_session(read_only=self.READ_ONLY)
+        elif self.READ_ONLY:
+            session = route_read_only(session)
+        self._session = session
 
     def get_session(self) -> AsyncSession:
         """
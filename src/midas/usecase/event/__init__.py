@@ -4,6 +4,10 @@ from .get_upcoming_events_usecase import GetUpcomingEventsUsecase
 from .update_event_after_run_usecase import UpdateEventAfterRunUsecase
 from .delete_event_usecase import DeleteEventUsecase
 from .edit_event_usecase import EditEventUsecase
+from .run_events_batch_usecase import RunEventsBatchUsecase
+from .get_next_event_run_usecase import GetNextEventRunUsecase
+from .run_due_events_usecase import RunDueEventsUsecase
+from .stream_upcoming_events_usecase import StreamUpcomingEventsUsecase
 
 __all__ = (
     "CreateEventUsecase",
@@ -12,4 +16,8 @@ __all__ = (
     "UpdateEventAfterRunUsecase",
     "DeleteEventUsecase",
     "EditEventUsecase",
+    "RunEventsBatchUsecase",
+    "GetNextEventRunUsecase",
+    "RunDueEventsUsecase",
+    "StreamUpcomingEventsUsecase",
 )
@@ -1,4 +1,4 @@
-from typing import Sequence, override
+from typing import Optional, Sequence, override
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import app_logger
@@ -6,6 +6,7 @@ from midas.loggers import app_logger
 from midas.db.schemas.event import Event
 from midas.query.event import EventRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.retry import retry_on_primary
 
 
 class GetEventsUsecase(AbstractUsecase[Sequence[Event]]):
@@ -14,13 +15,18 @@ class GetEventsUsecase(AbstractUsecase[Sequence[Event]]):
     a way to get events bound to a user.
     """
 
+    READ_ONLY = True
+
     @override
     def __init__(self, session: AsyncSession | None = None) -> None:
         super().__init__(session)
         self._event_repo = EventRepository(self._session)
 
     @override
-    async def execute(self, user_id: int, count: int = 16) -> Sequence[Event]:
+    @retry_on_primary()
+    async def execute(
+        self, user_id: int, count: int = 16, after: Optional[int] = None
+    ) -> Sequence[Event]:
         """
         Get first `count` events of the `user_id` user.
 
@@ -30,12 +36,15 @@ class GetEventsUsecase(AbstractUsecase[Sequence[Event]]):
         :type user_id: int
         :param count: number of events to get
         :type count: int
+        :param after: id of the last event of the previous page. `None`
+        returns the first page.
+        :type after: Optional[int]
         :return: list of user-created events
         :rtype: Sequence[Event]
         """
         app_logger.debug(f"Started `GetEventsUsecase` execution: {user_id} - {count}")
 
         async with self._session:
-            events = await self._event_repo.get_by_user_id(user_id, count)
+            events = await self._event_repo.get_by_user_id(user_id, count, after)
             app_logger.debug("Successfully returned events back")
             return events
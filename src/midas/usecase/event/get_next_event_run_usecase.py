@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Optional, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.query.event import EventRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+
+
+class GetNextEventRunUsecase(AbstractUsecase[Optional[date]]):
+    """
+    Get next event run usecase. Instantiate this class if you want to
+    know when the next event is due.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._event_repo = EventRepository(self._session)
+
+    @override
+    async def execute(self) -> Optional[date]:
+        """
+        Get the earliest `next_run_on` date of all events.
+
+        :return: the date of the next run or `None` if there are no events.
+        :rtype: Optional[date]
+        """
+        app_logger.debug("Started `GetNextEventRunUsecase` execution")
+
+        async with self._session:
+            next_run_on = await self._event_repo.get_earliest_next_run_on()
+            app_logger.debug("Successfully returned next event run date back")
+            return next_run_on
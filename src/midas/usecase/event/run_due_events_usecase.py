@@ -0,0 +1,57 @@
+from typing import Callable, Optional, Sequence, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+from midas.services import outbox_dispatcher
+
+from midas.db.schemas.event import Event
+from midas.query.event import EventRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.event.run_events_batch_usecase import RunEventsBatchUsecase
+
+
+class RunDueEventsUsecase(AbstractUsecase[Sequence[Event]]):
+    """
+    Run due events usecase. Claims a bounded chunk of due events with
+    `SELECT ... FOR UPDATE SKIP LOCKED` and posts it with
+    `RunEventsBatchUsecase` in the same database transaction.
+
+    The claimed rows stay locked until the transaction commits, so any
+    number of workers, in one or in several processes, can execute this
+    usecase concurrently without posting the same event twice.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._event_repo = EventRepository(self._session)
+        self._run_events_batch = RunEventsBatchUsecase(self._session)
+
+    @override
+    async def execute(
+        self, limit: int = 500, render: Optional[Callable[[Event], str]] = None
+    ) -> Sequence[Event]:
+        """
+        Claim at most `limit` due events and run them.
+
+        :param limit: maximal number of events claimed at once
+        :type limit: int
+        :param render: function rendering the notification message of an
+        event, see `RunEventsBatchUsecase.execute()`.
+        :type render: Optional[Callable[[Event], str]]
+        :return: events that were run. Empty when there are no due events
+        left that aren't claimed by someone else.
+        :rtype: Sequence[Event]
+        """
+        app_logger.debug(f"Started `RunDueEventsUsecase` execution: {limit}")
+
+        async with self._session:
+            events = await self._event_repo.get_upcoming_events(eager=True, claim=limit)
+            executed = await self._run_events_batch.post(events, render)
+            await self._session.commit()
+
+        if render is not None and len(executed) > 0:
+            outbox_dispatcher.wake()
+
+        app_logger.debug(f"Successfully ran {len(executed)} claimed events")
+        return executed
@@ -0,0 +1,199 @@
+from collections import defaultdict
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any, Callable, Optional, Sequence, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+from midas.services import outbox_dispatcher
+
+from midas.db import journal_ledger
+from midas.db.schemas.event import Event
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.event import EventRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.notification import NotificationRepository
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.event.util import determine_timedelta
+from midas.util.dates import month_of
+from midas.util.enums import EventFrequency, TransactionType
+
+
+class RunEventsBatchUsecase(AbstractUsecase[Sequence[Event]]):
+    """
+    Run events batch usecase. This is the set-based counterpart of running
+    `CreateTransactionUsecase` and `UpdateEventAfterRunUsecase` for every
+    due event. The whole batch is posted in a single database transaction
+    with a constant number of statements:
+
+    * one SELECT of the accounts involved
+    * one multi-row INSERT of transactions
+    * one UPDATE of account debit and credit amounts
+    * one UPDATE of user balances
+    * one upsert of monthly aggregates
+    * one UPDATE advancing `next_run_on` of the events, and another one
+      of the events that were skipped
+    * one multi-row INSERT of notifications into the outbox
+
+    With `LEDGER_MODE=journal` the account and balance UPDATEs are left
+    out, see `CreateTransactionUsecase`.
+
+    Like `UpdateEventAfterRunUsecase` it's meant to be used only in the
+    event scheduler.
+    """
+
+    JOURNAL = journal_ledger
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._transaction_repo = TransactionRepository(self._session)
+        self._account_repo = AccountRepository(self._session)
+        self._account_period_repo = AccountPeriodRepository(self._session)
+        self._user_repo = UserRepository(self._session)
+        self._event_repo = EventRepository(self._session)
+        self._notification_repo = NotificationRepository(self._session)
+        self._aggregate_repo = MonthlyAggregateRepository(self._session)
+
+    def _add_delta(
+        self,
+        deltas: dict[tuple[int, date], tuple[Decimal, Decimal]],
+        key: tuple[int, date],
+        debit: Decimal = Decimal(),
+        credit: Decimal = Decimal(),
+    ) -> None:
+        old_debit, old_credit = deltas.get(key, (Decimal(), Decimal()))
+        deltas[key] = (old_debit + debit, old_credit + credit)
+
+    async def post(
+        self, events: Sequence[Event], render: Optional[Callable[[Event], str]]
+    ) -> Sequence[Event]:
+        """
+        Post the events in the current transaction without committing it,
+        see `execute()`.
+
+        :param events: due events with `Event.user` loaded
+        :type events: Sequence[Event]
+        :param render: function rendering the notification message of an
+        event, `None` writes no notifications.
+        :type render: Optional[Callable[[Event], str]]
+        :return: events that were run
+        :rtype: Sequence[Event]
+        """
+        accounts = await self._account_repo.get_ids_by_user_ids(
+            event.user_id for event in events
+        )
+
+        transactions: list[dict[str, Any]] = []
+        account_deltas: dict[tuple[int, date], tuple[Decimal, Decimal]] = {}
+        balance_deltas: dict[int, Decimal] = defaultdict(Decimal)
+        aggregate_deltas: dict[tuple[int, date, int], tuple[Decimal, int]] = {}
+        executed: list[Event] = []
+        skipped: list[Event] = []
+
+        created_at = datetime.now(timezone.utc)
+        period = month_of(created_at)
+
+        for event in events:
+            income_id = accounts.get((event.user_id, TransactionType.INCOME))
+            type_id = accounts.get((event.user_id, event.transaction_type_id))
+            if income_id is None or type_id is None:
+                app_logger.warning(
+                    f"Skipped event {event.id} because user {event.user_id} has no accounts"
+                )
+                skipped.append(event)
+                continue
+
+            amount: Decimal = event.amount
+            # see `CreateTransactionUsecase` for the double-entry rules
+            if event.transaction_type_id == TransactionType.INCOME:
+                debit_id, credit_id = income_id, None
+                balance_deltas[event.user_id] += amount
+            else:
+                debit_id, credit_id = type_id, income_id
+                self._add_delta(account_deltas, (credit_id, period), credit=amount)
+                balance_deltas[event.user_id] -= amount
+            self._add_delta(account_deltas, (debit_id, period), debit=amount)
+
+            key = (event.user_id, period, event.transaction_type_id)
+            total, count = aggregate_deltas.get(key, (Decimal(), 0))
+            aggregate_deltas[key] = (total + amount, count + 1)
+
+            transactions.append(
+                {
+                    "user_id": event.user_id,
+                    "transaction_type_id": event.transaction_type_id,
+                    "created_at": created_at,
+                    "title": event.title,
+                    "description": event.description,
+                    "amount": amount,
+                    "debit_account_id": debit_id,
+                    "credit_account_id": credit_id,
+                    "folded": not self.JOURNAL,
+                }
+            )
+            executed.append(event)
+
+        await self._transaction_repo.insert_many(transactions)
+        if not self.JOURNAL:
+            await self._account_period_repo.apply_deltas(account_deltas)
+            await self._user_repo.apply_balance_deltas(balance_deltas)
+            await self._aggregate_repo.apply_deltas(aggregate_deltas)
+        intervals = {
+            frequency.value: determine_timedelta(frequency)
+            for frequency in EventFrequency
+        }
+        await self._event_repo.advance_after_run(
+            (event.id for event in executed), date.today(), intervals
+        )
+        # otherwise the skipped events stay due and are claimed again by
+        # every following batch
+        await self._event_repo.postpone(
+            (event.id for event in skipped), date.today(), intervals
+        )
+
+        if render is not None:
+            await self._notification_repo.insert_many(
+                (event.user_id, render(event))
+                for event in executed
+                if event.user.send_notifications
+            )
+
+        return executed
+
+    @override
+    async def execute(
+        self,
+        events: Sequence[Event],
+        render: Optional[Callable[[Event], str]] = None,
+    ) -> Sequence[Event]:
+        """
+        Create a transaction for each event, apply the transactions to
+        accounts and balances and schedule the next run of each event.
+
+        Events of users that have no accounts aren't run, their next run
+        is postponed by one interval.
+
+        :param events: due events with `Event.user` loaded
+        :type events: Sequence[Event]
+        :param render: function rendering the notification message of an
+        event. When given, notifications of the executed events are written
+        to the outbox in the same transaction, for users that want them.
+        :type render: Optional[Callable[[Event], str]]
+        :return: events that were run
+        :rtype: Sequence[Event]
+        """
+        app_logger.debug(f"Started `RunEventsBatchUsecase` execution: {len(events)}")
+
+        async with self._session:
+            executed = await self.post(events, render)
+            await self._session.commit()
+
+        if render is not None and len(executed) > 0:
+            outbox_dispatcher.wake()
+
+        app_logger.debug(f"Successfully ran {len(executed)} events")
+        return executed
@@ -0,0 +1,42 @@
+from typing import AsyncIterator, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.db.schemas.event import Event
+from midas.query.event import EventRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+
+
+class StreamUpcomingEventsUsecase(AbstractUsecase[AsyncIterator[Event]]):
+    """
+    Stream upcoming events usecase. This is the streaming counterpart
+    of `GetUpcomingEventsUsecase`: the events are fetched in chunks, so
+    memory usage stays flat no matter how many events are due.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._event_repo = EventRepository(self._session)
+
+    @override
+    async def execute(self, chunk_size: int = 500) -> AsyncIterator[Event]:
+        """
+        Iterate over all events with `run_next_on` field set to today
+        or earlier.
+
+        :param chunk_size: number of events fetched at once.
+        :type chunk_size: int
+        :return: async iterator of events with `run_next_on` <= `date.today()`
+        :rtype: AsyncIterator[Event]
+        """
+        app_logger.debug("Started `StreamUpcomingEventsUsecase` execution")
+
+        async with self._session:
+            async for event in self._event_repo.stream_upcoming_events(
+                eager=True, chunk_size=chunk_size
+            ):
+                yield event
+
+        app_logger.debug("Successfully streamed upcoming events back")
@@ -0,0 +1,3 @@
+from .dispatch_notifications_usecase import DispatchNotificationsUsecase
+
+__all__ = ("DispatchNotificationsUsecase",)
@@ -0,0 +1,77 @@
+from datetime import timedelta
+from typing import override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.query.notification import NotificationRepository
+from midas.service.abstract_notifier import AbstractNotifier
+from midas.usecase.abstract_usecase import AbstractUsecase
+
+
+class DispatchNotificationsUsecase(AbstractUsecase[int]):
+    """
+    Dispatch notifications usecase. Drains one batch of the notifications
+    outbox through a notifier.
+
+    The batch is claimed with a lease in a transaction of its own, so no
+    rows stay locked while the notifier talks to the platform. The batch
+    is deleted in a second short transaction once the notifier has sent
+    it. If sending fails, the lease is released. If the process dies
+    halfway, the lease expires and the batch is sent again by the next
+    dispatcher (at-least-once delivery).
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._notification_repo = NotificationRepository(self._session)
+
+    @override
+    async def execute(
+        self,
+        notifier: AbstractNotifier,
+        limit: int = 100,
+        lease: timedelta = timedelta(minutes=5),
+    ) -> int:
+        """
+        Send at most `limit` of the oldest unclaimed notifications and
+        delete them.
+
+        :param notifier: notifier used to send the notifications
+        :type notifier: AbstractNotifier
+        :param limit: maximal number of notifications sent at once
+        :type limit: int
+        :param lease: time other dispatchers keep away from the batch,
+        it must be longer than sending the batch takes.
+        :type lease: timedelta
+        :return: number of dispatched notifications
+        :rtype: int
+        """
+        app_logger.debug(f"Started `DispatchNotificationsUsecase` execution: {limit}")
+
+        async with self._session:
+            notifications = await self._notification_repo.claim_batch(limit, lease)
+            await self._session.commit()
+
+        if len(notifications) == 0:
+            app_logger.debug("Successfully dispatched 0 notifications")
+            return 0
+
+        ids = [notification.id for notification in notifications]
+        try:
+            for notification in notifications:
+                await notifier.notify(notification.user_id, notification.message)
+            await notifier.flush()
+        except Exception:
+            async with self._session:
+                await self._notification_repo.release_many(ids)
+                await self._session.commit()
+            raise
+
+        async with self._session:
+            await self._notification_repo.delete_many(ids)
+            await self._session.commit()
+
+        app_logger.debug(f"Successfully dispatched {len(notifications)} notifications")
+        return len(notifications)
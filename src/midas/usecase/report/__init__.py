@@ -1,3 +1,13 @@
 from .generate_report_usecase import GenerateReportUsecase
+from .generate_all_reports_usecase import GenerateAllReportsUsecase, UserReport
+from .get_reports_usecase import GetReportsUsecase
+from .get_period_report_usecase import GetPeriodReportUsecase, PeriodReport
 
-__all__ = ("GenerateReportUsecase",)
+__all__ = (
+    "GenerateReportUsecase",
+    "GenerateAllReportsUsecase",
+    "UserReport",
+    "GetReportsUsecase",
+    "GetPeriodReportUsecase",
+    "PeriodReport",
+)
@@ -0,0 +1,139 @@
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Any, Callable, Optional, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+from midas.services import outbox_dispatcher
+
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.notification import NotificationRepository
+from midas.query.report import ReportRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.transaction.util import fold_journal
+from midas.util.enums import Currency, TransactionType
+
+
+@dataclass
+class UserReport:
+    """
+    Monthly report of a single user. `report` has the same shape as
+    the dictionary returned by `GenerateReportUsecase`.
+    """
+
+    user_id: int
+    currency: Currency
+    send_notifications: bool
+    report: dict[str, Any] = field(
+        default_factory=lambda: {"accounts": {}, "result": Decimal()}
+    )
+
+
+class GenerateAllReportsUsecase(AbstractUsecase[int]):
+    """
+    Generate all reports usecase. This is the bulk counterpart of running
+    `GenerateReportUsecase` for every user: the balances of all accounts
+    in the month are streamed from one aggregated query. Nothing is
+    cleared afterwards, the next month's postings go to new
+    `AccountPeriod` rows.
+
+    The reports are stored in `reports` and their notifications are
+    written to the notifications outbox in the same transaction as the
+    folded journal tail, so they are sent if and only if the reported
+    amounts are committed. Users who already have a stored report of the
+    month are skipped, running the usecase again for the same month only
+    generates the missing reports.
+
+    The amounts of a month are final only once it's closed, a report of
+    the current month would miss the postings made after it's stored.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._account_period_repo = AccountPeriodRepository(self._session)
+        self._notification_repo = NotificationRepository(self._session)
+        self._report_repo = ReportRepository(self._session)
+
+    @override
+    async def execute(
+        self,
+        render: Callable[[UserReport], str],
+        period: date,
+        chunk_size: int = 1000,
+    ) -> int:
+        """
+        Generate and store the reports of all users without a report of
+        the month and write the notifications of the users that want them
+        to the outbox.
+
+        :param render: function rendering the notification message of
+        a report.
+        :type render: Callable[[UserReport], str]
+        :param period: first day of the reported month, which has to be
+        closed already.
+        :type period: date
+        :param chunk_size: number of rows fetched and notifications
+        written at once.
+        :type chunk_size: int
+        :return: number of generated reports, the skipped ones aren't
+        counted
+        :rtype: int
+        """
+        app_logger.debug("Started `GenerateAllReportsUsecase` execution")
+
+        generated = 0
+        async with self._session:
+            # the whole journal tail goes into the reported amounts
+            await fold_journal(self._session)
+            pending: list[UserReport] = []
+
+            async def store_reports() -> None:
+                nonlocal generated, pending
+                # a report stored meanwhile by a concurrent run isn't
+                # inserted again, so its notification isn't sent twice
+                inserted = await self._report_repo.insert_many(
+                    period,
+                    {
+                        user_report.user_id: user_report.report
+                        for user_report in pending
+                    },
+                )
+                await self._notification_repo.insert_many(
+                    (user_report.user_id, render(user_report))
+                    for user_report in pending
+                    if user_report.user_id in inserted
+                    and user_report.send_notifications
+                )
+                generated += len(inserted)
+                pending = []
+
+            current: Optional[UserReport] = None
+            async for row in self._account_period_repo.stream_balances_of_all_users(
+                period, chunk_size, unreported=True
+            ):
+                if current is None or current.user_id != row.user_id:
+                    if current is not None:
+                        pending.append(current)
+                    if len(pending) >= chunk_size:
+                        await store_reports()
+                    current = UserReport(
+                        row.user_id, Currency(row.currency_id), row.send_notifications
+                    )
+
+                ttype = TransactionType(row.transaction_type_id)
+                if ttype == TransactionType.INCOME:
+                    current.report["result"] = row.balance
+                current.report["accounts"][ttype.name.lower()] = row.balance
+
+            if current is not None:
+                pending.append(current)
+            await store_reports()
+            await self._session.commit()
+
+        if generated > 0:
+            outbox_dispatcher.wake()
+
+        app_logger.debug(f"Successfully generated {generated} reports")
+        return generated
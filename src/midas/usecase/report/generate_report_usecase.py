@@ -1,12 +1,14 @@
+from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any, Sequence, override
+from typing import Any, Optional, override
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import app_logger
 
-from midas.db.schemas.account import Account
-from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.transaction.util import fold_journal
+from midas.util.dates import month_of
 from midas.util.enums import TransactionType
 
 
@@ -14,43 +16,37 @@ class GenerateReportUsecase(AbstractUsecase[dict[str, Any]]):
     @override
     def __init__(self, session: AsyncSession | None = None) -> None:
         super().__init__(session)
-        self.account_repo = AccountRepository(self._session)
+        self.account_period_repo = AccountPeriodRepository(self._session)
 
     @override
     async def execute(
-        self, user_id: int, clear_accounts: bool = True
+        self, user_id: int, period: Optional[date] = None
     ) -> dict[str, Any]:
         """
         Generate personalized report for user.
 
         :param user_id: user's telegram id.
         :type user_id: int
-        :param clear_accounts: if `True` the debit and credit values
-        of accounts get cleared.
-        :type clear_accounts: bool
+        :param period: first day of the reported month, defaults to the
+        current month.
+        :type period: Optional[date]
         :return: dictionary with all entries to be displayed
         to the end user.
         :rtype: dict[str, Any]
         """
         app_logger.debug(f"Started `GenerateReportUsecase` execution: {user_id}")
 
+        period = period or month_of(datetime.now(timezone.utc))
         async with self._session:
+            await fold_journal(self._session, user_id)
             report: dict[str, Any] = {"accounts": {}, "result": Decimal()}
-            accounts: Sequence[Account] = await self.account_repo.get_all_by_user_id(
-                user_id
-            )
-
-            for account in accounts:
-                ttype = TransactionType(account.transaction_type_id)
-                balance = account.debit_amount - account.credit_amount
+            rows = await self.account_period_repo.get_balances(user_id, period)
 
+            for row in rows:
+                ttype = TransactionType(row.transaction_type_id)
                 if ttype == TransactionType.INCOME:
-                    report["result"] = balance
-                report["accounts"][ttype.name.lower()] = balance
-
-                if clear_accounts:
-                    account.debit_amount = Decimal()
-                    account.credit_amount = Decimal()
+                    report["result"] = row.balance
+                report["accounts"][ttype.name.lower()] = row.balance
 
             await self._session.commit()
 
@@ -0,0 +1,135 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+from midas.services import period_report_cache
+
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.transaction import TransactionRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.util.dates import next_month
+from midas.util.enums import TransactionType
+
+
+@dataclass
+class PeriodReport:
+    """
+    Report of a user over a range of days. `totals` maps every
+    transaction type to the sum of the transactions of the type, `result`
+    is the income minus the expenses.
+    """
+
+    start: date
+    end: date
+    totals: dict[TransactionType, Decimal] = field(
+        default_factory=lambda: {ttype: Decimal("0.00") for ttype in TransactionType}
+    )
+    result: Decimal = Decimal("0.00")
+
+
+class GetPeriodReportUsecase(AbstractUsecase[PeriodReport]):
+    """
+    Get period report usecase class. The object created via this class
+    sums up the transactions of a user over any range of days. The whole
+    months of the range are read from `monthly_aggregates`, which don't
+    include the journal tail, so it's added from the unfolded
+    transactions of the months. The days before the first and after the
+    last whole month are summed up with `GROUP BY` queries served by the
+    `(user_id, created_at)` index.
+
+    Reports of closed periods, i.e. ranges ending before today, are kept
+    in `period_report_cache`. They're read from the primary, a report
+    read from a lagging replica would stay in the cache.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._aggregate_repo = MonthlyAggregateRepository(self._session)
+        self._transaction_repo = TransactionRepository(self._session)
+
+    async def _add_days(
+        self,
+        report: PeriodReport,
+        user_id: int,
+        start: date,
+        end: date,
+        unfolded: bool = False,
+    ) -> None:
+        if start >= end:
+            return
+
+        rows = await self._transaction_repo.sum_by_type(
+            user_id,
+            datetime.combine(start, time.min, timezone.utc),
+            datetime.combine(end, time.min, timezone.utc),
+            unfolded,
+        )
+        for row in rows:
+            report.totals[TransactionType(row.transaction_type_id)] += row.total
+
+    @override
+    async def execute(self, user_id: int, start: date, end: date) -> PeriodReport:
+        """
+        Get report of the transactions of the user created from `start` up
+        to and including `end`, in UTC.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param start: first day of the range
+        :type start: date
+        :param end: last day of the range
+        :type end: date
+        :return: sums of the transactions of each type in the range
+        :rtype: PeriodReport
+        :raise ValueError: if `start` is after `end`.
+        """
+        app_logger.debug(
+            f"Started `GetPeriodReportUsecase` execution: {user_id} - {start} - {end}"
+        )
+
+        if start > end:
+            raise ValueError(f"Range start {start} is after its end {end}")
+
+        closed = end < datetime.now(timezone.utc).date()
+        if closed:
+            cached = await period_report_cache.get(user_id, start, end)
+            if cached is not None:
+                app_logger.debug("Successfully returned cached period report back")
+                return cached
+            generation = await period_report_cache.generation(user_id)
+
+        report = PeriodReport(start, end)
+        stop = end + timedelta(days=1)
+        first_month = start if start.day == 1 else next_month(start)
+        last_month = stop.replace(day=1)
+        async with self._session:
+            if first_month < last_month:
+                aggregates = await self._aggregate_repo.get_by_period(
+                    user_id, first_month, last_month
+                )
+                for aggregate in aggregates:
+                    ttype = TransactionType(aggregate.transaction_type_id)
+                    report.totals[ttype] += aggregate.total
+                await self._add_days(
+                    report, user_id, first_month, last_month, unfolded=True
+                )
+                await self._add_days(report, user_id, start, first_month)
+                await self._add_days(report, user_id, last_month, stop)
+            else:
+                await self._add_days(report, user_id, start, stop)
+
+        for ttype, total in report.totals.items():
+            if ttype == TransactionType.INCOME:
+                report.result += total
+            else:
+                report.result -= total
+
+        if closed:
+            await period_report_cache.store(user_id, start, end, report, generation)
+
+        app_logger.debug("Successfully returned period report back")
+        return report
@@ -0,0 +1,51 @@
+from datetime import date
+from typing import Optional, Sequence, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.db.schemas.report import Report
+from midas.query.report import ReportRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.retry import retry_on_primary
+
+
+class GetReportsUsecase(AbstractUsecase[Sequence[Report]]):
+    """
+    Get reports usecase class. The object created via this class provides
+    the stored monthly reports of a user, nothing is recomputed.
+    """
+
+    READ_ONLY = True
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._report_repo = ReportRepository(self._session)
+
+    @override
+    @retry_on_primary()
+    async def execute(
+        self, user_id: int, count: int = 16, after: Optional[date] = None
+    ) -> Sequence[Report]:
+        """
+        Get last `count` reports of the `user_id` user.
+
+        The list will be empty if `user_id` is invalid.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param count: number of reports to get
+        :type count: int
+        :param after: period of the last report of the previous page.
+        `None` returns the first page.
+        :type after: Optional[date]
+        :return: list of reports from the latest month to the earliest one
+        :rtype: Sequence[Report]
+        """
+        app_logger.debug(f"Started `GetReportsUsecase` execution: {user_id} - {count}")
+
+        async with self._session:
+            reports = await self._report_repo.get_by_user_id(user_id, count, after)
+            app_logger.debug("Successfully returned reports back")
+            return reports
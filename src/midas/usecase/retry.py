@@ -0,0 +1,95 @@
+from asyncio import sleep
+from functools import wraps
+from random import uniform
+from typing import Any, Awaitable, Callable
+from sqlalchemy.orm.exc import StaleDataError
+
+from midas.loggers import app_logger
+
+from midas.query.session import fall_back_to_primary
+
+
+def retry_on_stale_data[**P, T](
+    attempts: int = 5, backoff: float = 0.02
+) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """
+    Decorate `execute()` of a usecase to run it again when its flush hits
+    a user updated concurrently, i.e. raises `StaleDataError`, see the
+    `version` column of `User`. Users are the only versioned rows, the
+    decorator guards the read-modify-write of a user's settings and
+    balance in `EditUserUsecase` and `EditTransactionUsecase`. The other
+    usecases change the balances and the account periods with atomic
+    SQL updates, which don't need to be retried.
+
+    `execute()` must run the whole unit of work in `async with
+    self._session`, so a failed attempt is rolled back and the next one
+    reads the rows again. The attempts are spread with a random delay
+    growing with each attempt, so the usecases racing for the same rows
+    don't collide again right away.
+
+    :param attempts: maximal number of runs, the error of the last one is
+    raised.
+    :type attempts: int
+    :param backoff: upper bound of the delay after the first attempt in
+    seconds, multiplied by the attempt number for the following ones.
+    :type backoff: float
+    """
+
+    def decorator(
+        execute: Callable[P, Awaitable[T]],
+    ) -> Callable[P, Awaitable[T]]:
+        @wraps(execute)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            for attempt in range(1, attempts):
+                try:
+                    return await execute(*args, **kwargs)
+                except StaleDataError as e:
+                    usecase: Any = args[0]
+                    app_logger.warning(
+                        f"Retrying `{type(usecase).__name__}` after a concurrent update "
+                        f"({attempt}/{attempts}): {e}"
+                    )
+                    await sleep(uniform(0, backoff * attempt))
+            return await execute(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def retry_on_primary[**P, T]() -> (
+    Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]
+):
+    """
+    Decorate `execute()` of a `READ_ONLY` usecase to run it again on the
+    primary when the replica fails it with a connection error, see
+    `fall_back_to_primary()`. The replica is left out of the following
+    reads until its next successful check.
+
+    The usecase is initialized again with the primary session, so its
+    repositories are bound to it, hence `__init__()` must take nothing
+    but the session.
+    """
+
+    def decorator(
+        execute: Callable[P, Awaitable[T]],
+    ) -> Callable[P, Awaitable[T]]:
+        @wraps(execute)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            usecase: Any = args[0]
+            try:
+                return await execute(*args, **kwargs)
+            except Exception as e:
+                session = fall_back_to_primary(usecase.get_session(), e)
+                if session is None:
+                    raise
+
+                app_logger.warning(
+                    f"Retrying `{type(usecase).__name__}` on the primary: {e!r}"
+                )
+                usecase.__init__(session)
+                return await execute(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
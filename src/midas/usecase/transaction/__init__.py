@@ -1,11 +1,20 @@
+from .compact_journal_usecase import CompactJournalUsecase
 from .create_transaction_usecase import CreateTransactionUsecase
+from .create_transaction_partitions_usecase import CreateTransactionPartitionsUsecase
 from .get_transactions_usecase import GetTransactionsUsecase
 from .delete_transaction_usecase import DeleteTransactionUsecase
+from .delete_transactions_usecase import DeleteTransactionsUsecase
 from .edit_transaction_usecase import EditTransactionUsecase
+from .import_transactions_usecase import ImportResult, ImportTransactionsUsecase
 
 __all__ = (
+    "CompactJournalUsecase",
     "CreateTransactionUsecase",
+    "CreateTransactionPartitionsUsecase",
     "GetTransactionsUsecase",
     "DeleteTransactionUsecase",
+    "DeleteTransactionsUsecase",
     "EditTransactionUsecase",
+    "ImportResult",
+    "ImportTransactionsUsecase",
 )
@@ -0,0 +1,49 @@
+from typing import override
+
+from midas.loggers import app_logger
+
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.transaction.util import fold_journal
+
+
+class CompactJournalUsecase(AbstractUsecase[int]):
+    """
+    Compact journal usecase class. The object created via this class
+    rolls the account amounts, the balances and the monthly aggregates
+    forward by folding the journal tail into them, see
+    `Transaction.folded`.
+
+    Transactions are folded in batches of bounded size, each batch in its
+    own transaction, so the hot account, user and aggregate rows are
+    locked shortly and once per batch instead of once per posting.
+    """
+
+    @override
+    async def execute(self, batch_size: int = 10000, max_batches: int = 10) -> int:
+        """
+        Fold the journal tail into the account amounts, the balances and
+        the monthly aggregates.
+
+        :param batch_size: maximal number of transactions folded in one
+        transaction
+        :type batch_size: int
+        :param max_batches: maximal number of batches in this run
+        :type max_batches: int
+        :return: number of folded transactions, `batch_size * max_batches`
+        means the tail may not be folded completely.
+        :rtype: int
+        """
+        app_logger.debug("Started `CompactJournalUsecase` execution")
+
+        total = 0
+        async with self._session:
+            for _ in range(max_batches):
+                folded = await fold_journal(self._session, limit=batch_size)
+                await self._session.commit()
+
+                total += folded
+                if folded < batch_size:
+                    break
+
+        app_logger.debug(f"Successfully folded {total} transactions")
+        return total
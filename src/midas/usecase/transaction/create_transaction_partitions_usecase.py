@@ -0,0 +1,53 @@
+from datetime import date
+from typing import override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.query.transaction import TransactionRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.util.dates import get_upcoming_months
+
+
+class CreateTransactionPartitionsUsecase(AbstractUsecase[list[str]]):
+    """
+    Create transaction partitions usecase class. The object created via
+    this class makes sure the monthly partitions of `transactions` exist
+    for the current month and the upcoming ones, so new transactions
+    never land in the default partition.
+
+    Partitioning is specific to PostgreSQL, with other dialects the usecase
+    does nothing.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._transaction_repo = TransactionRepository(self._session)
+
+    @override
+    async def execute(self, months_ahead: int = 3) -> list[str]:
+        """
+        Create the missing partitions for the current month and
+        `months_ahead` months after it.
+
+        :param months_ahead: number of upcoming months
+        :type months_ahead: int
+        :return: names of created partitions
+        :rtype: list[str]
+        """
+        app_logger.debug(
+            f"Started `CreateTransactionPartitionsUsecase` execution: {months_ahead}"
+        )
+
+        months = get_upcoming_months(date.today(), months_ahead)
+
+        async with self._session:
+            if self._session.bind.dialect.name != "postgresql":
+                return []
+
+            created = await self._transaction_repo.create_partitions(months)
+            await self._session.commit()
+
+        app_logger.debug(f"Successfully created partitions: {created}")
+        return created
@@ -4,11 +4,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import app_logger
 
-from midas.db.schemas.account import Account
-from midas.db.schemas.transaction import Transaction
-from midas.query.account import AccountRepository
+from midas.db import journal_ledger
 from midas.query.transaction import TransactionRepository
-from midas.query.user import UserRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
 from midas.util.enums import TransactionType
 
@@ -17,14 +14,23 @@ class CreateTransactionUsecase(AbstractUsecase[None]):
     """
     Create transaction usecase class. This class is responsible for
     creating new transactions and their side effect.
+
+    The transaction, its effects on the accounts and the balance and the
+    monthly aggregates are written by `TransactionRepository.post()`,
+    with a single statement on PostgreSQL.
+
+    With `LEDGER_MODE=journal` the transaction is only appended to the
+    journal, the accounts and the balance are rolled forward by the
+    journal compactor, see `Transaction.folded`.
     """
 
+    # postings leave the account amounts and the balance untouched
+    JOURNAL = journal_ledger
+
     @override
     def __init__(self, session: AsyncSession | None = None) -> None:
         super().__init__(session)
         self._transaction_repo = TransactionRepository(self._session)
-        self._user_repo = UserRepository(self._session)
-        self._account_repo = AccountRepository(self._session)
 
     @override
     async def execute(
@@ -54,64 +60,20 @@ class CreateTransactionUsecase(AbstractUsecase[None]):
         )
 
         async with self._session:
-            user = await self._user_repo.get_by_id(user_id)
-            if user is None:
+            posted = await self._transaction_repo.post(
+                user_id,
+                transaction_type,
+                title,
+                amount,
+                description,
+                folded=not self.JOURNAL,
+            )
+            if posted is None:
                 app_logger.debug(
                     "Finished `CreateTransactionUsecase` execution too soon because user does not exist"
                 )
                 raise ValueError(f"No user with {user_id=} exists")
 
-            # this is guaranteed to be an account instance because user exists.
-            income_account: Account = (
-                await self._account_repo.get_user_account_by_transaction_type(
-                    user.id, TransactionType.INCOME, eager=True
-                )
-            )  # type: ignore
-            if transaction_type == TransactionType.INCOME:
-                debit_account = income_account
-                credit_account = None
-
-                # +-------------+--------+--------+
-                # | Account     | Debit  | Credit |
-                # +-------------+--------+--------+
-                # | Income      | amount |        |
-                # | Income debt |        | amount |
-                # +-------------+--------+--------+
-                debit_account.debit_amount += amount
-                user.balance += amount
-            else:
-                # same here
-                debit_account: Account = (
-                    await self._account_repo.get_user_account_by_transaction_type(
-                        user.id, transaction_type, eager=True
-                    )
-                )  # type: ignore
-                credit_account = income_account
-
-                # +-------------+--------+--------+
-                # | Account     | Debit  | Credit |
-                # +-------------+--------+--------+
-                # | Expense     | amount |        |
-                # | Income      |        | amount |
-                # +-------------+--------+--------+
-
-                debit_account.debit_amount += amount
-                credit_account.credit_amount += amount
-                user.balance -= amount
-
-            transaction = Transaction(
-                user_id=user_id,
-                transaction_type_id=transaction_type,
-                title=title,
-                description=description,
-                amount=amount,
-                debit_account_id=debit_account.id,
-                credit_account_id=(
-                    credit_account.id if credit_account is not None else None
-                ),
-            )
-            self._transaction_repo.add(transaction)
-
             await self._session.commit()
 
         app_logger.debug(
@@ -2,59 +2,77 @@ from typing import override
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from midas.db.schemas.user import User
 from midas.loggers import app_logger
+from midas.services import period_report_cache
 
-from midas.db.schemas.account import Account
+from midas.db.schemas.transaction import Transaction
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
 from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
-from midas.util.enums import TransactionType
+from midas.usecase.transaction.util import (
+    get_aggregate_deltas,
+    get_balance_deltas,
+)
 
 
 class DeleteTransactionUsecase(AbstractUsecase[None]):
     """
     Delete transaction usecase class. Use this class to delete transactions
-    by their primary key.
+    by their primary key or an already loaded `Transaction` object.
     """
 
     @override
     def __init__(self, session: AsyncSession | None = None) -> None:
         super().__init__(session)
         self._transaction_repo = TransactionRepository(self._session)
+        self._account_period_repo = AccountPeriodRepository(self._session)
+        self._user_repo = UserRepository(self._session)
+        self._aggregate_repo = MonthlyAggregateRepository(self._session)
 
-    # TODO: add method overloading allowing to pass directly `Transaction`
-    # object instead of the id, so no resources are wasted by making an
-    # unnecessary fetch
     @override
-    async def execute(self, id: UUID) -> None:
+    async def execute(self, transaction: UUID | Transaction) -> None:
         """
         Delete transaction by its id.
 
-        This method affects debit and credit accounts.
+        This method affects debit and credit accounts, the user's balance
+        and the monthly aggregates. The amounts are taken from the deleted
+        row, so the transaction isn't fetched beforehand. If a `Transaction`
+        is passed, only its id and creation time are used, the latter
+        restricts the delete to a single partition.
 
-        :param id: transaction id
-        :type id: UUID
+        :param transaction: transaction id or the transaction itself
+        :type transaction: UUID | Transaction
+        :raise ValueError: if no transaction with the id exists.
         """
+        if isinstance(transaction, Transaction):
+            id = transaction.id
+            created_between = (transaction.created_at, transaction.created_at)
+        else:
+            id = transaction
+            created_between = None
+
         app_logger.debug(f"Started `DeleteTransactionUsecase` execution: {id}")
 
         async with self._session:
-            transaction = await self._transaction_repo.get_by_id(id, eager=True)
-            if transaction is None:
+            rows = await self._transaction_repo.delete_many(
+                ids=[id], created_between=created_between
+            )
+            if len(rows) == 0:
                 raise ValueError(f"No transaction with {id=} is found")
 
-            debit_account: Account = transaction.debit_account
-            credit_account: Account = transaction.credit_account
-            user: User = transaction.user
-
-            if transaction.transaction_type_id == TransactionType.INCOME:
-                debit_account.debit_amount -= transaction.amount
-                user.balance -= transaction.amount
-            else:
-                debit_account.debit_amount -= transaction.amount
-                credit_account.credit_amount -= transaction.amount
-                user.balance += transaction.amount
-
-            await self._transaction_repo.delete_by_id(id)
+            # only the folded transactions are in the account amounts, the
+            # balances and the aggregates, the others are just dropped from
+            # the journal
+            folded = [row for row in rows if row.folded]
+            accounts, balances = get_balance_deltas(folded, -1)
+            aggregates = get_aggregate_deltas(folded, -1)
+            await self._account_period_repo.apply_deltas(accounts)
+            await self._user_repo.apply_balance_deltas(balances)
+            await self._aggregate_repo.apply_deltas(aggregates)
             await self._session.commit()
 
+        for row in rows:
+            await period_report_cache.invalidate(row.user_id)
         app_logger.debug(f"Successfully deleted the transaction: {id}")
@@ -0,0 +1,90 @@
+from datetime import datetime
+from typing import Iterable, Optional, override
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+from midas.services import period_report_cache
+
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.transaction.util import (
+    get_aggregate_deltas,
+    get_balance_deltas,
+)
+
+
+class DeleteTransactionsUsecase(AbstractUsecase[int]):
+    """
+    Delete transactions usecase class. Use this class to delete many
+    transactions of a user at once, e.g. everything in a date range or a
+    mistaken import.
+
+    The transactions are removed with a single `DELETE ... RETURNING`, the
+    deleted amounts are summed up per account in SQL and the accounts, the
+    balance and the monthly aggregates are adjusted with one `UPDATE` each,
+    however many transactions are deleted.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._transaction_repo = TransactionRepository(self._session)
+        self._account_period_repo = AccountPeriodRepository(self._session)
+        self._user_repo = UserRepository(self._session)
+        self._aggregate_repo = MonthlyAggregateRepository(self._session)
+
+    @override
+    async def execute(
+        self,
+        user_id: int,
+        ids: Optional[Iterable[UUID]] = None,
+        created_between: Optional[tuple[datetime, datetime]] = None,
+        imported: bool = False,
+    ) -> int:
+        """
+        Delete the user's transactions matching all of the given filters.
+        Without filters all transactions of the user are deleted.
+
+        This method affects debit and credit accounts, the user's balance
+        and the monthly aggregates.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param ids: transaction ids
+        :type ids: Optional[Iterable[UUID]]
+        :param created_between: inclusive bounds of the creation time
+        :type created_between: Optional[tuple[datetime, datetime]]
+        :param imported: delete imported transactions only
+        :type imported: bool
+        :return: number of deleted transactions
+        :rtype: int
+        """
+        app_logger.debug(
+            f"Started `DeleteTransactionsUsecase` execution: {user_id} - {created_between}"
+        )
+
+        async with self._session:
+            rows = await self._transaction_repo.delete_many(
+                user_id, ids, created_between, imported
+            )
+            # only the folded transactions are in the account amounts, the
+            # balances and the aggregates, the others are just dropped from
+            # the journal
+            folded = [row for row in rows if row.folded]
+            accounts, balances = get_balance_deltas(folded, -1)
+            aggregates = get_aggregate_deltas(folded, -1)
+
+            await self._account_period_repo.apply_deltas(accounts)
+            await self._user_repo.apply_balance_deltas(balances)
+            await self._aggregate_repo.apply_deltas(aggregates)
+            await self._session.commit()
+
+        deleted = sum(row.entries for row in rows)
+        if deleted > 0:
+            await period_report_cache.invalidate(user_id)
+        app_logger.debug(f"Successfully deleted {deleted} transactions: {user_id}")
+        return deleted
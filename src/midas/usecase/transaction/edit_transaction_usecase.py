@@ -4,13 +4,19 @@ from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import app_logger
+from midas.services import period_report_cache
 
 from midas.db.schemas.account import Account
 from midas.db.schemas.transaction import Transaction
 from midas.db.schemas.user import User
 from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
 from midas.query.transaction import TransactionRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.retry import retry_on_stale_data
+from midas.usecase.transaction.util import AccountDeltas, fold_journal
+from midas.util.dates import month_of
 from midas.util.enums import TransactionType
 from midas.util.errors import NoChangesDetectedException
 
@@ -18,7 +24,8 @@ from midas.util.errors import NoChangesDetectedException
 class EditTransactionUsecase(AbstractUsecase[None]):
     """
     Edit transaction usecase class. Use this class for editing info
-    of currently exisiting transactions.
+    of currently exisiting transactions. Type and amount changes are
+    applied to the monthly aggregates as well.
     """
 
     @override
@@ -26,6 +33,8 @@ class EditTransactionUsecase(AbstractUsecase[None]):
         super().__init__(session)
         self._transaction_repo = TransactionRepository(self._session)
         self._account_repo = AccountRepository(self._session)
+        self._account_period_repo = AccountPeriodRepository(self._session)
+        self._aggregate_repo = MonthlyAggregateRepository(self._session)
 
     def _get_effective_updates(
         self,
@@ -60,8 +69,24 @@ class EditTransactionUsecase(AbstractUsecase[None]):
 
         return updates
 
+    def _add_delta(
+        self,
+        deltas: AccountDeltas,
+        transaction: Transaction,
+        account: Account,
+        debit: Decimal = Decimal(),
+        credit: Decimal = Decimal(),
+    ) -> None:
+        # the accounts are changed in the month of the transaction
+        key = (account.id, month_of(transaction.created_at))
+        old_debit, old_credit = deltas.get(key, (Decimal(), Decimal()))
+        deltas[key] = (old_debit + debit, old_credit + credit)
+
     async def _change_income_to_expense(
-        self, transaction: Transaction, new_transaction_type: TransactionType
+        self,
+        transaction: Transaction,
+        new_transaction_type: TransactionType,
+        deltas: AccountDeltas,
     ) -> None:
         """
         Current state
@@ -85,8 +110,13 @@ class EditTransactionUsecase(AbstractUsecase[None]):
         user: User = transaction.user
 
         income_account: Account = transaction.debit_account
-        income_account.debit_amount -= transaction.amount
-        income_account.credit_amount += transaction.amount
+        self._add_delta(
+            deltas,
+            transaction,
+            income_account,
+            debit=-transaction.amount,
+            credit=transaction.amount,
+        )
 
         # 0 -> x -> -x
         user.balance -= transaction.amount * 2
@@ -96,13 +126,16 @@ class EditTransactionUsecase(AbstractUsecase[None]):
                 transaction.user_id, new_transaction_type
             )
         )  # type: ignore
-        expense_account.debit_amount += transaction.amount
+        self._add_delta(deltas, transaction, expense_account, debit=transaction.amount)
 
         transaction.debit_account = expense_account
         transaction.credit_account = income_account
 
     async def _change_expense_to_expense(
-        self, transaction: Transaction, new_transaction_type: TransactionType
+        self,
+        transaction: Transaction,
+        new_transaction_type: TransactionType,
+        deltas: AccountDeltas,
     ) -> None:
         """
         Current state
@@ -124,19 +157,22 @@ class EditTransactionUsecase(AbstractUsecase[None]):
         transaction.transaction_type_id = new_transaction_type
 
         debit_account: Account = transaction.debit_account
-        debit_account.debit_amount -= transaction.amount
+        self._add_delta(deltas, transaction, debit_account, debit=-transaction.amount)
 
         expense_account: Account = (
             await self._account_repo.get_user_account_by_transaction_type(
                 transaction.user_id, new_transaction_type
             )
         )  # type: ignore
-        expense_account.debit_amount += transaction.amount
+        self._add_delta(deltas, transaction, expense_account, debit=transaction.amount)
 
         transaction.debit_account = expense_account
 
     def _change_expense_to_income(
-        self, transaction: Transaction, new_transaction_type: TransactionType
+        self,
+        transaction: Transaction,
+        new_transaction_type: TransactionType,
+        deltas: AccountDeltas,
     ) -> None:
         """
         Current state
@@ -158,13 +194,18 @@ class EditTransactionUsecase(AbstractUsecase[None]):
         transaction.transaction_type_id = new_transaction_type
 
         expense_account: Account = transaction.debit_account
-        expense_account.debit_amount -= transaction.amount
+        self._add_delta(deltas, transaction, expense_account, debit=-transaction.amount)
 
         user: User = transaction.user
 
         income_account: Account = transaction.credit_account
-        income_account.credit_amount -= transaction.amount
-        income_account.debit_amount += transaction.amount
+        self._add_delta(
+            deltas,
+            transaction,
+            income_account,
+            debit=transaction.amount,
+            credit=-transaction.amount,
+        )
 
         # 0 -> -x -> x
         user.balance += transaction.amount * 2
@@ -172,24 +213,27 @@ class EditTransactionUsecase(AbstractUsecase[None]):
         transaction.debit_account = income_account
         transaction.credit_account = None
 
-    def _change_amount(self, transaction: Transaction, new_amount: Decimal) -> None:
+    def _change_amount(
+        self, transaction: Transaction, new_amount: Decimal, deltas: AccountDeltas
+    ) -> None:
         diff = transaction.amount - new_amount
 
         user: User = transaction.user
         debit_account: Account = transaction.debit_account
-        debit_account.debit_amount -= diff
+        self._add_delta(deltas, transaction, debit_account, debit=-diff)
 
         if transaction.transaction_type_id == TransactionType.INCOME:
             user.balance -= diff
         else:
             credit_account: Account = transaction.credit_account
-            credit_account.credit_amount -= diff
+            self._add_delta(deltas, transaction, credit_account, credit=-diff)
 
             user.balance += diff
 
         transaction.amount -= diff
 
     @override
+    @retry_on_stale_data()
     async def execute(
         self,
         id: UUID,
@@ -222,6 +266,9 @@ class EditTransactionUsecase(AbstractUsecase[None]):
         app_logger.debug(f"Started `EditTransactionUsecase` execution: {id}")
 
         async with self._session:
+            # the changes are applied to the account amounts and the balance,
+            # so they have to include the transaction
+            await fold_journal(self._session, ids=[id])
             transaction = await self._transaction_repo.get_by_id(id, eager=True)
             if transaction is None:
                 raise ValueError(f"No transaction with {id=} found")
@@ -229,29 +276,53 @@ class EditTransactionUsecase(AbstractUsecase[None]):
             updates = self._get_effective_updates(
                 transaction, transaction_type, title, amount, description
             )
+            old_transaction_type = transaction.transaction_type_id
+            old_amount = transaction.amount
+            user_id = transaction.user_id
+            account_deltas: AccountDeltas = {}
 
             if "transaction_type_id" in updates:
                 new_transaction_type = updates["transaction_type_id"]
                 if transaction.transaction_type_id == TransactionType.INCOME:
                     await self._change_income_to_expense(
-                        transaction, new_transaction_type
+                        transaction, new_transaction_type, account_deltas
                     )
                 elif new_transaction_type != TransactionType.INCOME:
                     await self._change_expense_to_expense(
-                        transaction, new_transaction_type
+                        transaction, new_transaction_type, account_deltas
                     )
                 else:
-                    self._change_expense_to_income(transaction, new_transaction_type)
+                    self._change_expense_to_income(
+                        transaction, new_transaction_type, account_deltas
+                    )
                 updates.pop("transaction_type_id")
 
             if "amount" in updates:
                 new_amount = updates["amount"]
-                self._change_amount(transaction, new_amount)
+                self._change_amount(transaction, new_amount, account_deltas)
                 updates.pop("amount")
 
             for k, v in updates.items():
                 setattr(transaction, k, v)
 
+            sums_changed = (old_transaction_type, old_amount) != (
+                transaction.transaction_type_id,
+                transaction.amount,
+            )
+            if sums_changed:
+                # move the transaction out of the old type's aggregate and
+                # into the new one, which may be the same row
+                period = month_of(transaction.created_at)
+                old_key = (transaction.user_id, period, old_transaction_type)
+                new_key = (transaction.user_id, period, transaction.transaction_type_id)
+                deltas = {old_key: (-old_amount, -1)}
+                total, count = deltas.get(new_key, (Decimal(), 0))
+                deltas[new_key] = (total + transaction.amount, count + 1)
+                await self._aggregate_repo.apply_deltas(deltas)
+
+            await self._account_period_repo.apply_deltas(account_deltas)
             await self._session.commit()
 
+        if sums_changed:
+            await period_report_cache.invalidate(user_id)
         app_logger.debug(f"Successfully edited the transaction: {id}")
@@ -1,4 +1,6 @@
-from typing import Sequence, override
+from datetime import datetime
+from typing import Optional, Sequence, override
+from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import app_logger
@@ -6,6 +8,7 @@ from midas.loggers import app_logger
 from midas.db.schemas.transaction import Transaction
 from midas.query.transaction import TransactionRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.retry import retry_on_primary
 
 
 class GetTransactionsUsecase(AbstractUsecase[Sequence[Transaction]]):
@@ -14,13 +17,21 @@ class GetTransactionsUsecase(AbstractUsecase[Sequence[Transaction]]):
     recent transactions of the requested user.
     """
 
+    READ_ONLY = True
+
     @override
     def __init__(self, session: AsyncSession | None = None) -> None:
         super().__init__(session)
         self._transaction_repo = TransactionRepository(self._session)
 
     @override
-    async def execute(self, user_id: int, count: int = 16) -> Sequence[Transaction]:
+    @retry_on_primary()
+    async def execute(
+        self,
+        user_id: int,
+        count: int = 16,
+        after: Optional[tuple[datetime, UUID]] = None,
+    ) -> Sequence[Transaction]:
         """
         Get last `count` transactions of the `user_id` user.
 
@@ -30,6 +41,9 @@ class GetTransactionsUsecase(AbstractUsecase[Sequence[Transaction]]):
         :type user_id: int
         :param count: number of transactions to retrieve
         :type count: int
+        :param after: `(created_at, id)` cursor of the last transaction of
+        the previous page. `None` returns the first page.
+        :type after: Optional[tuple[datetime, UUID]]
         :return: list of recent transactions in descending order (from the newest to oldest)
         of the specified user
         :rtype: Sequence[Transaction]
@@ -39,6 +53,8 @@ class GetTransactionsUsecase(AbstractUsecase[Sequence[Transaction]]):
         )
 
         async with self._session:
-            transactions = await self._transaction_repo.get_recent(user_id, count)
+            transactions = await self._transaction_repo.get_recent(
+                user_id, count, after=after
+            )
             app_logger.debug("Successfully returned transactions back")
             return transactions
@@ -0,0 +1,306 @@
+from csv import DictReader
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timezone
+from decimal import Decimal, InvalidOperation
+from hashlib import sha256
+from itertools import batched
+from typing import Any, Iterable, Iterator, Optional, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+from midas.services import period_report_cache
+
+from midas.db import journal_ledger
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.util.dates import month_of
+from midas.util.enums import TransactionType
+
+type ImportRecord = tuple[str, int, datetime, str, Optional[str], Decimal]
+# `(total, count)` of imported transactions per type and month
+type ImportTotals = dict[tuple[TransactionType, date], tuple[Decimal, int]]
+
+REQUIRED_COLUMNS = ("date", "type", "title", "amount")
+DATE_FORMATS = ("%Y-%m-%d", "%d/%m/%Y")
+
+
+@dataclass
+class ImportResult:
+    """
+    Outcome of a bank statement import. `rows` is the number of valid
+    rows, `invalid_lines` keeps the line numbers of the first
+    `MAX_REPORTED_LINES` invalid rows only.
+    """
+
+    MAX_REPORTED_LINES = 10
+
+    rows: int = 0
+    imported: int = 0
+    duplicates: int = 0
+    invalid: int = 0
+    invalid_lines: list[int] = field(default_factory=list)
+
+    def add_invalid(self, line: int) -> None:
+        self.invalid += 1
+        if len(self.invalid_lines) < self.MAX_REPORTED_LINES:
+            self.invalid_lines.append(line)
+
+
+def _parse_record(row: dict[str, Any]) -> tuple[Any, ...]:
+    raw_date = (row["date"] or "").strip()
+    for date_format in DATE_FORMATS:
+        try:
+            day = datetime.strptime(raw_date, date_format).date()
+            break
+        except ValueError:
+            continue
+    else:
+        raise ValueError(f"Invalid date {raw_date!r}")
+
+    transaction_type = TransactionType.from_readable((row["type"] or "").strip())
+
+    title = (row["title"] or "").strip()
+    if not 0 < len(title) <= 64:
+        raise ValueError("Title must be 1 to 64 characters long")
+
+    description = (row.get("description") or "").strip() or None
+    if description is not None and len(description) > 256:
+        raise ValueError("Description must be at most 256 characters long")
+
+    amount = Decimal((row["amount"] or "").strip()).quantize(Decimal("0.01"))
+    if not Decimal(0) < amount < Decimal(10**10):
+        raise ValueError(f"Invalid amount {amount}")
+
+    created_at = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    if created_at > datetime.now(timezone.utc):
+        raise ValueError(f"Date {day} is in the future")
+    return (int(transaction_type), created_at, title, description, amount)
+
+
+def parse_statement(
+    lines: Iterable[str], result: ImportResult
+) -> Iterator[ImportRecord]:
+    """
+    Parse a CSV bank statement lazily. The header must name at least the
+    `date`, `type`, `title` and `amount` columns, `description` is optional.
+    Invalid rows are skipped and counted in `result`.
+
+    Every record gets an import hash computed from its values and the
+    number of identical rows before it, so identical rows within one
+    statement are kept while re-importing the statement yields the same
+    hashes.
+
+    :param lines: lines of the CSV file
+    :type lines: Iterable[str]
+    :param result: import result counting valid and invalid rows
+    :type result: ImportResult
+    :return: iterator of `(import_hash, transaction_type_id, created_at,
+    title, description, amount)` records
+    :rtype: Iterator[ImportRecord]
+    :raise ValueError: if a required column is missing in the header.
+    """
+    reader = DictReader(lines)
+    if reader.fieldnames is None:
+        raise ValueError("The statement is empty")
+
+    reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+    missing = [name for name in REQUIRED_COLUMNS if name not in reader.fieldnames]
+    if len(missing) > 0:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+
+    def records() -> Iterator[ImportRecord]:
+        # only digests of distinct rows are kept, not the rows themselves
+        occurrences: dict[bytes, int] = {}
+        for row in reader:
+            try:
+                record = _parse_record(row)
+            except (KeyError, ValueError, InvalidOperation):
+                result.add_invalid(reader.line_num)
+                continue
+
+            key = sha256("\x1f".join(str(value) for value in record).encode()).digest()
+            occurrence = occurrences.get(key, 0)
+            occurrences[key] = occurrence + 1
+
+            import_hash = sha256(key + occurrence.to_bytes(8)).hexdigest()
+            result.rows += 1
+            yield (import_hash, *record)
+
+    return records()
+
+
+class ImportTransactionsUsecase(AbstractUsecase[ImportResult]):
+    """
+    Import transactions usecase class. The object created via this class
+    imports a CSV bank statement of any size as transactions of a user.
+
+    Rows imported before are recognized by their import hash and skipped,
+    so importing the same statement twice has no effect. The account and
+    balance changes are aggregated per transaction type and applied once,
+    the same goes for the monthly aggregates. With `LEDGER_MODE=journal`
+    the account and balance changes are left to the journal compactor.
+    """
+
+    JOURNAL = journal_ledger
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._transaction_repo = TransactionRepository(self._session)
+        self._account_repo = AccountRepository(self._session)
+        self._account_period_repo = AccountPeriodRepository(self._session)
+        self._user_repo = UserRepository(self._session)
+        self._aggregate_repo = MonthlyAggregateRepository(self._session)
+
+    async def _import_with_copy(
+        self, user_id: int, records: Iterator[ImportRecord]
+    ) -> ImportTotals:
+        await self._transaction_repo.stage_imports(records)
+        rows = await self._transaction_repo.insert_staged_imports(
+            user_id, folded=not self.JOURNAL
+        )
+
+        return {
+            (TransactionType(row.transaction_type_id), row.period): (
+                row.total,
+                row.imported,
+            )
+            for row in rows
+        }
+
+    async def _import_in_chunks(
+        self,
+        user_id: int,
+        records: Iterator[ImportRecord],
+        accounts: dict[tuple[int, int], int],
+        chunk_size: int,
+    ) -> ImportTotals:
+        totals: ImportTotals = {}
+        income_account_id = accounts[(user_id, TransactionType.INCOME)]
+
+        for chunk in batched(records, chunk_size):
+            known = await self._transaction_repo.get_import_hashes(
+                user_id,
+                (record[0] for record in chunk),
+                (
+                    min(record[2] for record in chunk),
+                    max(record[2] for record in chunk),
+                ),
+            )
+
+            values = []
+            for import_hash, type_id, created_at, title, description, amount in chunk:
+                if import_hash in known:
+                    continue
+
+                transaction_type = TransactionType(type_id)
+                is_income = transaction_type == TransactionType.INCOME
+                values.append(
+                    {
+                        "user_id": user_id,
+                        "transaction_type_id": type_id,
+                        "created_at": created_at,
+                        "title": title,
+                        "description": description,
+                        "amount": amount,
+                        "debit_account_id": accounts[(user_id, type_id)],
+                        "credit_account_id": None if is_income else income_account_id,
+                        "import_hash": import_hash,
+                        "folded": not self.JOURNAL,
+                    }
+                )
+                key = (transaction_type, month_of(created_at))
+                total, count = totals.get(key, (Decimal(), 0))
+                totals[key] = (total + amount, count + 1)
+
+            await self._transaction_repo.insert_many(values)
+
+        return totals
+
+    @override
+    async def execute(
+        self, user_id: int, lines: Iterable[str], chunk_size: int = 1000
+    ) -> ImportResult:
+        """
+        Import a CSV bank statement as transactions of `user_id` user.
+
+        On PostgreSQL the rows are streamed to a staging table with binary
+        `COPY` and moved to `transactions` with one statement. Other
+        dialects insert the new rows in chunks of `chunk_size`. In both
+        cases the file is never loaded into memory at once.
+
+        :param user_id: user's telegram id
+        :type user_id: int
+        :param lines: lines of the CSV file, see `parse_statement()`
+        :type lines: Iterable[str]
+        :param chunk_size: number of rows inserted at once when `COPY`
+        isn't available.
+        :type chunk_size: int
+        :return: number of imported, duplicate and invalid rows
+        :rtype: ImportResult
+        :raise ValueError: if the user doesn't exist or the statement has
+        no valid header.
+        """
+        app_logger.debug(f"Started `ImportTransactionsUsecase` execution: {user_id}")
+
+        result = ImportResult()
+        async with self._session:
+            accounts = await self._account_repo.get_ids_by_user_ids([user_id])
+            if len(accounts) == 0:
+                app_logger.debug(
+                    "Finished `ImportTransactionsUsecase` execution too soon because user does not exist"
+                )
+                raise ValueError(f"No user with {user_id=} exists")
+
+            records = parse_statement(lines, result)
+            if self._session.bind.dialect.name == "postgresql":
+                totals = await self._import_with_copy(user_id, records)
+            else:
+                totals = await self._import_in_chunks(
+                    user_id, records, accounts, chunk_size
+                )
+
+            # the same double-entry effects as `CreateTransactionUsecase`,
+            # summed up per transaction type and month
+            income_account_id = accounts[(user_id, TransactionType.INCOME)]
+            deltas: dict[tuple[int, date], tuple[Decimal, Decimal]] = {}
+            balance = Decimal()
+            for (transaction_type, period), (total, _) in totals.items():
+                key = (accounts[(user_id, transaction_type)], period)
+                debit, credit = deltas.get(key, (Decimal(), Decimal()))
+                deltas[key] = (debit + total, credit)
+
+                if transaction_type == TransactionType.INCOME:
+                    balance += total
+                else:
+                    key = (income_account_id, period)
+                    debit, credit = deltas.get(key, (Decimal(), Decimal()))
+                    deltas[key] = (debit, credit + total)
+                    balance -= total
+
+            if not self.JOURNAL:
+                await self._account_period_repo.apply_deltas(deltas)
+                if balance != 0:
+                    await self._user_repo.apply_balance_deltas({user_id: balance})
+                await self._aggregate_repo.apply_deltas(
+                    {
+                        (user_id, period, transaction_type): value
+                        for (transaction_type, period), value in totals.items()
+                    }
+                )
+
+            await self._session.commit()
+
+        result.imported = sum(count for _, count in totals.values())
+        if result.imported > 0:
+            # the statement may go back to periods already reported
+            await period_report_cache.invalidate(user_id)
+        result.duplicates = result.rows - result.imported
+        app_logger.debug(
+            f"Successfully imported {result.imported} transactions: {user_id}"
+        )
+        return result
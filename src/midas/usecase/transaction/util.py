@@ -0,0 +1,112 @@
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable, Optional
+from uuid import UUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.util.enums import TransactionType
+
+type AccountDeltas = dict[tuple[int, date], tuple[Decimal, Decimal]]
+type BalanceDeltas = dict[int, Decimal]
+type AggregateDeltas = dict[tuple[int, date, int], tuple[Decimal, int]]
+
+
+def get_balance_deltas(
+    rows: Iterable[Any], sign: int = 1
+) -> tuple[AccountDeltas, BalanceDeltas]:
+    """
+    Get the double-entry effects of the transactions summed up by
+    `TransactionRepository.delete_many()` or `fold()`. An income is
+    debited to the income account and added to the balance, an expense
+    is debited to its account, credited to the income account and
+    subtracted from the balance. The accounts are changed in the month
+    of the transactions, see `AccountPeriod`.
+
+    :param rows: rows with `user_id`, `transaction_type_id`, `period`,
+    `debit_account_id`, `credit_account_id` and `total`
+    :type rows: Iterable[Any]
+    :param sign: 1 to apply the transactions, -1 to revert them
+    :type sign: int
+    :return: `(debit, credit)` deltas by `(account_id, period)` and
+    balance deltas by user id
+    :rtype: tuple[AccountDeltas, BalanceDeltas]
+    """
+    accounts: defaultdict[tuple[int, date], tuple[Decimal, Decimal]] = defaultdict(
+        lambda: (Decimal(), Decimal())
+    )
+    balances: defaultdict[int, Decimal] = defaultdict(Decimal)
+
+    for row in rows:
+        total = sign * row.total
+        key = (row.debit_account_id, row.period)
+        debit, credit = accounts[key]
+        accounts[key] = (debit + total, credit)
+
+        if row.transaction_type_id == TransactionType.INCOME:
+            balances[row.user_id] += total
+        else:
+            key = (row.credit_account_id, row.period)
+            debit, credit = accounts[key]
+            accounts[key] = (debit, credit + total)
+            balances[row.user_id] -= total
+
+    return dict(accounts), dict(balances)
+
+
+def get_aggregate_deltas(rows: Iterable[Any], sign: int = 1) -> AggregateDeltas:
+    """
+    Get the changes of the monthly aggregates made by the transactions
+    summed up by `TransactionRepository.delete_many()` or `fold()`.
+
+    :param rows: rows with `user_id`, `period`, `transaction_type_id`,
+    `total` and `entries`
+    :type rows: Iterable[Any]
+    :param sign: 1 to count the transactions in, -1 to take them out
+    :type sign: int
+    :return: `(total, count)` deltas by `(user_id, period,
+    transaction_type_id)`
+    :rtype: AggregateDeltas
+    """
+    aggregates: defaultdict[tuple[int, date, int], tuple[Decimal, int]] = defaultdict(
+        lambda: (Decimal(), 0)
+    )
+    for row in rows:
+        key = (row.user_id, row.period, row.transaction_type_id)
+        total, count = aggregates[key]
+        aggregates[key] = (total + sign * row.total, count + sign * row.entries)
+    return dict(aggregates)
+
+
+async def fold_journal(
+    session: AsyncSession,
+    user_id: Optional[int] = None,
+    ids: Optional[Iterable[UUID]] = None,
+    limit: Optional[int] = None,
+) -> int:
+    """
+    Fold the journal tail into the account amounts, the balances and the
+    monthly aggregates in the current transaction of `session` without
+    committing it, see `Transaction.folded`.
+
+    :param session: session of the current transaction
+    :type session: AsyncSession
+    :param user_id: fold only the transactions of the user
+    :type user_id: Optional[int]
+    :param ids: fold only the transactions with the ids
+    :type ids: Optional[Iterable[UUID]]
+    :param limit: maximal number of transactions to fold
+    :type limit: Optional[int]
+    :return: number of folded transactions
+    :rtype: int
+    """
+    rows = await TransactionRepository(session).fold(user_id, ids, limit)
+    accounts, balances = get_balance_deltas(rows)
+    await AccountPeriodRepository(session).apply_deltas(accounts)
+    await UserRepository(session).apply_balance_deltas(balances)
+    await MonthlyAggregateRepository(session).apply_deltas(get_aggregate_deltas(rows))
+    return sum(row.entries for row in rows)
@@ -1,13 +1,18 @@
 from .register_user_usecase import RegisterUserUsecase
 from .delete_user_usecase import DeleteUserUsecase
 from .get_user_usecase import GetUserUsecase
+from .get_balance_usecase import GetBalanceUsecase
 from .edit_user_usecase import EditUserUsecase
 from .get_all_users_usecase import GetAllUsersUsecase
+from .purge_deleted_users_usecase import PurgeDeletedUsersUsecase, PurgeResult
 
 __all__ = (
     "RegisterUserUsecase",
     "DeleteUserUsecase",
     "GetUserUsecase",
+    "GetBalanceUsecase",
     "EditUserUsecase",
     "GetAllUsersUsecase",
+    "PurgeDeletedUsersUsecase",
+    "PurgeResult",
 )
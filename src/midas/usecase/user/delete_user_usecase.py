@@ -3,9 +3,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.loggers import app_logger
 
-from midas.query.account import AccountRepository
 from midas.query.event import EventRepository
-from midas.query.transaction import TransactionRepository
+from midas.query.notification import NotificationRepository
 from midas.query.user import UserRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
 
@@ -14,25 +13,31 @@ class DeleteUserUsecase(AbstractUsecase[None]):
     """
     Delete user usecase. This class deletes all user-generated
     data produced by the user as well as their profile.
+
+    The user is only marked deleted here, so the bot answers right away
+    no matter how long the user's history is. The data is purged in
+    bounded batches by `PurgeDeletedUsersUsecase` afterwards.
     """
 
     @override
     def __init__(self, session: AsyncSession | None = None) -> None:
         super().__init__(session)
         self._user_repo = UserRepository(self._session)
-        self._account_repo = AccountRepository(self._session)
-        self._transaction_repo = TransactionRepository(self._session)
         self._event_repo = EventRepository(self._session)
+        self._notification_repo = NotificationRepository(self._session)
 
     @override
     async def execute(self, user_id: int) -> None:
         """
         Delete all user-generated content and their profile.
 
-        What's the subject of being purged:
+        The user is marked deleted and their events and pending
+        notifications are deleted at once, so nothing is run or sent on
+        their behalf anymore. The rest is purged in the background:
         * Transactions
+        * Monthly aggregates
         * Accounts
-        * Events
+        * The profile itself
 
         NOTE: Changes done with this method are irreversible!
 
@@ -45,16 +50,15 @@ class DeleteUserUsecase(AbstractUsecase[None]):
 
         async with self._session:
             user = await self._user_repo.get_by_id(user_id)
-            if user is None:
+            if user is None or user.deleted_at is not None:
                 app_logger.debug(
                     "Finished `DeleteUserUsecase` execution too soon because user does not exist"
                 )
                 raise ValueError(f"No user with {user_id=} exists")
 
-            await self._transaction_repo.purge_by_user_id(user_id)
-            await self._account_repo.purge_by_user_id(user_id)
+            await self._user_repo.mark_deleted(user_id)
             await self._event_repo.purge_by_user_id(user_id)
-            await self._user_repo.delete_by_id(user_id)
+            await self._notification_repo.purge_by_user_id(user_id)
             await self._session.commit()
 
-        app_logger.debug(f"Successfully deleted the user: {user_id}")
+        app_logger.debug(f"Successfully marked the user deleted: {user_id}")
@@ -7,6 +7,7 @@ from midas.services import user_storage
 from midas.db.schemas.user import User
 from midas.query.user import UserRepository
 from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.retry import retry_on_stale_data
 from midas.util.enums import Currency
 from midas.util.errors import NoChangesDetectedException
 
@@ -48,6 +49,7 @@ class EditUserUsecase(AbstractUsecase[None]):
         return updates
 
     @override
+    @retry_on_stale_data()
     async def execute(
         self,
         user_id: int,
@@ -0,0 +1,38 @@
+from decimal import Decimal
+from typing import Optional, override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.query.user import UserRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+
+
+class GetBalanceUsecase(AbstractUsecase[Optional[Decimal]]):
+    """
+    Get balance usecase. Use this class to get the current balance of a
+    user, including the transactions the journal compactor didn't fold
+    yet, see `UserRepository.get_balance()`.
+    """
+
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self.user_repo = UserRepository(self._session)
+
+    @override
+    async def execute(self, user_id: int) -> Optional[Decimal]:
+        """
+        Get the balance of the user with the `user_id` provided.
+
+        :param user_id: user's telegram id.
+        :type user_id: int
+        :return: balance or `None` if no user was found or the user was
+        deleted.
+        :rtype: Optional[Decimal]
+        """
+        app_logger.debug(f"Started `GetBalanceUsecase` execution: {user_id}")
+
+        async with self._session:
+            balance = await self.user_repo.get_balance(user_id)
+            app_logger.debug("Successfully returned balance back")
+            return balance
@@ -25,12 +25,15 @@ class GetUserUsecase(AbstractUsecase[Optional[User]]):
 
         :param user_id: user's telegram id.
         :type user_id: int
-        :return: `User` database row or `None` if no user was found.
+        :return: `User` database row or `None` if no user was found or
+        the user was deleted.
         :rtype: Optional[User]
         """
         app_logger.debug("Started `GetUserUsecase` execution")
 
         async with self._session:
             user = await self.user_repo.get_by_id(user_id)
+            if user is not None and user.deleted_at is not None:
+                user = None
             app_logger.debug("Successfully returned user back")
             return user
@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+from typing import override
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.loggers import app_logger
+
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.event import EventRepository
+from midas.query.interface.purgeable import Purgeable
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.notification import NotificationRepository
+from midas.query.report import ReportRepository
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+
+
+@dataclass
+class PurgeResult:
+    """
+    Outcome of a purge run. `pending` is the number of users marked
+    deleted whose data is not purged completely yet.
+    """
+
+    rows: int = 0
+    users: int = 0
+    pending: int = 0
+
+
+class PurgeDeletedUsersUsecase(AbstractUsecase[PurgeResult]):
+    """
+    Purge deleted users usecase class. The object created via this class
+    purges the data of the users marked deleted by `DeleteUserUsecase`.
+
+    Rows are deleted in batches of bounded size, each batch in its own
+    transaction, so the row locks are held shortly and the WAL is written
+    gradually however long the user's history is. A run that ran out of
+    batches is continued by the next one.
+    """
+
+    @override
+    def __init__(self, session: AsyncSession | None = None) -> None:
+        super().__init__(session)
+        self._user_repo = UserRepository(self._session)
+        # the rows referencing accounts go before accounts
+        self._repos: tuple[Purgeable, ...] = (
+            EventRepository(self._session),
+            NotificationRepository(self._session),
+            ReportRepository(self._session),
+            TransactionRepository(self._session),
+            MonthlyAggregateRepository(self._session),
+            AccountPeriodRepository(self._session),
+            AccountRepository(self._session),
+        )
+
+    @override
+    async def execute(
+        self, batch_size: int = 1000, max_batches: int = 100
+    ) -> PurgeResult:
+        """
+        Purge the data and the profiles of the users marked deleted,
+        starting from the earliest deleted one.
+
+        :param batch_size: maximal number of rows deleted in one transaction
+        :type batch_size: int
+        :param max_batches: maximal number of non-empty batches in this run
+        :type max_batches: int
+        :return: number of deleted rows, purged and pending users
+        :rtype: PurgeResult
+        """
+        app_logger.debug("Started `PurgeDeletedUsersUsecase` execution")
+
+        result = PurgeResult()
+        batches = 0
+        async with self._session:
+            user_ids = await self._user_repo.get_deleted_ids()
+            await self._session.commit()
+
+            for done, user_id in enumerate(user_ids):
+                for repo in self._repos:
+                    deleted = batch_size
+                    while deleted == batch_size:
+                        # only batches that deleted something are counted,
+                        # so every run makes progress
+                        if batches == max_batches:
+                            result.pending = len(user_ids) - done
+                            app_logger.debug(
+                                f"Paused purge of deleted users: {result.rows} rows deleted"
+                            )
+                            return result
+
+                        deleted = await repo.purge_by_user_id(user_id, batch_size)
+                        await self._session.commit()
+                        if deleted == 0:
+                            break
+
+                        batches += 1
+                        result.rows += deleted
+                        app_logger.debug(
+                            f"Purged {deleted} rows of {type(repo).__name__}: {user_id}"
+                        )
+
+                await self._user_repo.delete_by_id(user_id)
+                await self._session.commit()
+                result.users += 1
+                app_logger.info(f"Purged the data of a deleted user: {user_id}")
+
+        app_logger.debug(
+            f"Successfully purged {result.users} deleted users: {result.rows} rows deleted"
+        )
+        return result
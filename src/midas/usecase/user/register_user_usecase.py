@@ -10,6 +10,7 @@ from midas.db.schemas.account import Account
 from midas.db.schemas.user import User
 from midas.usecase.abstract_usecase import AbstractUsecase
 from midas.util.enums import Currency, TransactionType
+from midas.util.errors import UserDeletionPendingException
 
 
 class RegisterUserUsecase(AbstractUsecase[None]):
@@ -45,11 +46,18 @@ class RegisterUserUsecase(AbstractUsecase[None]):
         :type currency: Currency
 
         :raise KeyError: if user with `user_id` already exists.
+        :raise UserDeletionPendingException: if the user was deleted but
+        their data isn't purged yet.
         """
         app_logger.debug("Started `RegisterUserUsecase` execution")
 
         async with self._session:
             user = await self._user_repo.get_by_id(user_id)
+            if user is not None and user.deleted_at is not None:
+                app_logger.debug(
+                    "Finished `RegisterUserUsecase` execution too soon because user is being deleted"
+                )
+                raise UserDeletionPendingException()
             if user is not None:
                 app_logger.debug(
                     "Finished `RegisterUserUsecase` execution too soon because user already exists"
@@ -0,0 +1,62 @@
+from datetime import date, datetime, timezone
+
+
+def month_of(moment: datetime) -> date:
+    """
+    Get the first day of the month `moment` falls in, in UTC. Naive
+    datetimes are considered to be in UTC already.
+
+    :param moment: point in time
+    :type moment: datetime
+    :return: first day of the month
+    :rtype: date
+    """
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return date(moment.year, moment.month, 1)
+
+
+def next_month(day: date) -> date:
+    """
+    Get the first day of the month after the one `day` falls in.
+
+    :param day: any day of the month
+    :type day: date
+    :return: first day of the next month
+    :rtype: date
+    """
+    if day.month == 12:
+        return date(day.year + 1, 1, 1)
+    return date(day.year, day.month + 1, 1)
+
+
+def previous_month(day: date) -> date:
+    """
+    Get the first day of the month before the one `day` falls in.
+
+    :param day: any day of the month
+    :type day: date
+    :return: first day of the previous month
+    :rtype: date
+    """
+    if day.month == 1:
+        return date(day.year - 1, 12, 1)
+    return date(day.year, day.month - 1, 1)
+
+
+def get_upcoming_months(day: date, months_ahead: int) -> list[date]:
+    """
+    Get the first days of the month `day` falls in and of the
+    `months_ahead` months after it.
+
+    :param day: any day of the first month
+    :type day: date
+    :param months_ahead: number of months after the first one
+    :type months_ahead: int
+    :return: first days of the months in chronological order
+    :rtype: list[date]
+    """
+    months = [day.replace(day=1)]
+    for _ in range(months_ahead):
+        months.append(next_month(months[-1]))
+    return months
@@ -1,2 +1,6 @@
 class NoChangesDetectedException(Exception):
     pass
+
+
+class UserDeletionPendingException(Exception):
+    pass
@@ -0,0 +1,121 @@
+# This file is meant to be ran with poetry via `poetry run worker`
+# however it still provides the entry point at the bottom.
+from argparse import ArgumentParser
+from asyncio import create_task, run
+from multiprocessing import get_context
+from os import cpu_count, getenv
+from typing import Optional
+
+from midas.loggers import app_logger, load_logging_config
+from midas.db import engine
+from midas.services import outbox_dispatcher, scheduler
+
+from midas.platform.telegram.bot import bot
+from midas.platform.telegram.service.notifier import TelegramNotifier
+from midas.service.metrics import start_metrics_server
+from midas.service.pool_monitor import PoolMonitor
+from midas.service.schedule import EventHandler
+
+
+async def run_worker(
+    claimers: int, chunk_size: int, metrics_port: Optional[int] = None
+) -> None:
+    """
+    Run event handling in the current process without the Telegram poller.
+
+    :param claimers: number of coroutines claiming due events
+    :type claimers: int
+    :param chunk_size: number of events claimed and posted at once
+    :type chunk_size: int
+    :param metrics_port: local port of the metrics endpoint, `None`
+    disables it.
+    :type metrics_port: Optional[int]
+    """
+    if metrics_port is not None:
+        await start_metrics_server(port=metrics_port)
+
+    interval = float(getenv("DB_POOL_STATS_INTERVAL", "300") or 0)
+    monitor = PoolMonitor(engine, interval)
+    monitoring = create_task(monitor.loop()) if interval > 0 else None
+
+    notifier = TelegramNotifier(bot)
+    notifier.start()
+    dispatching = create_task(outbox_dispatcher.loop(notifier))
+    scheduler.add(EventHandler(chunk_size=chunk_size, claim=True, claimers=claimers))
+    try:
+        await scheduler.loop()
+    finally:
+        dispatching.cancel()
+        if monitoring is not None:
+            monitoring.cancel()
+        await notifier.stop()
+        await bot.session.close()
+
+
+def _start_process(claimers: int, chunk_size: int, metrics_port: Optional[int]) -> None:
+    load_logging_config()
+    try:
+        run(run_worker(claimers, chunk_size, metrics_port))
+    except KeyboardInterrupt:
+        pass
+
+
+def main() -> None:
+    parser = ArgumentParser(description="Run midas event workers.")
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=cpu_count() or 1,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "-c",
+        "--claimers",
+        type=int,
+        default=1,
+        help="number of coroutines claiming events in each process",
+    )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=500,
+        help="number of events claimed and posted in one transaction",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="serve metrics of the n-th worker on port METRICS_PORT + n",
+    )
+    args = parser.parse_args()
+
+    load_logging_config()
+    app_logger.info(f"Starting {args.workers} event workers")
+
+    # every process creates its own engine and connection pool
+    ctx = get_context("spawn")
+    processes = [
+        ctx.Process(
+            target=_start_process,
+            args=(
+                args.claimers,
+                args.chunk_size,
+                None if args.metrics_port is None else args.metrics_port + i,
+            ),
+        )
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+from decimal import Decimal
+from pytest import mark, raises
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+import midas.query.session
+from midas.db.replica import ReplicaRouter
+from midas.query.session import create_session, route_read_only, session_factory
+from midas.usecase.transaction import CreateTransactionUsecase, GetTransactionsUsecase
+from midas.usecase.user import GetUserUsecase, RegisterUserUsecase
+from midas.util.enums import Currency, TransactionType
+
+
+@mark.asyncio
+async def test_replica_router():
+    assert await ReplicaRouter(None).check() is False
+    assert ReplicaRouter(None).engine is None
+
+    replica = create_async_engine("sqlite+aiosqlite://")
+    try:
+        router = ReplicaRouter(replica)
+        # never checked
+        assert router.engine is None
+
+        assert await router.check() is True
+        assert router.engine is replica
+        assert router.lag == 0
+
+        lagging = ReplicaRouter(replica, max_lag=-1)
+        assert await lagging.check() is False
+        assert lagging.engine is None
+    finally:
+        await replica.dispose()
+
+
+@mark.asyncio
+async def test_replica_router_unreachable_replica():
+    replica = create_async_engine("sqlite+aiosqlite:////nonexistent/midas.db")
+    try:
+        router = ReplicaRouter(replica)
+        assert await router.check() is False
+        assert router.engine is None
+    finally:
+        await replica.dispose()
+
+
+@mark.asyncio
+async def test_read_only_routing(test_engine, monkeypatch):
+    replica = create_async_engine("sqlite+aiosqlite://")
+    router = ReplicaRouter(replica)
+    monkeypatch.setattr(midas.query.session, "engine", test_engine)
+    monkeypatch.setattr(midas.query.session, "replica_router", router)
+    try:
+        session = session_factory(bind=test_engine)
+        # the replica wasn't checked yet
+        assert route_read_only(session) is session
+        assert create_session(read_only=True).bind is not replica
+
+        await router.check()
+        assert route_read_only(session).bind is replica
+        assert create_session(read_only=True).bind is replica
+        assert create_session().bind is not replica
+
+        # only read-only usecases leave the session they were handed
+        assert GetTransactionsUsecase(session).get_session().bind is replica
+        assert GetUserUsecase(session).get_session() is session
+
+        # reads following a write see the write
+        await session.commit()
+        assert route_read_only(session) is session
+        await session.close()
+
+        # sessions of other engines, e.g. in tests, are never rerouted
+        other = AsyncSession(create_async_engine("sqlite+aiosqlite://"))
+        assert route_read_only(other) is other
+    finally:
+        await replica.dispose()
+
+
+@mark.asyncio
+async def test_read_only_usecase_falls_back_to_primary(test_engine, monkeypatch):
+    user_id = 123456789
+    await RegisterUserUsecase(AsyncSession(test_engine)).execute(user_id, Currency.EUR)
+    await CreateTransactionUsecase(AsyncSession(test_engine)).execute(
+        user_id, TransactionType.INCOME, "Salary", Decimal("1000")
+    )
+
+    # reachable when it was checked, gone by the time it's read from
+    replica = create_async_engine("sqlite+aiosqlite:////nonexistent/midas.db")
+    router = ReplicaRouter(replica)
+    router._set_available(True, "checked")
+    monkeypatch.setattr(midas.query.session, "engine", test_engine)
+    monkeypatch.setattr(midas.query.session, "replica_router", router)
+    try:
+        usecase = GetTransactionsUsecase(session_factory(bind=test_engine))
+        assert usecase.get_session().bind is replica
+
+        transactions = await usecase.execute(user_id)
+        assert [t.title for t in transactions] == ["Salary"]
+        assert usecase.get_session().bind is test_engine
+        assert router.engine is None
+    finally:
+        await replica.dispose()
+
+
+@mark.asyncio
+async def test_read_only_usecase_raises_errors_of_the_primary(test_engine):
+    # no replica involved, nothing to fall back to
+    usecase = GetTransactionsUsecase(AsyncSession(test_engine))
+    await usecase.get_session().close()
+    async with test_engine.begin() as connection:
+        await connection.execute(text("DROP TABLE transactions"))
+
+    with raises(OperationalError):
+        await usecase.execute(123456789)
@@ -224,3 +224,20 @@ async def test_add_many_and_delete_all(test_repo):
             await test_repo.flush()
             fetched_user = await test_repo.get_by_id(i)
             assert not fetched_user
+
+
+@mark.asyncio
+async def test_add_many_and_stream_all(test_repo):
+    async with test_repo._session:
+        users = [
+            User(id=123456789, currency_id=Currency.EUR.value),
+            User(id=123456788, currency_id=Currency.USD.value),
+            User(id=123456787, currency_id=Currency.UAH.value),
+            User(id=123456786, currency_id=Currency.EUR.value),
+        ]
+        test_repo.add_many(users)
+        await test_repo.flush()
+
+        streamed = [user async for user in test_repo.stream(chunk_size=3)]
+
+        assert sorted(user.id for user in streamed) == sorted(user.id for user in users)
@@ -0,0 +1,14 @@
+from datetime import date
+
+from midas.query.transaction import TransactionRepository
+
+
+def test_get_partition_name():
+    assert (
+        TransactionRepository.get_partition_name(date(2025, 1, 31))
+        == "transactions_y2025m01"
+    )
+    assert (
+        TransactionRepository.get_partition_name(date(2025, 12, 1))
+        == "transactions_y2025m12"
+    )
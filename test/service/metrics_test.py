@@ -0,0 +1,80 @@
+from asyncio import open_connection
+from pytest import mark, raises
+
+from midas.service.metrics import (
+    Metric,
+    MetricsRegistry,
+    registry,
+    start_metrics_server,
+)
+
+
+def test_render_counter_with_labels():
+    metrics = MetricsRegistry()
+    counter = metrics.counter("test_failures_total", "Failures")
+    counter.inc(job="EventHandler")
+    counter.inc(2, job="EventHandler")
+
+    text = metrics.render()
+
+    assert "# TYPE test_failures_total counter" in text
+    assert 'test_failures_total{job="EventHandler"} 3' in text
+
+
+def test_render_histogram_buckets():
+    metrics = MetricsRegistry()
+    histogram = metrics.histogram("test_seconds", "Durations", buckets=(0.1, 1))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    text = metrics.render()
+
+    assert 'test_seconds_bucket{le="0.1"} 1' in text
+    assert 'test_seconds_bucket{le="1"} 2' in text
+    assert 'test_seconds_bucket{le="+Inf"} 3' in text
+    assert "test_seconds_sum 5.55" in text
+    assert "test_seconds_count 3" in text
+
+
+def test_gauge_reads_function():
+    metrics = MetricsRegistry()
+    gauge = metrics.gauge("test_depth", "Depth")
+    gauge.set_function(lambda: 42)
+
+    assert "test_depth 42" in metrics.render()
+
+
+def test_counter_reads_function():
+    metrics = MetricsRegistry()
+    counter = metrics.counter("test_handed_out_total", "Handed out")
+    counter.set_function(lambda: 7)
+
+    text = metrics.render()
+
+    assert "# TYPE test_handed_out_total counter" in text
+    assert "test_handed_out_total 7" in text
+
+
+def test_metric_without_samples_cannot_be_created():
+    class Untyped(Metric):
+        pass
+
+    with raises(TypeError):
+        Untyped("test_untyped", "Untyped")  # type: ignore
+
+
+@mark.asyncio
+async def test_metrics_server_serves_registry():
+    registry.counter("test_served_total", "Served").inc()
+    server = await start_metrics_server(port=0)
+    port = server.sockets[0].getsockname()[1]
+
+    reader, writer = await open_connection("127.0.0.1", port)
+    writer.write(b"GET /metrics HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    response = (await reader.read()).decode()
+    writer.close()
+    server.close()
+
+    assert response.startswith("HTTP/1.1 200 OK")
+    assert "test_served_total 1" in response
@@ -0,0 +1,51 @@
+from pytest import mark
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from midas.db.pool import InstrumentedPool
+from midas.service.metrics import registry
+from midas.service.pool_monitor import PoolMonitor
+
+
+@mark.asyncio
+async def test_pool_statistics():
+    engine = create_async_engine(
+        "sqlite+aiosqlite://", poolclass=InstrumentedPool, pool_size=1, max_overflow=1
+    )
+    monitor = PoolMonitor(engine)
+    try:
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+
+            stats = monitor.get_stats()
+            assert stats is not None
+            assert stats.size == 1
+            assert stats.checked_out == 2
+            assert stats.overflow == 1
+
+        stats = monitor.get_stats()
+        assert stats is not None
+        assert stats.checked_out == 0
+        assert stats.checkouts == 2
+        assert stats.max_wait >= 0
+        assert stats.total_wait >= stats.max_wait
+
+        rendered = registry.render()
+        assert "# TYPE midas_db_pool_checkouts_total counter" in rendered
+        assert "midas_db_pool_checkouts_total 2" in rendered
+        assert "# TYPE midas_db_pool_wait_seconds_total counter" in rendered
+        assert "midas_db_pool_checked_out 0" in rendered
+        monitor.log_stats()
+    finally:
+        await engine.dispose()
+
+
+@mark.asyncio
+async def test_pool_monitor_ignores_other_pools():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    try:
+        assert PoolMonitor(engine).get_stats() is None
+        assert "midas_db_pool_size 0" in registry.render()
+    finally:
+        await engine.dispose()
@@ -0,0 +1,123 @@
+from asyncio import gather
+from time import monotonic
+from typing import Optional, override
+from pytest import mark
+from pytest_asyncio import fixture
+
+from midas.service.queued_notifier import QueuedNotifier
+from midas.service.rate_limiting import TokenBucket
+
+
+class RetryableError(Exception): ...
+
+
+class SlowDownError(RetryableError): ...
+
+
+class FakeNotifier(QueuedNotifier):
+    def __init__(
+        self, failures: dict[int, list[Exception]] | None = None, **kwargs
+    ) -> None:
+        super().__init__(chat_interval=0, **kwargs)
+        self.sent: list[tuple[int, str]] = []
+        self.failures = failures or {}
+
+    @override
+    async def _send(self, user_id: int, msg: str) -> None:
+        errors = self.failures.get(user_id)
+        if errors:
+            raise errors.pop(0)
+        self.sent.append((user_id, msg))
+
+    @override
+    def _get_retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        return 0 if isinstance(error, RetryableError) else None
+
+    @override
+    def _get_pause(self, error: Exception) -> Optional[float]:
+        return 0.2 if isinstance(error, SlowDownError) else None
+
+
+@fixture
+async def test_notifier():
+    notifier = FakeNotifier()
+    yield notifier
+    await notifier.stop()
+
+
+@mark.asyncio
+async def test_notify_enqueues_without_waiting(test_notifier):
+    await test_notifier.notify(1, "hello")
+    await test_notifier.notify(2, "world")
+
+    assert test_notifier.stats.enqueued == 2
+    assert test_notifier.depth == 2
+    assert test_notifier.sent == []
+
+    await test_notifier.join()
+
+    assert test_notifier.depth == 0
+    assert sorted(test_notifier.sent) == [(1, "hello"), (2, "world")]
+    assert test_notifier.stats.delivered == 2
+
+
+@mark.asyncio
+async def test_notify_retries_failed_sends():
+    notifier = FakeNotifier({1: [RetryableError()]})
+
+    await notifier.notify(1, "hello")
+    await notifier.stop()
+
+    assert notifier.sent == [(1, "hello")]
+    assert notifier.stats.retried == 1
+    assert notifier.stats.delivered == 1
+
+
+@mark.asyncio
+async def test_notify_drops_undeliverable_messages():
+    notifier = FakeNotifier({1: [ValueError()]})
+
+    await notifier.notify(1, "hello")
+    await notifier.notify(2, "world")
+    await notifier.stop()
+
+    assert notifier.sent == [(2, "world")]
+    assert notifier.stats.failed == 1
+    assert notifier.stats.delivered == 1
+
+
+@mark.asyncio
+async def test_paused_bucket_holds_all_waiters():
+    bucket = TokenBucket(1000, 10)
+    bucket.pause(0.2)
+
+    start = monotonic()
+    await gather(*(bucket.acquire() for _ in range(3)))
+    assert monotonic() - start >= 0.2
+
+
+@mark.asyncio
+async def test_notify_pauses_all_workers_when_asked_to_slow_down():
+    notifier = FakeNotifier({1: [SlowDownError()]}, workers=1)
+
+    start = monotonic()
+    await notifier.notify(1, "hello")
+    await notifier.notify(2, "world")
+    await notifier.stop()
+
+    assert sorted(notifier.sent) == [(1, "hello"), (2, "world")]
+    assert monotonic() - start >= 0.2
+
+
+@mark.asyncio
+async def test_global_rate_is_shared_by_processes():
+    notifier = FakeNotifier(global_rate=20, processes=4)
+
+    start = monotonic()
+    for user_id in range(10):
+        await notifier.notify(user_id, "hello")
+    await notifier.stop()
+
+    # 5 messages per second with a burst of 5
+    assert len(notifier.sent) == 10
+    assert monotonic() - start >= 0.9
@@ -0,0 +1,37 @@
+from datetime import date, datetime, time, timedelta, timezone
+from pytest import MonkeyPatch, mark
+
+from midas.service.schedule import ReportHandler, report_handler
+from midas.util.dates import month_of, next_month, previous_month
+
+
+class FakeGenerateAllReportsUsecase:
+    periods: list[date] = []
+
+    async def execute(self, render, period: date) -> int:
+        self.periods.append(period)
+        return 0
+
+
+@mark.asyncio
+async def test_report_handler_reports_closed_month(monkeypatch: MonkeyPatch):
+    monkeypatch.setattr(
+        report_handler, "GenerateAllReportsUsecase", FakeGenerateAllReportsUsecase
+    )
+    FakeGenerateAllReportsUsecase.periods = []
+    handler = ReportHandler()
+    current = month_of(datetime.now(timezone.utc))
+
+    # the last closed month is reported right away
+    run_at = await handler.get_next_run_at()
+    assert run_at is not None and run_at <= datetime.now()
+    await handler.run()
+    assert FakeGenerateAllReportsUsecase.periods == [previous_month(current)]
+
+    # the current month is reported once it's closed, at midnight UTC
+    run_at = await handler.get_next_run_at()
+    assert run_at is not None
+    assert run_at.astimezone(timezone.utc) == datetime.combine(
+        next_month(current), time.min, timezone.utc
+    )
+    assert run_at - datetime.now() < timedelta(days=32)
@@ -0,0 +1,69 @@
+from asyncio import create_task, sleep
+from datetime import datetime, timedelta
+from typing import Optional
+from pytest import mark
+
+from midas.service.scheduler import Scheduler
+
+
+class FakeJob:
+    def __init__(self, run_at: Optional[datetime], update_interval: float = 3600):
+        self.run_at = run_at
+        self.update_interval = update_interval
+        self.runs = 0
+
+    async def get_next_run_at(self) -> Optional[datetime]:
+        return self.run_at
+
+    async def run(self) -> None:
+        self.runs += 1
+        self.run_at = None
+
+
+@mark.asyncio
+async def test_scheduler_runs_due_jobs():
+    due = FakeJob(datetime.now())
+    later = FakeJob(datetime.now() + timedelta(days=1))
+    scheduler = Scheduler()
+    scheduler.add(due)
+    scheduler.add(later)
+
+    task = create_task(scheduler.loop())
+    await sleep(0.05)
+    task.cancel()
+
+    assert due.runs == 1
+    assert later.runs == 0
+
+
+@mark.asyncio
+async def test_scheduler_wakes_up_on_new_deadline():
+    job = FakeJob(None)
+    scheduler = Scheduler()
+    scheduler.add(job)
+
+    task = create_task(scheduler.loop())
+    await sleep(0.05)
+    assert job.runs == 0
+
+    job.run_at = datetime.now()
+    scheduler.wake()
+    await sleep(0.05)
+    task.cancel()
+
+    assert job.runs == 1
+
+
+@mark.asyncio
+async def test_scheduler_rechecks_deadline_after_update_interval():
+    job = FakeJob(None, update_interval=0.01)
+    scheduler = Scheduler()
+    scheduler.add(job)
+
+    task = create_task(scheduler.loop())
+    await sleep(0.02)
+    job.run_at = datetime.now()
+    await sleep(0.05)
+    task.cancel()
+
+    assert job.runs == 1
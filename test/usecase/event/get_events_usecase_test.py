@@ -87,3 +87,27 @@ async def test_get_many_events(
 async def test_get_events_of_invalid_user(test_get_events):
     events = await test_get_events.execute(69420)
     assert len(events) == 0
+
+
+@mark.asyncio
+async def test_page_through_events_with_cursor(
+    test_register_usecase, test_create_event, test_get_events
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    for i in range(5):
+        await test_create_event.execute(
+            user_id,
+            TransactionType.BILLS_AND_FEES,
+            f"Bill {i}",
+            Decimal("10"),
+            EventFrequency.MONTHLY,
+        )
+
+    first = await test_get_events.execute(user_id, 3)
+    second = await test_get_events.execute(user_id, 3, after=first[-1].id)
+    assert len(first) == 3
+    assert len(second) == 2
+    assert [e.title for e in first + list(second)] == [
+        f"Bill {i}" for i in reversed(range(5))
+    ]
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from pytest import fixture, mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.usecase.event import GetNextEventRunUsecase
+from midas.util.enums import Currency, EventFrequency, TransactionType
+
+
+@fixture
+def test_get_next_event_run(test_engine) -> GetNextEventRunUsecase:
+    session = AsyncSession(test_engine)
+    usecase = GetNextEventRunUsecase(session=session)
+    return usecase
+
+
+@mark.asyncio
+async def test_get_next_event_run_without_events(test_get_next_event_run):
+    assert await test_get_next_event_run.execute() is None
+
+
+@mark.asyncio
+async def test_get_next_event_run_returns_earliest_date(
+    test_register_usecase, test_create_event, test_get_next_event_run
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    for frequency in (EventFrequency.MONTHLY, EventFrequency.DAILY):
+        await test_create_event.execute(
+            user_id=user_id,
+            transaction_type=TransactionType.BILLS_AND_FEES,
+            title="Rent",
+            amount=Decimal("400"),
+            frequency=frequency,
+        )
+
+    next_run_on = await test_get_next_event_run.execute()
+    assert next_run_on == date.today() + timedelta(days=1)
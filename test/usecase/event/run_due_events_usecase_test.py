@@ -0,0 +1,131 @@
+from datetime import date, timedelta
+from decimal import Decimal
+from pytest import fixture, mark
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.account import Account
+from midas.db.schemas.event import Event
+from midas.query.event import EventRepository
+from midas.query.notification import NotificationRepository
+from midas.usecase.event import RunDueEventsUsecase
+from midas.util.enums import Currency, EventFrequency, TransactionType
+
+
+@fixture
+def test_run_due_events(test_engine) -> RunDueEventsUsecase:
+    session = AsyncSession(test_engine)
+    usecase = RunDueEventsUsecase(session=session)
+    return usecase
+
+
+@mark.asyncio
+async def test_run_due_events_in_claimed_chunks(
+    test_engine,
+    test_register_usecase,
+    test_get_usecase,
+    test_create_event,
+    test_run_due_events,
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    for _ in range(3):
+        await test_create_event.execute(
+            user_id=user_id,
+            transaction_type=TransactionType.GROCERIES,
+            title="Groceries",
+            amount=Decimal("10"),
+            frequency=EventFrequency.DAILY,
+        )
+
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(update(Event).values(next_run_on=date.today()))
+        await session.commit()
+
+    assert len(await test_run_due_events.execute(2)) == 2
+    assert len(await test_run_due_events.execute(2)) == 1
+    assert len(await test_run_due_events.execute(2)) == 0
+
+    user = await test_get_usecase.execute(user_id)
+    assert user.balance == Decimal("-30")
+
+    session = AsyncSession(test_engine)
+    async with session:
+        assert len(await EventRepository(session).get_upcoming_events()) == 0
+
+
+@mark.asyncio
+async def test_run_due_events_without_due_events(test_run_due_events):
+    assert len(await test_run_due_events.execute()) == 0
+
+
+@mark.asyncio
+async def test_run_due_events_writes_notifications_to_outbox(
+    test_engine, test_register_usecase, test_create_event, test_run_due_events
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    await test_create_event.execute(
+        user_id=user_id,
+        transaction_type=TransactionType.INCOME,
+        title="Salary",
+        amount=Decimal("1000"),
+        frequency=EventFrequency.MONTHLY,
+    )
+
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(update(Event).values(next_run_on=date.today()))
+        await session.commit()
+
+    executed = await test_run_due_events.execute(
+        render=lambda event: f"New event: {event.title}"
+    )
+    assert len(executed) == 1
+
+    session = AsyncSession(test_engine)
+    async with session:
+        notifications = await NotificationRepository(session).claim_batch(
+            10, timedelta(minutes=1)
+        )
+        assert [(n.user_id, n.message) for n in notifications] == [
+            (user_id, "New event: Salary")
+        ]
+
+
+@mark.asyncio
+async def test_run_due_events_postpones_events_of_users_without_accounts(
+    test_engine, test_register_usecase, test_create_event, test_run_due_events
+):
+    orphan_id, user_id = 123456789, 987654321
+    for id in (orphan_id, user_id):
+        await test_register_usecase.execute(id, Currency.EUR)
+        await test_create_event.execute(
+            user_id=id,
+            transaction_type=TransactionType.GROCERIES,
+            title="Groceries",
+            amount=Decimal("10"),
+            frequency=EventFrequency.DAILY,
+        )
+
+    yesterday = date.today() - timedelta(days=1)
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(delete(Account).where(Account.user_id == orphan_id))
+        await session.execute(
+            update(Event).values(next_run_on=date.today(), last_run_on=yesterday)
+        )
+        await session.commit()
+
+    assert len(await test_run_due_events.execute(2)) == 1
+    assert len(await test_run_due_events.execute(2)) == 0
+
+    # the orphan's event isn't claimed again until its next run
+    session = AsyncSession(test_engine)
+    async with session:
+        assert len(await EventRepository(session).get_upcoming_events()) == 0
+        event = await session.scalar(select(Event).where(Event.user_id == orphan_id))
+        assert event is not None
+        assert event.next_run_on == date.today() + timedelta(days=1)
+        assert event.last_run_on == yesterday
@@ -0,0 +1,161 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pytest import fixture, mark
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.event import Event
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.event import EventRepository
+from midas.query.transaction import TransactionRepository
+from midas.usecase.event import GetUpcomingEventsUsecase, RunEventsBatchUsecase
+from midas.util.dates import month_of
+from midas.util.enums import Currency, EventFrequency, TransactionType
+
+
+@fixture
+def test_get_upcoming_events(test_engine) -> GetUpcomingEventsUsecase:
+    session = AsyncSession(test_engine)
+    usecase = GetUpcomingEventsUsecase(session=session)
+    return usecase
+
+
+@fixture
+def test_run_events_batch(test_engine) -> RunEventsBatchUsecase:
+    session = AsyncSession(test_engine)
+    usecase = RunEventsBatchUsecase(session=session)
+    return usecase
+
+
+async def make_events_due(test_engine) -> None:
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(update(Event).values(next_run_on=date.today()))
+        await session.commit()
+
+
+@mark.asyncio
+async def test_run_income_and_expense_events_in_batch(
+    test_engine,
+    test_register_usecase,
+    test_get_usecase,
+    test_create_event,
+    test_get_upcoming_events,
+    test_run_events_batch,
+):
+    user_id = 123456789
+    currency = Currency.EUR
+    await test_register_usecase.execute(user_id, currency)
+
+    events_data = [
+        {
+            "user_id": user_id,
+            "transaction_type": TransactionType.INCOME,
+            "title": "Salary",
+            "amount": Decimal("1000"),
+            "frequency": EventFrequency.MONTHLY,
+        },
+        {
+            "user_id": user_id,
+            "transaction_type": TransactionType.BILLS_AND_FEES,
+            "title": "Rent",
+            "amount": Decimal("400"),
+            "frequency": EventFrequency.MONTHLY,
+            "description": "Monthly rent",
+        },
+        {
+            "user_id": user_id,
+            "transaction_type": TransactionType.BILLS_AND_FEES,
+            "title": "Internet",
+            "amount": Decimal("20.50"),
+            "frequency": EventFrequency.WEEKLY,
+        },
+    ]
+    for event_data in events_data:
+        await test_create_event.execute(**event_data)
+    await make_events_due(test_engine)
+
+    events = await test_get_upcoming_events.execute()
+    assert len(events) == 3
+
+    executed = await test_run_events_batch.execute(events)
+    assert len(executed) == 3
+
+    user = await test_get_usecase.execute(user_id)
+    assert user.balance == Decimal("579.50")
+
+    session = AsyncSession(test_engine)
+    account_repo = AccountRepository(session)
+    account_period_repo = AccountPeriodRepository(session)
+    transaction_repo = TransactionRepository(session)
+    event_repo = EventRepository(session)
+    period = month_of(datetime.now(timezone.utc))
+    async with session:
+        income = await account_repo.get_user_account_by_transaction_type(
+            user_id, TransactionType.INCOME
+        )
+        bills = await account_repo.get_user_account_by_transaction_type(
+            user_id, TransactionType.BILLS_AND_FEES
+        )
+        income_period = await account_period_repo.get_by_id((income.id, period))
+        bills_period = await account_period_repo.get_by_id((bills.id, period))
+        assert income_period.debit_amount == Decimal("1000")
+        assert income_period.credit_amount == Decimal("420.50")
+        assert bills_period.debit_amount == Decimal("420.50")
+        assert bills_period.credit_amount == Decimal()
+
+        transactions = await transaction_repo.get_recent(user_id)
+        assert len(transactions) == 3
+        for transaction in transactions:
+            if transaction.transaction_type_id == TransactionType.INCOME:
+                assert transaction.debit_account_id == income.id
+                assert transaction.credit_account_id is None
+            else:
+                assert transaction.debit_account_id == bills.id
+                assert transaction.credit_account_id == income.id
+
+        today = date.today()
+        for event in await event_repo.get_by_user_id(user_id):
+            assert event.last_run_on == today
+            assert event.next_run_on > today
+            if event.interval == EventFrequency.WEEKLY:
+                assert event.next_run_on == today + timedelta(days=7)
+
+        assert len(await event_repo.get_upcoming_events()) == 0
+
+
+@mark.asyncio
+async def test_run_events_batch_for_many_users(
+    test_register_usecase,
+    test_get_usecase,
+    test_create_event,
+    test_engine,
+    test_get_upcoming_events,
+    test_run_events_batch,
+):
+    user_ids = [123456789, 123456788, 123456787]
+    for user_id in user_ids:
+        await test_register_usecase.execute(user_id, Currency.EUR)
+        await test_create_event.execute(
+            user_id=user_id,
+            transaction_type=TransactionType.GROCERIES,
+            title="Groceries",
+            amount=Decimal("10"),
+            frequency=EventFrequency.DAILY,
+        )
+    await make_events_due(test_engine)
+
+    events = await test_get_upcoming_events.execute()
+    executed = await test_run_events_batch.execute(events)
+    assert len(executed) == len(user_ids)
+
+    for user_id in user_ids:
+        user = await test_get_usecase.execute(user_id)
+        assert user.balance == Decimal("-10")
+
+
+@mark.asyncio
+async def test_run_empty_events_batch(test_run_events_batch):
+    executed = await test_run_events_batch.execute([])
+    assert len(executed) == 0
@@ -0,0 +1,52 @@
+from datetime import date
+from decimal import Decimal
+from pytest import fixture, mark
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.event import Event
+from midas.usecase.event import StreamUpcomingEventsUsecase
+from midas.util.enums import Currency, EventFrequency, TransactionType
+
+
+@fixture
+def test_stream_upcoming_events(test_engine) -> StreamUpcomingEventsUsecase:
+    session = AsyncSession(test_engine)
+    usecase = StreamUpcomingEventsUsecase(session=session)
+    return usecase
+
+
+@mark.asyncio
+async def test_stream_upcoming_events_in_chunks(
+    test_engine, test_register_usecase, test_create_event, test_stream_upcoming_events
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    for frequency in (
+        EventFrequency.DAILY,
+        EventFrequency.WEEKLY,
+        EventFrequency.MONTHLY,
+    ):
+        await test_create_event.execute(
+            user_id=user_id,
+            transaction_type=TransactionType.BILLS_AND_FEES,
+            title="Bill",
+            amount=Decimal("10"),
+            frequency=frequency,
+        )
+
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(
+            update(Event)
+            .where(Event.interval != EventFrequency.MONTHLY)
+            .values(next_run_on=date.today())
+        )
+        await session.commit()
+
+    events = [event async for event in test_stream_upcoming_events.execute(1)]
+
+    assert len(events) == 2
+    for event in events:
+        assert event.user.id == user_id
+        assert event.next_run_on <= date.today()
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from pytest import fixture, mark
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.notification import Notification
+from midas.query.notification import NotificationRepository
+from midas.service.abstract_notifier import AbstractNotifier
+from midas.usecase.notification import DispatchNotificationsUsecase
+from midas.util.enums import Currency
+
+
+class FakeNotifier(AbstractNotifier):
+    def __init__(self) -> None:
+        self.sent: list[tuple[int, str]] = []
+        self.flushed = 0
+
+    async def notify(self, user_id: int, msg: str) -> None:
+        self.sent.append((user_id, msg))
+
+    async def flush(self) -> None:
+        self.flushed += 1
+
+
+@fixture
+def test_dispatch_notifications(test_engine) -> DispatchNotificationsUsecase:
+    session = AsyncSession(test_engine)
+    usecase = DispatchNotificationsUsecase(session=session)
+    return usecase
+
+
+@mark.asyncio
+async def test_dispatch_notifications_in_batches(
+    test_engine, test_register_usecase, test_dispatch_notifications
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    session = AsyncSession(test_engine)
+    async with session:
+        await NotificationRepository(session).insert_many(
+            (user_id, f"message {i}") for i in range(3)
+        )
+        await session.commit()
+
+    notifier = FakeNotifier()
+    assert await test_dispatch_notifications.execute(notifier, 2) == 2
+    assert await test_dispatch_notifications.execute(notifier, 2) == 1
+    assert await test_dispatch_notifications.execute(notifier, 2) == 0
+
+    assert notifier.sent == [(user_id, f"message {i}") for i in range(3)]
+    # empty batches aren't flushed
+    assert notifier.flushed == 2
+
+
+@mark.asyncio
+async def test_dispatch_notifications_keeps_them_if_sending_fails(
+    test_engine, test_register_usecase, test_dispatch_notifications
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    session = AsyncSession(test_engine)
+    async with session:
+        await NotificationRepository(session).insert_many([(user_id, "message")])
+        await session.commit()
+
+    class FailingNotifier(FakeNotifier):
+        async def flush(self) -> None:
+            raise ConnectionError()
+
+    try:
+        await test_dispatch_notifications.execute(FailingNotifier())
+    except ConnectionError:
+        pass
+
+    notifier = FakeNotifier()
+    assert await test_dispatch_notifications.execute(notifier) == 1
+    assert notifier.sent == [(user_id, "message")]
+
+
+@mark.asyncio
+async def test_dispatch_notifications_skips_leased_until_the_lease_expires(
+    test_engine, test_register_usecase, test_dispatch_notifications
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    session = AsyncSession(test_engine)
+    async with session:
+        repo = NotificationRepository(session)
+        await repo.insert_many([(user_id, "message")])
+        await session.commit()
+        # another dispatcher claimed the notification and is sending it
+        assert len(await repo.claim_batch(10, timedelta(minutes=5))) == 1
+        await session.commit()
+
+    notifier = FakeNotifier()
+    assert await test_dispatch_notifications.execute(notifier) == 0
+
+    # ...and died before deleting it
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(
+            update(Notification).values(
+                claimed_until=datetime.now(timezone.utc) - timedelta(seconds=1)
+            )
+        )
+        await session.commit()
+
+    assert await test_dispatch_notifications.execute(notifier) == 1
+    assert await test_dispatch_notifications.execute(notifier) == 0
+    assert notifier.sent == [(user_id, "message")]
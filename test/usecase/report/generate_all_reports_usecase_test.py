@@ -0,0 +1,178 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pytest import fixture, mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.query.notification import NotificationRepository
+from midas.query.report import ReportRepository
+from midas.usecase.report import GenerateAllReportsUsecase, UserReport
+from midas.util.dates import month_of, next_month, previous_month
+from midas.util.enums import Currency, TransactionType
+
+
+@fixture
+def test_generate_all_reports(test_engine) -> GenerateAllReportsUsecase:
+    session = AsyncSession(test_engine)
+    usecase = GenerateAllReportsUsecase(session)
+    return usecase
+
+
+@mark.asyncio
+async def test_generate_reports_of_all_users_and_start_next_month(
+    test_engine,
+    test_register_usecase,
+    test_create_transaction,
+    test_generate_all_reports,
+):
+    users = {123456789: Currency.EUR, 123456788: Currency.USD}
+    for user_id, currency in users.items():
+        await test_register_usecase.execute(user_id, currency)
+
+    await test_create_transaction.execute(
+        user_id=123456789,
+        transaction_type=TransactionType.INCOME,
+        title="Salary",
+        amount=Decimal("1000"),
+    )
+    await test_create_transaction.execute(
+        user_id=123456789,
+        transaction_type=TransactionType.GROCERIES,
+        title="Lidl groceries",
+        amount=Decimal("150.46"),
+    )
+    await test_create_transaction.execute(
+        user_id=123456788,
+        transaction_type=TransactionType.BILLS_AND_FEES,
+        title="Rent",
+        amount=Decimal("400"),
+    )
+
+    reports: list[UserReport] = []
+
+    def render(report: UserReport) -> str:
+        reports.append(report)
+        return f"Report of {report.user_id}"
+
+    period = month_of(datetime.now(timezone.utc))
+    generated = await test_generate_all_reports.execute(render, period)
+    assert generated == len(users) == len(reports)
+
+    by_user = {report.user_id: report for report in reports}
+    assert by_user[123456789].currency == Currency.EUR
+    assert by_user[123456789].report["result"] == Decimal("849.54")
+    assert by_user[123456789].report["accounts"]["groceries"] == Decimal("150.46")
+    assert by_user[123456788].report["result"] == Decimal("-400")
+    assert by_user[123456788].report["accounts"]["bills_and_fees"] == Decimal("400")
+
+    # the next month starts empty without clearing the accounts
+    reports.clear()
+    generated = await GenerateAllReportsUsecase(AsyncSession(test_engine)).execute(
+        render, next_month(period)
+    )
+    assert generated == len(users) == len(reports)
+    for report in reports:
+        assert report.report["result"] == Decimal()
+        assert set(report.report["accounts"].values()) == {Decimal()}
+
+    session = AsyncSession(test_engine)
+    async with session:
+        notifications = await NotificationRepository(session).claim_batch(
+            10, timedelta(minutes=1)
+        )
+        assert sorted(n.message for n in notifications) == sorted(
+            f"Report of {user_id}" for user_id in users for _ in range(2)
+        )
+
+
+@mark.asyncio
+async def test_generate_reports_without_users(test_generate_all_reports):
+    def render(report: UserReport) -> str:
+        assert False
+
+    period = month_of(datetime.now(timezone.utc))
+    assert await test_generate_all_reports.execute(render, period) == 0
+
+
+@mark.asyncio
+async def test_generate_reports_skips_stored_reports(
+    test_engine,
+    test_register_usecase,
+    test_create_transaction,
+    test_generate_all_reports,
+):
+    await test_register_usecase.execute(123456789, Currency.EUR)
+    await test_create_transaction.execute(
+        user_id=123456789,
+        transaction_type=TransactionType.GROCERIES,
+        title="Lidl groceries",
+        amount=Decimal("150.46"),
+    )
+
+    def render(report: UserReport) -> str:
+        return f"Report of {report.user_id}"
+
+    period = month_of(datetime.now(timezone.utc))
+    assert await test_generate_all_reports.execute(render, period) == 1
+
+    # a rerun of the month only reports the users without a stored report
+    await test_register_usecase.execute(123456788, Currency.USD)
+    for generated in (1, 0):
+        usecase = GenerateAllReportsUsecase(AsyncSession(test_engine))
+        assert await usecase.execute(render, period) == generated
+
+    session = AsyncSession(test_engine)
+    async with session:
+        notifications = await NotificationRepository(session).claim_batch(
+            10, timedelta(minutes=1)
+        )
+        assert sorted(n.message for n in notifications) == [
+            "Report of 123456788",
+            "Report of 123456789",
+        ]
+
+        reports = await ReportRepository(session).get_by_user_id(123456789)
+        assert len(reports) == 1
+        assert reports[0].period == period
+        assert reports[0].accounts["groceries"] == "150.46"
+        assert reports[0].result == Decimal("-150.46")
+
+
+@mark.asyncio
+async def test_postings_after_report_run_are_reported(
+    test_engine,
+    test_register_usecase,
+    test_create_transaction,
+    test_generate_all_reports,
+):
+    await test_register_usecase.execute(123456789, Currency.EUR)
+    await test_create_transaction.execute(
+        user_id=123456789,
+        transaction_type=TransactionType.GROCERIES,
+        title="Lidl groceries",
+        amount=Decimal("150.46"),
+    )
+
+    def render(report: UserReport) -> str:
+        return f"Report of {report.user_id}"
+
+    # the run of this month reports the closed previous one
+    period = month_of(datetime.now(timezone.utc))
+    assert await test_generate_all_reports.execute(render, previous_month(period)) == 1
+    await test_create_transaction.execute(
+        user_id=123456789,
+        transaction_type=TransactionType.GROCERIES,
+        title="Aldi groceries",
+        amount=Decimal("14.50"),
+    )
+
+    # the posting made after the run is in the report of its month
+    usecase = GenerateAllReportsUsecase(AsyncSession(test_engine))
+    assert await usecase.execute(render, period) == 1
+
+    session = AsyncSession(test_engine)
+    async with session:
+        reports = await ReportRepository(session).get_by_user_id(123456789)
+        by_period = {report.period: report for report in reports}
+        assert by_period[previous_month(period)].result == Decimal()
+        assert by_period[period].accounts["groceries"] == "164.96"
+        assert by_period[period].result == Decimal("-164.96")
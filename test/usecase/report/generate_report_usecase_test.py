@@ -1,10 +1,13 @@
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pytest import fixture, mark
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.db.schemas.account import Account
 from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
 from midas.usecase.report import GenerateReportUsecase
+from midas.util.dates import month_of
 from midas.util.enums import Currency, TransactionType
 
 
@@ -16,7 +19,7 @@ def test_generate_report(test_engine) -> GenerateReportUsecase:
 
 
 @mark.asyncio
-async def test_add_only_expense_transactions_and_clear_accounts(
+async def test_add_only_expense_transactions_and_start_next_month(
     test_engine, test_register_usecase, test_create_transaction, test_generate_report
 ):
     user_id = 123456789
@@ -54,23 +57,29 @@ async def test_add_only_expense_transactions_and_clear_accounts(
 
     report = await test_generate_report.execute(user_id)
     assert report["result"] == balance
-
-    session = AsyncSession(test_engine)
-    repo = AccountRepository(session)
-    async with session:
-        for transaction in transactions:
-            ttype = transaction["transaction_type"]
-            account: Account = await repo.get_user_account_by_transaction_type(
-                user_id, ttype
-            )  # type: ignore
-
-            assert report["accounts"][ttype.name.lower()] == transaction["amount"]
-            assert account.debit_amount == Decimal()
-            assert account.credit_amount == Decimal()
+    for transaction in transactions:
+        ttype = transaction["transaction_type"]
+        assert report["accounts"][ttype.name.lower()] == transaction["amount"]
+
+    # the next month starts empty without clearing the accounts, so the
+    # reported month is still there afterwards
+    period = month_of(datetime.now(timezone.utc))
+    next_period = (period + timedelta(days=31)).replace(day=1)
+    next_report = await GenerateReportUsecase(AsyncSession(test_engine)).execute(
+        user_id, next_period
+    )
+    assert next_report["result"] == Decimal()
+    assert set(next_report["accounts"].values()) == {Decimal()}
+    assert next_report["accounts"].keys() == report["accounts"].keys()
+
+    assert (
+        await GenerateReportUsecase(AsyncSession(test_engine)).execute(user_id, period)
+        == report
+    )
 
 
 @mark.asyncio
-async def test_add_only_expense_transactions_and_dont_clear_accounts(
+async def test_add_only_expense_transactions_and_match_account_periods(
     test_engine, test_register_usecase, test_create_transaction, test_generate_report
 ):
     user_id = 123456789
@@ -106,18 +115,22 @@ async def test_add_only_expense_transactions_and_dont_clear_accounts(
         balance -= transaction["amount"]
         await test_create_transaction.execute(**transaction)
 
-    report = await test_generate_report.execute(user_id, clear_accounts=False)
+    report = await test_generate_report.execute(user_id)
     assert report["result"] == balance
 
     session = AsyncSession(test_engine)
     repo = AccountRepository(session)
+    period_repo = AccountPeriodRepository(session)
+    period = month_of(datetime.now(timezone.utc))
     async with session:
         for transaction in transactions:
             ttype = transaction["transaction_type"]
             account: Account = await repo.get_user_account_by_transaction_type(
                 user_id, ttype
             )  # type: ignore
+            account_period = await period_repo.get_by_id((account.id, period))
+            assert account_period is not None
             assert (
                 report["accounts"][ttype.name.lower()]
-                == account.debit_amount - account.credit_amount
+                == account_period.debit_amount - account_period.credit_amount
             )
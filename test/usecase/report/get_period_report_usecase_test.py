@@ -0,0 +1,137 @@
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from pytest import MonkeyPatch, mark, raises
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.transaction import Transaction
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.services import period_report_cache
+from midas.usecase.report import GetPeriodReportUsecase
+from midas.usecase.transaction import (
+    CompactJournalUsecase,
+    CreateTransactionUsecase,
+    DeleteTransactionUsecase,
+)
+from midas.util.dates import month_of, next_month
+from midas.util.enums import Currency, TransactionType
+
+USER_ID = 123456789
+JANUARY = (date(2024, 1, 1), date(2024, 1, 31))
+
+
+async def get_report(test_engine, start: date, end: date):
+    return await GetPeriodReportUsecase(AsyncSession(test_engine)).execute(
+        USER_ID, start, end
+    )
+
+
+async def move_to(test_engine, title: str, created_at: datetime) -> None:
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(
+            update(Transaction)
+            .where(Transaction.title == title)
+            .values(created_at=created_at)
+        )
+        # the aggregates aren't maintained by a plain update
+        await MonthlyAggregateRepository(session).rebuild()
+        await session.commit()
+
+
+@mark.asyncio
+async def test_get_period_report(
+    test_engine, test_register_usecase, test_create_transaction
+):
+    # the cache outlives the database of a single test
+    await period_report_cache.invalidate(USER_ID)
+    await test_register_usecase.execute(USER_ID, Currency.EUR)
+    for transaction_type, title, amount in (
+        (TransactionType.INCOME, "Salary", Decimal("1000")),
+        (TransactionType.GROCERIES, "Lidl", Decimal("25.50")),
+        (TransactionType.GROCERIES, "Aldi", Decimal("14.50")),
+        (TransactionType.TRANSPORTATION, "Bus", Decimal("3")),
+    ):
+        await test_create_transaction.execute(USER_ID, transaction_type, title, amount)
+
+    await move_to(test_engine, "Salary", datetime(2024, 1, 1, tzinfo=timezone.utc))
+    await move_to(
+        test_engine, "Lidl", datetime(2024, 1, 31, 23, 59, tzinfo=timezone.utc)
+    )
+    await move_to(test_engine, "Aldi", datetime(2024, 2, 1, tzinfo=timezone.utc))
+
+    report = await get_report(test_engine, *JANUARY)
+    assert report.totals[TransactionType.INCOME] == Decimal("1000")
+    assert report.totals[TransactionType.GROCERIES] == Decimal("25.50")
+    assert report.totals[TransactionType.TRANSPORTATION] == Decimal()
+    assert report.result == Decimal("974.50")
+
+    today = datetime.now(timezone.utc).date()
+    report = await get_report(test_engine, JANUARY[0], today)
+    assert report.totals[TransactionType.GROCERIES] == Decimal("40")
+    assert report.result == Decimal("957")
+
+    # closed periods are served from the cache until a usecase changes them
+    await move_to(test_engine, "Salary", datetime(2024, 3, 1, tzinfo=timezone.utc))
+    report = await get_report(test_engine, *JANUARY)
+    assert report.result == Decimal("974.50")
+
+    # the callers get copies of the cached report
+    report.totals[TransactionType.INCOME] = Decimal()
+    report = await get_report(test_engine, *JANUARY)
+    assert report.totals[TransactionType.INCOME] == Decimal("1000")
+
+    session = AsyncSession(test_engine)
+    async with session:
+        lidl = await session.scalar(
+            select(Transaction).where(Transaction.title == "Lidl")
+        )
+    await DeleteTransactionUsecase(AsyncSession(test_engine)).execute(lidl.id)  # type: ignore
+    report = await get_report(test_engine, *JANUARY)
+    assert report.totals[TransactionType.INCOME] == Decimal()
+    assert report.result == Decimal()
+
+    # the current period isn't cached
+    await test_create_transaction.execute(
+        USER_ID, TransactionType.GIFTS, "Flowers", Decimal("20")
+    )
+    report = await get_report(test_engine, today - timedelta(days=1), today)
+    assert report.totals[TransactionType.GIFTS] == Decimal("20")
+    assert report.result == Decimal("-23")
+
+
+@mark.asyncio
+async def test_get_period_report_of_invalid_range(test_engine):
+    with raises(ValueError):
+        await get_report(test_engine, JANUARY[1], JANUARY[0])
+
+
+@mark.asyncio
+async def test_get_period_report_of_whole_months(
+    monkeypatch: MonkeyPatch, test_engine, test_register_usecase
+):
+    await test_register_usecase.execute(USER_ID, Currency.EUR)
+    monkeypatch.setattr(CreateTransactionUsecase, "JOURNAL", True)
+    for transaction_type, title, amount in (
+        (TransactionType.INCOME, "Salary", Decimal("1000")),
+        (TransactionType.GROCERIES, "Lidl", Decimal("25.50")),
+    ):
+        await CreateTransactionUsecase(AsyncSession(test_engine)).execute(
+            USER_ID, transaction_type, title, amount
+        )
+
+    # the whole month is read from its aggregates plus the journal tail
+    month = month_of(datetime.now(timezone.utc))
+    month_end = next_month(month) - timedelta(days=1)
+    for _ in range(2):
+        report = await get_report(test_engine, month, month_end)
+        assert report.totals[TransactionType.INCOME] == Decimal("1000")
+        assert report.totals[TransactionType.GROCERIES] == Decimal("25.50")
+        assert report.result == Decimal("974.50")
+        await CompactJournalUsecase(AsyncSession(test_engine)).execute()
+
+    # the days around the whole month are summed up from the transactions
+    report = await get_report(
+        test_engine, month - timedelta(days=3), month_end + timedelta(days=3)
+    )
+    assert report.result == Decimal("974.50")
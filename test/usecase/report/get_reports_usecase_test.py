@@ -0,0 +1,35 @@
+from datetime import date
+from decimal import Decimal
+from pytest import mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.query.report import ReportRepository
+from midas.usecase.report import GetReportsUsecase
+from midas.util.enums import Currency
+
+
+@mark.asyncio
+async def test_get_reports_pages_from_latest_month(test_engine, test_register_usecase):
+    await test_register_usecase.execute(123456789, Currency.EUR)
+    periods = [date(2025, month, 1) for month in range(1, 6)]
+
+    session = AsyncSession(test_engine)
+    async with session:
+        repo = ReportRepository(session)
+        for period in periods:
+            report = {"accounts": {"income": Decimal(period.month)}, "result": 0}
+            assert await repo.insert_many(period, {123456789: report}) == {123456789}
+        # the stored report of the month is kept
+        report = {"accounts": {"income": Decimal("100")}, "result": 0}
+        assert await repo.insert_many(periods[0], {123456789: report}) == set()
+        await session.commit()
+
+    first = await GetReportsUsecase(AsyncSession(test_engine)).execute(123456789, 3)
+    assert [report.period for report in first] == periods[:1:-1]
+    second = await GetReportsUsecase(AsyncSession(test_engine)).execute(
+        123456789, 3, after=first[-1].period
+    )
+    assert [report.period for report in second] == periods[1::-1]
+    assert second[-1].accounts == {"income": "1"}
+
+    assert await GetReportsUsecase(AsyncSession(test_engine)).execute(987654321) == []
@@ -0,0 +1,75 @@
+from decimal import Decimal
+from typing import override
+from pytest import mark, raises
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
+
+from midas.query.user import UserRepository
+from midas.usecase.abstract_usecase import AbstractUsecase
+from midas.usecase.retry import retry_on_stale_data
+from midas.util.enums import Currency
+
+
+class AddToBalanceUsecase(AbstractUsecase[int]):
+    """
+    Adds to the balance with a read-modify-write, another session posts a
+    concurrent update between the read and the flush of the first
+    `conflicts` attempts.
+    """
+
+    def __init__(self, session: AsyncSession, conflicts: int) -> None:
+        super().__init__(session)
+        self._user_repo = UserRepository(self._session)
+        self.conflicts = conflicts
+        self.attempts = 0
+
+    async def _update_concurrently(self, user_id: int) -> None:
+        session = AsyncSession(self._session.bind)
+        async with session:
+            await UserRepository(session).apply_balance_deltas({user_id: Decimal("1")})
+            await session.commit()
+
+    @override
+    @retry_on_stale_data(attempts=3, backoff=0)
+    async def execute(self, user_id: int, amount: Decimal) -> int:
+        self.attempts += 1
+        async with self._session:
+            user = await self._user_repo.get_by_id(user_id)
+            assert user is not None
+            if self.attempts <= self.conflicts:
+                await self._update_concurrently(user_id)
+
+            user.balance += amount
+            await self._session.commit()
+        return self.attempts
+
+
+async def get_balance(test_engine, user_id: int) -> Decimal:
+    session = AsyncSession(test_engine)
+    async with session:
+        user = await UserRepository(session).get_by_id(user_id)
+        assert user is not None
+        return user.balance
+
+
+@mark.asyncio
+async def test_concurrent_update_is_retried(test_engine, test_register_usecase):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    usecase = AddToBalanceUsecase(AsyncSession(test_engine), conflicts=2)
+    assert await usecase.execute(user_id, Decimal("10")) == 3
+    # neither the concurrent updates nor the usecase's one got lost
+    assert await get_balance(test_engine, user_id) == Decimal("12")
+
+
+@mark.asyncio
+async def test_retries_are_bounded(test_engine, test_register_usecase):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    usecase = AddToBalanceUsecase(AsyncSession(test_engine), conflicts=3)
+    with raises(StaleDataError):
+        await usecase.execute(user_id, Decimal("10"))
+    assert usecase.attempts == 3
+    assert await get_balance(test_engine, user_id) == Decimal("3")
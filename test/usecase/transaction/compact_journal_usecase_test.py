@@ -0,0 +1,167 @@
+from decimal import Decimal
+from pytest import MonkeyPatch, mark
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.account import Account
+from midas.db.schemas.account_period import AccountPeriod
+from midas.db.schemas.monthly_aggregate import MonthlyAggregate
+from midas.query.user import UserRepository
+from midas.usecase.transaction import (
+    CompactJournalUsecase,
+    CreateTransactionUsecase,
+    DeleteTransactionUsecase,
+    EditTransactionUsecase,
+)
+from midas.util.enums import Currency, TransactionType
+
+TRANSACTIONS = (
+    (TransactionType.INCOME, "Salary", Decimal("1000")),
+    (TransactionType.GROCERIES, "Lidl", Decimal("25.50")),
+    (TransactionType.GROCERIES, "Aldi", Decimal("14.50")),
+    (TransactionType.TRANSPORTATION, "Bus", Decimal("3")),
+)
+
+
+async def get_state(test_engine, user_id: int) -> tuple[dict, Decimal, Decimal]:
+    session = AsyncSession(test_engine)
+    async with session:
+        rows = await session.execute(
+            select(
+                Account.transaction_type_id,
+                AccountPeriod.period,
+                AccountPeriod.debit_amount,
+                AccountPeriod.credit_amount,
+            )
+            .join(Account)
+            .where(Account.user_id == user_id)
+        )
+        user = await UserRepository(session).get_by_id(user_id)
+        return (
+            {
+                (row.transaction_type_id, row.period): (
+                    row.debit_amount,
+                    row.credit_amount,
+                )
+                for row in rows
+            },
+            user.balance,  # type: ignore
+            await UserRepository(session).get_balance(user_id),  # type: ignore
+        )
+
+
+async def get_aggregates(test_engine, user_id: int) -> dict:
+    session = AsyncSession(test_engine)
+    async with session:
+        aggregates = await session.scalars(
+            select(MonthlyAggregate).where(MonthlyAggregate.user_id == user_id)
+        )
+        return {
+            (aggregate.transaction_type_id, aggregate.period): (
+                aggregate.total,
+                aggregate.count,
+            )
+            for aggregate in aggregates
+        }
+
+
+async def compact(test_engine) -> int:
+    return await CompactJournalUsecase(AsyncSession(test_engine)).execute(batch_size=3)
+
+
+@mark.asyncio
+async def test_journal_is_folded_into_balances(
+    monkeypatch: MonkeyPatch, test_engine, test_register_usecase
+):
+    ledger_user_id, journal_user_id = 123456789, 987654321
+    for user_id in (ledger_user_id, journal_user_id):
+        await test_register_usecase.execute(user_id, Currency.EUR)
+
+    for transaction_type, title, amount in TRANSACTIONS:
+        await CreateTransactionUsecase(AsyncSession(test_engine)).execute(
+            ledger_user_id, transaction_type, title, amount
+        )
+    expected = await get_state(test_engine, ledger_user_id)
+
+    monkeypatch.setattr(CreateTransactionUsecase, "JOURNAL", True)
+    initial = await get_state(test_engine, journal_user_id)
+    for transaction_type, title, amount in TRANSACTIONS:
+        await CreateTransactionUsecase(AsyncSession(test_engine)).execute(
+            journal_user_id, transaction_type, title, amount
+        )
+
+    # postings don't touch the balances, the journal tail is added on read
+    accounts, balance, current_balance = await get_state(test_engine, journal_user_id)
+    assert (accounts, balance) == initial[:2]
+    assert current_balance == expected[2] == Decimal("957")
+
+    assert await compact(test_engine) == 4
+    assert await compact(test_engine) == 0
+    assert await get_state(test_engine, journal_user_id) == expected
+
+
+@mark.asyncio
+async def test_journal_is_folded_into_aggregates(
+    monkeypatch: MonkeyPatch, test_engine, test_register_usecase
+):
+    ledger_user_id, journal_user_id = 123456789, 987654321
+    for user_id in (ledger_user_id, journal_user_id):
+        await test_register_usecase.execute(user_id, Currency.EUR)
+
+    for user_id in (ledger_user_id, journal_user_id):
+        monkeypatch.setattr(
+            CreateTransactionUsecase, "JOURNAL", user_id == journal_user_id
+        )
+        for transaction_type, title, amount in TRANSACTIONS:
+            await CreateTransactionUsecase(AsyncSession(test_engine)).execute(
+                user_id, transaction_type, title, amount
+            )
+    expected = await get_aggregates(test_engine, ledger_user_id)
+    assert sum(count for _, count in expected.values()) == 4
+
+    # the aggregate rows are left to the compactor as well
+    assert await get_aggregates(test_engine, journal_user_id) == {}
+    assert await compact(test_engine) == 4
+    assert await get_aggregates(test_engine, journal_user_id) == expected
+
+
+@mark.asyncio
+async def test_edit_and_delete_journal_transactions(
+    monkeypatch: MonkeyPatch,
+    test_engine,
+    test_register_usecase,
+    test_get_transactions,
+):
+    ledger_user_id, journal_user_id = 123456789, 987654321
+    for user_id in (ledger_user_id, journal_user_id):
+        await test_register_usecase.execute(user_id, Currency.EUR)
+
+    for user_id in (ledger_user_id, journal_user_id):
+        monkeypatch.setattr(
+            CreateTransactionUsecase, "JOURNAL", user_id == journal_user_id
+        )
+        for transaction_type, title, amount in TRANSACTIONS:
+            await CreateTransactionUsecase(AsyncSession(test_engine)).execute(
+                user_id, transaction_type, title, amount
+            )
+
+        transactions = {
+            transaction.title: transaction
+            for transaction in await test_get_transactions.execute(user_id)
+        }
+        await EditTransactionUsecase(AsyncSession(test_engine)).execute(
+            transactions["Salary"].id, amount=Decimal("1200")
+        )
+        await DeleteTransactionUsecase(AsyncSession(test_engine)).execute(
+            transactions["Lidl"].id
+        )
+
+    # the edit folded the salary, the deleted purchase was never folded
+    assert (await get_state(test_engine, journal_user_id))[2] == Decimal("1182.50")
+    assert await compact(test_engine) == 2
+    assert await get_state(test_engine, journal_user_id) == await get_state(
+        test_engine, ledger_user_id
+    )
+    assert await get_aggregates(test_engine, journal_user_id) == await get_aggregates(
+        test_engine, ledger_user_id
+    )
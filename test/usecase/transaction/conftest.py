@@ -1,7 +1,7 @@
 from pytest import fixture
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from midas.usecase.transaction import GetTransactionsUsecase
+from midas.usecase.transaction import GetTransactionsUsecase, ImportTransactionsUsecase
 
 
 @fixture
@@ -9,3 +9,10 @@ def test_get_transactions(test_engine) -> GetTransactionsUsecase:
     session = AsyncSession(test_engine)
     usecase = GetTransactionsUsecase(session=session)
     return usecase
+
+
+@fixture
+def test_import_transactions(test_engine) -> ImportTransactionsUsecase:
+    session = AsyncSession(test_engine)
+    usecase = ImportTransactionsUsecase(session=session)
+    return usecase
@@ -0,0 +1,10 @@
+from pytest import mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.usecase.transaction import CreateTransactionPartitionsUsecase
+
+
+@mark.asyncio
+async def test_partitions_are_not_created_without_postgresql(test_engine):
+    usecase = CreateTransactionPartitionsUsecase(AsyncSession(test_engine))
+    assert await usecase.execute(months_ahead=3) == []
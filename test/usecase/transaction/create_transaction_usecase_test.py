@@ -1,10 +1,17 @@
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from pytest import mark
+from pytest import mark, raises
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.db.schemas.account import Account
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
 from midas.query.user import UserRepository
 from midas.query.transaction import TransactionRepository
+from midas.usecase.transaction import CreateTransactionUsecase
+from midas.usecase.user import RegisterUserUsecase
+from midas.util.dates import month_of
 from midas.util.enums import Currency, TransactionType
 
 
@@ -27,6 +34,7 @@ async def test_create_income_transaction_without_description(
     session = AsyncSession(test_engine)
     user_repo = UserRepository(session)
     transaction_repo = TransactionRepository(session)
+    account_period_repo = AccountPeriodRepository(session)
     async with session:
         user = await user_repo.get_by_id(user_id)
         assert user is not None
@@ -40,7 +48,11 @@ async def test_create_income_transaction_without_description(
 
         debit_account: Account = transaction.debit_account
         assert debit_account is not None
-        assert debit_account.debit_amount == transaction_data["amount"]
+        account_period = await account_period_repo.get_by_id(
+            (debit_account.id, month_of(transaction.created_at))
+        )
+        assert account_period is not None
+        assert account_period.debit_amount == transaction_data["amount"]
 
         credit_account = transaction.credit_account
         assert credit_account is None
@@ -68,6 +80,7 @@ async def test_create_income_transaction_with_description(
     session = AsyncSession(test_engine)
     user_repo = UserRepository(session)
     transaction_repo = TransactionRepository(session)
+    account_period_repo = AccountPeriodRepository(session)
     async with session:
         user = await user_repo.get_by_id(user_id)
         assert user is not None
@@ -82,7 +95,11 @@ async def test_create_income_transaction_with_description(
 
         debit_account: Account = transaction.debit_account
         assert debit_account is not None
-        assert debit_account.debit_amount == transaction_data["amount"]
+        account_period = await account_period_repo.get_by_id(
+            (debit_account.id, month_of(transaction.created_at))
+        )
+        assert account_period is not None
+        assert account_period.debit_amount == transaction_data["amount"]
 
         credit_account = transaction.credit_account
         assert credit_account is None
@@ -135,6 +152,7 @@ async def test_create_multiple_transactions(
     session = AsyncSession(test_engine)
     user_repo = UserRepository(session)
     transaction_repo = TransactionRepository(session)
+    account_period_repo = AccountPeriodRepository(session)
     async with session:
         user = await user_repo.get_by_id(user_id)
         assert user is not None
@@ -164,7 +182,69 @@ async def test_create_multiple_transactions(
                 income_account_amount -= transaction.amount
 
                 assert debit_account is not None
-                assert debit_account.debit_amount == transactions[i]["amount"]
+                account_period = await account_period_repo.get_by_id(
+                    (debit_account.id, month_of(transaction.created_at))
+                )
+                assert account_period is not None
+                assert account_period.debit_amount == transactions[i]["amount"]
                 assert credit_account is not None
 
         assert user.balance == income_account_amount
+
+
+@mark.postgres
+@mark.asyncio
+async def test_create_transaction_on_postgresql_in_one_statement(test_pg_engine):
+    user_id = 123456789
+    await RegisterUserUsecase(AsyncSession(test_pg_engine)).execute(
+        user_id, Currency.EUR
+    )
+
+    statements: list[str] = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_pg_engine.sync_engine, "before_cursor_execute", on_execute)
+    try:
+        usecase = CreateTransactionUsecase(AsyncSession(test_pg_engine))
+        await usecase.execute(
+            user_id, TransactionType.INCOME, "Salary", Decimal("1000")
+        )
+        usecase = CreateTransactionUsecase(AsyncSession(test_pg_engine))
+        await usecase.execute(
+            user_id, TransactionType.GROCERIES, "Lidl", Decimal("25.50")
+        )
+    finally:
+        event.remove(test_pg_engine.sync_engine, "before_cursor_execute", on_execute)
+    assert len([s for s in statements if s.lstrip().startswith("WITH")]) == 2
+    assert len([s for s in statements if "transactions" in s]) == 2
+
+    with raises(ValueError):
+        await CreateTransactionUsecase(AsyncSession(test_pg_engine)).execute(
+            1, TransactionType.INCOME, "Salary", Decimal("1000")
+        )
+
+    session = AsyncSession(test_pg_engine)
+    async with session:
+        user = await UserRepository(session).get_by_id(user_id)
+        assert user is not None
+        assert user.balance == Decimal("974.50")
+
+        period = month_of(datetime.now(timezone.utc))
+        balances = await AccountPeriodRepository(session).get_balances(user_id, period)
+        assert {b.transaction_type_id: b.balance for b in balances if b.balance} == {
+            TransactionType.INCOME: Decimal("974.50"),
+            TransactionType.GROCERIES: Decimal("25.50"),
+        }
+
+        aggregates = await MonthlyAggregateRepository(session).get_by_period(
+            user_id, period, period + timedelta(days=31)
+        )
+        assert [(a.transaction_type_id, a.total, a.count) for a in aggregates] == [
+            (TransactionType.INCOME, Decimal("1000"), 1),
+            (TransactionType.GROCERIES, Decimal("25.50"), 1),
+        ]
+
+        transactions = await TransactionRepository(session).get_recent(user_id)
+        assert [t.title for t in transactions] == ["Lidl", "Salary"]
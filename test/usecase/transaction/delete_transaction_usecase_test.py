@@ -1,10 +1,13 @@
+from datetime import datetime, timezone
 from decimal import Decimal
 from pytest import fixture, mark
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.db.schemas.user import User
 from midas.query.account.repository import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
 from midas.usecase.transaction import DeleteTransactionUsecase
+from midas.util.dates import month_of
 from midas.util.enums import Currency, TransactionType
 
 
@@ -44,13 +47,19 @@ async def test_create_income_transaction_and_delete_it(
 
     session = AsyncSession(test_engine)
     account_repo = AccountRepository(session=session)
+    account_period_repo = AccountPeriodRepository(session=session)
+    period = month_of(datetime.now(timezone.utc))
     async with session:
         income_account = await account_repo.get_user_account_by_transaction_type(
             user_id, TransactionType.INCOME, eager=True
         )
         assert income_account is not None
-        assert income_account.debit_amount == Decimal()
-        assert income_account.credit_amount == Decimal()
+        account_period = await account_period_repo.get_by_id(
+            (income_account.id, period)
+        )
+        assert account_period is not None
+        assert account_period.debit_amount == Decimal()
+        assert account_period.credit_amount == Decimal()
 
         user: User = await test_get_usecase.execute(user_id)
         assert user.balance == Decimal()
@@ -112,6 +121,8 @@ async def test_add_4_transactions_and_delete_them(
 
     session = AsyncSession(test_engine)
     account_repo = AccountRepository(session=session)
+    account_period_repo = AccountPeriodRepository(session=session)
+    period = month_of(datetime.now(timezone.utc))
     async with session:
         for type_ in TransactionType:
             account = await account_repo.get_user_account_by_transaction_type(
@@ -119,8 +130,11 @@ async def test_add_4_transactions_and_delete_them(
             )
 
             assert account is not None
-            assert account.debit_amount == Decimal()
-            assert account.credit_amount == Decimal()
+            # accounts without postings in the month have no row
+            account_period = await account_period_repo.get_by_id((account.id, period))
+            if account_period is not None:
+                assert account_period.debit_amount == Decimal()
+                assert account_period.credit_amount == Decimal()
 
         user: User = await test_get_usecase.execute(user_id)
         assert user.balance == Decimal()
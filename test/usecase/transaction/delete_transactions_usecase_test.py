@@ -0,0 +1,159 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pytest import mark
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.db.schemas.account import Account
+from midas.db.schemas.account_period import AccountPeriod
+from midas.db.schemas.transaction import Transaction
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.usecase.transaction import (
+    DeleteTransactionUsecase,
+    DeleteTransactionsUsecase,
+)
+from midas.util.dates import month_of
+from midas.util.enums import Currency, TransactionType
+
+
+async def get_state(test_engine, user_id: int) -> tuple[dict, dict, Decimal]:
+    session = AsyncSession(test_engine)
+    async with session:
+        accounts = {
+            type_: await AccountRepository(
+                session
+            ).get_user_account_by_transaction_type(user_id, type_, eager=True)
+            for type_ in TransactionType
+        }
+        periods = await session.scalars(
+            select(AccountPeriod).join(Account).where(Account.user_id == user_id)
+        )
+        types = {account.id: type_ for type_, account in accounts.items()}  # type: ignore
+        aggregates = await MonthlyAggregateRepository(session).get_by_period(
+            user_id, date.min, date.max
+        )
+        return (
+            {
+                (types[period.account_id], period.period): (
+                    period.debit_amount,
+                    period.credit_amount,
+                )
+                for period in periods
+                if (period.debit_amount, period.credit_amount) != (0, 0)
+            },
+            {
+                (aggregate.period, aggregate.transaction_type_id): (
+                    aggregate.total,
+                    aggregate.count,
+                )
+                for aggregate in aggregates
+                if aggregate.count != 0
+            },
+            accounts[TransactionType.INCOME].user.balance,  # type: ignore
+        )
+
+
+@mark.asyncio
+async def test_delete_transactions_in_range(
+    test_engine, test_register_usecase, test_create_transaction, test_get_transactions
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    for transaction_type, title, amount in (
+        (TransactionType.INCOME, "Salary", Decimal("1000")),
+        (TransactionType.GROCERIES, "Lidl", Decimal("25.50")),
+        (TransactionType.GROCERIES, "Aldi", Decimal("14.50")),
+        (TransactionType.TRANSPORTATION, "Bus", Decimal("3")),
+    ):
+        await test_create_transaction.execute(user_id, transaction_type, title, amount)
+
+    # move a salary and a purchase to the past and rebuild the aggregates
+    session = AsyncSession(test_engine)
+    async with session:
+        await session.execute(
+            update(Transaction)
+            .where(Transaction.title.in_(("Salary", "Lidl")))
+            .values(created_at=datetime(2024, 1, 15, tzinfo=timezone.utc))
+        )
+        repo = MonthlyAggregateRepository(session)
+        await repo.purge_by_user_id(user_id)
+        await repo.rebuild()
+        await AccountPeriodRepository(session).rebuild()
+        await session.commit()
+
+    deleted = await DeleteTransactionsUsecase(AsyncSession(test_engine)).execute(
+        user_id,
+        created_between=(
+            datetime(2024, 1, 1, tzinfo=timezone.utc),
+            datetime(2024, 12, 31, tzinfo=timezone.utc),
+        ),
+    )
+    assert deleted == 2
+
+    transactions = await test_get_transactions.execute(user_id)
+    assert {transaction.title for transaction in transactions} == {"Aldi", "Bus"}
+
+    # nothing is left in the month of the deleted transactions
+    period = month_of(datetime.now(timezone.utc))
+    accounts, aggregates, balance = await get_state(test_engine, user_id)
+    assert accounts == {
+        (TransactionType.INCOME, period): (Decimal(), Decimal("17.50")),
+        (TransactionType.GROCERIES, period): (Decimal("14.50"), Decimal()),
+        (TransactionType.TRANSPORTATION, period): (Decimal("3"), Decimal()),
+    }
+    assert balance == Decimal("-17.50")
+    assert set(aggregates.values()) == {(Decimal("14.50"), 1), (Decimal("3"), 1)}
+
+
+@mark.asyncio
+async def test_delete_transactions_by_ids_matches_single_deletes(
+    test_engine, test_register_usecase, test_create_transaction, test_get_transactions
+):
+    user_ids = (123456789, 987654321)
+    for user_id in user_ids:
+        await test_register_usecase.execute(user_id, Currency.EUR)
+        for transaction_type, amount in (
+            (TransactionType.INCOME, Decimal("500")),
+            (TransactionType.BILLS_AND_FEES, Decimal("400")),
+            (TransactionType.BILLS_AND_FEES, Decimal("20")),
+            (TransactionType.ENTERTAINMENT, Decimal("49.99")),
+        ):
+            await test_create_transaction.execute(
+                user_id, transaction_type, "Transaction", amount
+            )
+
+    bulk, single = [
+        await test_get_transactions.execute(user_id) for user_id in user_ids
+    ]
+    deleted = await DeleteTransactionsUsecase(AsyncSession(test_engine)).execute(
+        user_ids[0], [transaction.id for transaction in bulk[:3]]
+    )
+    assert deleted == 3
+
+    usecase = DeleteTransactionUsecase(AsyncSession(test_engine))
+    for transaction in single[:3]:
+        await usecase.execute(transaction)
+
+    assert await get_state(test_engine, user_ids[0]) == await get_state(
+        test_engine, user_ids[1]
+    )
+
+
+@mark.asyncio
+async def test_delete_transactions_of_other_user(
+    test_engine, test_register_usecase, test_create_transaction, test_get_transactions
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    await test_create_transaction.execute(
+        user_id, TransactionType.INCOME, "Salary", Decimal("1000")
+    )
+    transactions = await test_get_transactions.execute(user_id)
+
+    deleted = await DeleteTransactionsUsecase(AsyncSession(test_engine)).execute(
+        987654321, [transactions[0].id]
+    )
+    assert deleted == 0
+    assert len(await test_get_transactions.execute(user_id)) == 1
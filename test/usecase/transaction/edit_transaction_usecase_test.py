@@ -1,3 +1,4 @@
+from datetime import datetime, timezone
 from decimal import Decimal
 from pytest import fixture, mark, raises
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -5,7 +6,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from midas.db.schemas.account import Account
 from midas.db.schemas.user import User
 from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
 from midas.usecase.transaction import EditTransactionUsecase
+from midas.util.dates import month_of
 from midas.util.enums import Currency, TransactionType
 from midas.util.errors import NoChangesDetectedException
 
@@ -57,14 +60,18 @@ async def test_add_one_transaction_and_edit_it(
 
     session = AsyncSession(test_engine)
     account_repo = AccountRepository(session=session)
+    account_period_repo = AccountPeriodRepository(session=session)
+    period = month_of(datetime.now(timezone.utc))
     async with session:
         income_account = await account_repo.get_user_account_by_transaction_type(
             user_id, TransactionType.INCOME, eager=True
         )
 
         assert income_account is not None
-        assert income_account.debit_amount == Decimal("1000")
-        assert income_account.credit_amount == Decimal()
+        income_period = await account_period_repo.get_by_id((income_account.id, period))
+        assert income_period is not None
+        assert income_period.debit_amount == Decimal("1000")
+        assert income_period.credit_amount == Decimal()
 
         user: User = await test_get_usecase.execute(user_id)
         assert user.balance == Decimal("1000")
@@ -110,14 +117,18 @@ async def test_edit_income_and_expense(
 
     session = AsyncSession(test_engine)
     account_repo = AccountRepository(session=session)
+    account_period_repo = AccountPeriodRepository(session=session)
+    period = month_of(datetime.now(timezone.utc))
     async with session:
         income_account = await account_repo.get_user_account_by_transaction_type(
             user_id, TransactionType.INCOME, eager=True
         )
 
         assert income_account is not None
-        assert income_account.debit_amount == Decimal("1000")
-        assert income_account.credit_amount == Decimal()
+        income_period = await account_period_repo.get_by_id((income_account.id, period))
+        assert income_period is not None
+        assert income_period.debit_amount == Decimal("1000")
+        assert income_period.credit_amount == Decimal()
 
         user: User = await test_get_usecase.execute(user_id)
         assert user.balance == Decimal("1000")
@@ -150,8 +161,10 @@ async def test_edit_income_and_expense(
         )
 
         assert income_account is not None
-        assert income_account.debit_amount == Decimal("1000")
-        assert income_account.credit_amount == Decimal("250")
+        income_period = await account_period_repo.get_by_id((income_account.id, period))
+        assert income_period is not None
+        assert income_period.debit_amount == Decimal("1000")
+        assert income_period.credit_amount == Decimal("250")
 
         user: User = await test_get_usecase.execute(user_id)
         assert user.balance == Decimal("750")
@@ -80,3 +80,30 @@ async def test_add_4_transactions_and_get_them_back(
         assert transaction.title == transaction_data[i]["title"]
         assert transaction.amount == transaction_data[i]["amount"]
         assert transaction.description == transaction_data[i]["description"]
+
+
+@mark.asyncio
+async def test_page_through_transactions_with_cursor(
+    test_register_usecase, test_create_transaction, test_get_transactions
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    for i in range(5):
+        await test_create_transaction.execute(
+            user_id, TransactionType.GROCERIES, f"Groceries {i}", Decimal("10")
+        )
+
+    expected = await test_get_transactions.execute(user_id, 10)
+    assert len(expected) == 5
+
+    pages = []
+    after = None
+    while True:
+        page = await test_get_transactions.execute(user_id, 2, after=after)
+        if len(page) == 0:
+            break
+        assert len(page) <= 2
+        pages.extend(page)
+        after = (page[-1].created_at, page[-1].id)
+
+    assert [t.id for t in pages] == [t.id for t in expected]
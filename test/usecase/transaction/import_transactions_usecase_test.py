@@ -0,0 +1,115 @@
+from datetime import date
+from decimal import Decimal
+from pytest import mark, raises
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.util.enums import Currency, TransactionType
+
+STATEMENT = """Date,Type,Title,Amount,Description
+2025-12-01,Income,Salary,1000,December salary
+2025-12-02,Groceries,Lidl,25.50,
+02/12/2025,groceries,Lidl,25.50,
+2025-12-03,Bills and fees,Rent,400,
+2025-12-04,Unknown,Something,1,
+2025-12-05,Transportation,Bus,-3,
+not a date,Transportation,Bus,3,
+2999-01-01,Transportation,Bus,3,
+"""
+
+
+@mark.asyncio
+async def test_import_statement(
+    test_engine, test_register_usecase, test_import_transactions
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    result = await test_import_transactions.execute(
+        user_id, STATEMENT.splitlines(keepends=True), chunk_size=2
+    )
+
+    assert result.imported == 4
+    assert result.duplicates == 0
+    assert result.invalid == 4
+    assert result.invalid_lines == [6, 7, 8, 9]
+
+    session = AsyncSession(test_engine)
+    async with session:
+        user = await UserRepository(session).get_by_id(user_id)
+        assert user is not None
+        assert user.balance == Decimal("549.00")
+
+        account_repo = AccountRepository(session)
+        income = await account_repo.get_user_account_by_transaction_type(
+            user_id, TransactionType.INCOME
+        )
+        groceries = await account_repo.get_user_account_by_transaction_type(
+            user_id, TransactionType.GROCERIES
+        )
+        assert income is not None and groceries is not None
+        # the statement's month, not the month of the import
+        account_period_repo = AccountPeriodRepository(session)
+        period = date(2025, 12, 1)
+        income_period = await account_period_repo.get_by_id((income.id, period))
+        groceries_period = await account_period_repo.get_by_id((groceries.id, period))
+        assert income_period is not None and groceries_period is not None
+        assert income_period.debit_amount == Decimal("1000")
+        assert income_period.credit_amount == Decimal("451")
+        assert groceries_period.debit_amount == Decimal("51")
+
+        transactions = await TransactionRepository(session).get_recent(user_id)
+        assert len(transactions) == 4
+        assert transactions[0].title == "Rent"
+        assert transactions[-1].description == "December salary"
+        assert len({t.import_hash for t in transactions}) == 4
+
+        aggregates = await MonthlyAggregateRepository(session).get_by_period(
+            user_id, date(2025, 12, 1), date(2026, 1, 1)
+        )
+        assert [(a.transaction_type_id, a.total, a.count) for a in aggregates] == [
+            (TransactionType.INCOME, Decimal("1000"), 1),
+            (TransactionType.GROCERIES, Decimal("51"), 2),
+            (TransactionType.BILLS_AND_FEES, Decimal("400"), 1),
+        ]
+
+
+@mark.asyncio
+async def test_reimport_statement_is_idempotent(
+    test_engine, test_register_usecase, test_import_transactions
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    await test_import_transactions.execute(user_id, STATEMENT.splitlines())
+    result = await test_import_transactions.execute(user_id, STATEMENT.splitlines())
+
+    assert result.imported == 0
+    assert result.duplicates == 4
+
+    session = AsyncSession(test_engine)
+    async with session:
+        user = await UserRepository(session).get_by_id(user_id)
+        assert user is not None
+        assert user.balance == Decimal("549.00")
+
+
+@mark.asyncio
+async def test_import_statement_without_required_columns(
+    test_register_usecase, test_import_transactions
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    with raises(ValueError):
+        await test_import_transactions.execute(user_id, ["date,title\n"])
+
+
+@mark.asyncio
+async def test_import_statement_of_unknown_user(test_import_transactions):
+    with raises(ValueError):
+        await test_import_transactions.execute(1, STATEMENT.splitlines())
@@ -0,0 +1,110 @@
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pytest import mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.query.monthly_aggregate import MonthlyAggregateRepository
+from midas.usecase.transaction import (
+    DeleteTransactionUsecase,
+    EditTransactionUsecase,
+    GetTransactionsUsecase,
+)
+from midas.util.dates import month_of
+from midas.util.enums import Currency, TransactionType
+
+
+async def get_aggregates(test_engine, user_id: int) -> dict[int, tuple[Decimal, int]]:
+    session = AsyncSession(test_engine)
+    async with session:
+        aggregates = await MonthlyAggregateRepository(session).get_by_period(
+            user_id, date.min, date.max
+        )
+        return {
+            aggregate.transaction_type_id: (aggregate.total, aggregate.count)
+            for aggregate in aggregates
+        }
+
+
+def test_month_of():
+    assert month_of(datetime(2025, 12, 31, 23, 59)) == date(2025, 12, 1)
+    assert month_of(datetime(2026, 1, 1, tzinfo=timezone.utc)) == date(2026, 1, 1)
+
+
+@mark.asyncio
+async def test_transaction_usecases_maintain_aggregates(
+    test_engine, test_register_usecase, test_create_transaction
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+
+    for transaction_type, amount in (
+        (TransactionType.INCOME, Decimal("1000")),
+        (TransactionType.GROCERIES, Decimal("25.50")),
+        (TransactionType.GROCERIES, Decimal("14.50")),
+        (TransactionType.TRANSPORTATION, Decimal("3")),
+    ):
+        await test_create_transaction.execute(
+            user_id, transaction_type, "Transaction", amount
+        )
+
+    assert await get_aggregates(test_engine, user_id) == {
+        TransactionType.INCOME: (Decimal("1000"), 1),
+        TransactionType.GROCERIES: (Decimal("40"), 2),
+        TransactionType.TRANSPORTATION: (Decimal("3"), 1),
+    }
+
+    transactions = await GetTransactionsUsecase(AsyncSession(test_engine)).execute(
+        user_id
+    )
+    transport, groceries = transactions[0], transactions[1]
+
+    await EditTransactionUsecase(AsyncSession(test_engine)).execute(
+        groceries.id, amount=Decimal("20")
+    )
+    await EditTransactionUsecase(AsyncSession(test_engine)).execute(
+        transport.id, transaction_type=TransactionType.GROCERIES, amount=Decimal("5")
+    )
+    await DeleteTransactionUsecase(AsyncSession(test_engine)).execute(
+        transactions[2].id
+    )
+
+    assert await get_aggregates(test_engine, user_id) == {
+        TransactionType.INCOME: (Decimal("1000"), 1),
+        TransactionType.GROCERIES: (Decimal("25"), 2),
+        TransactionType.TRANSPORTATION: (Decimal("0"), 0),
+    }
+
+
+@mark.asyncio
+async def test_rebuild_aggregates(
+    test_engine, test_register_usecase, test_create_transaction
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    await test_create_transaction.execute(
+        user_id, TransactionType.INCOME, "Salary", Decimal("1000")
+    )
+    await test_create_transaction.execute(
+        user_id, TransactionType.BILLS_AND_FEES, "Rent", Decimal("400")
+    )
+    await test_create_transaction.execute(
+        user_id, TransactionType.BILLS_AND_FEES, "Internet", Decimal("20")
+    )
+    maintained = await get_aggregates(test_engine, user_id)
+
+    session = AsyncSession(test_engine)
+    async with session:
+        repo = MonthlyAggregateRepository(session)
+        await repo.purge_by_user_id(user_id)
+        await session.commit()
+        rows = await repo.rebuild()
+        await session.commit()
+
+        aggregates = await repo.get_by_period(user_id, date.min, date.max)
+        assert rows == 2
+        assert all(
+            aggregate.period == month_of(datetime.now(timezone.utc))
+            for aggregate in aggregates
+        )
+
+    assert await get_aggregates(test_engine, user_id) == maintained
@@ -6,8 +6,13 @@ from midas.query.account import AccountRepository
 from midas.query.transaction import TransactionRepository
 from midas.query.user import UserRepository
 from midas.usecase.transaction import CreateTransactionUsecase
-from midas.usecase.user import DeleteUserUsecase
+from midas.usecase.user import (
+    DeleteUserUsecase,
+    GetUserUsecase,
+    PurgeDeletedUsersUsecase,
+)
 from midas.util.enums import Currency, TransactionType
+from midas.util.errors import UserDeletionPendingException
 
 
 @fixture
@@ -32,6 +37,7 @@ async def test_register_user_and_delete_their_profile_and_data(
     currency = Currency.EUR
     await test_register_usecase.execute(user_id, currency)
     await test_delete_usecase.execute(user_id)
+    await PurgeDeletedUsersUsecase(AsyncSession(test_engine)).execute()
 
     session = AsyncSession(test_engine)
     user_repo = UserRepository(session)
@@ -59,6 +65,23 @@ async def test_register_user_and_double_delete_their_profile_and_data(
         await test_delete_usecase.execute(user_id)
 
 
+@mark.asyncio
+async def test_deleted_user_is_hidden_until_purged(
+    test_engine, test_register_usecase, test_delete_usecase
+):
+    user_id = 123456789
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    await test_delete_usecase.execute(user_id)
+
+    assert await GetUserUsecase(AsyncSession(test_engine)).execute(user_id) is None
+    with raises(UserDeletionPendingException):
+        await test_register_usecase.execute(user_id, Currency.EUR)
+
+    await PurgeDeletedUsersUsecase(AsyncSession(test_engine)).execute()
+    await test_register_usecase.execute(user_id, Currency.EUR)
+    assert await GetUserUsecase(AsyncSession(test_engine)).execute(user_id) is not None
+
+
 @mark.asyncio
 async def test_delete_invalid_user(test_delete_usecase):
     with raises(ValueError):
@@ -108,6 +131,7 @@ async def test_delete_user_with_transactions(
         await test_create_transaction.execute(**transaction)
 
     await test_delete_usecase.execute(user_id)
+    await PurgeDeletedUsersUsecase(AsyncSession(test_engine)).execute()
 
     session = AsyncSession(test_engine)
     user_repo = UserRepository(session)
@@ -0,0 +1,53 @@
+from decimal import Decimal
+from pytest import mark
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from midas.query.transaction import TransactionRepository
+from midas.query.user import UserRepository
+from midas.usecase.user import DeleteUserUsecase, PurgeDeletedUsersUsecase
+from midas.util.enums import Currency, TransactionType
+
+
+@mark.asyncio
+async def test_purge_deleted_users_in_batches(
+    test_engine, test_register_usecase, test_create_transaction
+):
+    deleted_id, kept_id = 1, 2
+    for user_id in (deleted_id, kept_id):
+        await test_register_usecase.execute(user_id, Currency.EUR)
+        for i in range(5):
+            await test_create_transaction.execute(
+                user_id, TransactionType.GROCERIES, f"Groceries {i}", Decimal("10")
+            )
+    await DeleteUserUsecase(AsyncSession(test_engine)).execute(deleted_id)
+
+    # 2 batches of transactions, there are no events and notifications
+    result = await PurgeDeletedUsersUsecase(AsyncSession(test_engine)).execute(
+        batch_size=2, max_batches=2
+    )
+    assert result.rows == 4
+    assert result.users == 0
+    assert result.pending == 1
+
+    session = AsyncSession(test_engine)
+    async with session:
+        assert len(await TransactionRepository(session).get_recent(deleted_id)) == 1
+
+    result = await PurgeDeletedUsersUsecase(AsyncSession(test_engine)).execute(
+        batch_size=2
+    )
+    assert result.users == 1
+    assert result.pending == 0
+    # the rest of the transactions, monthly aggregates, the months of the
+    # income and groceries accounts and accounts
+    assert result.rows == 1 + 1 + 2 + len(TransactionType)
+
+    session = AsyncSession(test_engine)
+    async with session:
+        user_repo = UserRepository(session)
+        assert await user_repo.get_by_id(deleted_id) is None
+        assert await user_repo.get_by_id(kept_id) is not None
+        assert len(await TransactionRepository(session).get_recent(kept_id)) == 5
+
+    result = await PurgeDeletedUsersUsecase(AsyncSession(test_engine)).execute()
+    assert result == type(result)()
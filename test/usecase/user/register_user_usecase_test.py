@@ -1,9 +1,12 @@
+from datetime import datetime, timezone
 from decimal import Decimal
 from pytest import mark, raises
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from midas.query.account import AccountRepository
+from midas.query.account_period import AccountPeriodRepository
 from midas.query.user import UserRepository
+from midas.util.dates import month_of
 from midas.util.enums import Currency, TransactionType
 
 
@@ -16,6 +19,8 @@ async def test_register_user(test_engine, test_register_usecase):
     session = AsyncSession(test_engine)
     user_repo = UserRepository(session)
     account_repo = AccountRepository(session)
+    account_period_repo = AccountPeriodRepository(session)
+    period = month_of(datetime.now(timezone.utc))
 
     async with session:
         user = await user_repo.get_by_id(user_id)
@@ -30,8 +35,8 @@ async def test_register_user(test_engine, test_register_usecase):
             assert account
             assert account.user_id == user_id
             assert account.transaction_type_id == i
-            assert account.credit_amount == 0
-            assert account.debit_amount == 0
+            # the month's row is created by the first posting
+            assert await account_period_repo.get_by_id((account.id, period)) is None
 
 
 @mark.asyncio
@@ -0,0 +1,37 @@
+from datetime import date, datetime, timedelta, timezone
+
+from midas.util.dates import (
+    get_upcoming_months,
+    month_of,
+    next_month,
+    previous_month,
+)
+
+
+def test_month_of():
+    assert month_of(datetime(2025, 3, 31, 23, 59)) == date(2025, 3, 1)
+    # still March in UTC
+    moment = datetime(2025, 4, 1, 1, tzinfo=timezone(timedelta(hours=2)))
+    assert month_of(moment) == date(2025, 3, 1)
+
+
+def test_next_month():
+    assert next_month(date(2025, 1, 31)) == date(2025, 2, 1)
+    assert next_month(date(2024, 2, 29)) == date(2024, 3, 1)
+    assert next_month(date(2025, 12, 1)) == date(2026, 1, 1)
+
+
+def test_previous_month():
+    assert previous_month(date(2025, 3, 31)) == date(2025, 2, 1)
+    assert previous_month(date(2024, 3, 1)) == date(2024, 2, 1)
+    assert previous_month(date(2026, 1, 15)) == date(2025, 12, 1)
+
+
+def test_get_upcoming_months():
+    assert get_upcoming_months(date(2025, 11, 30), 3) == [
+        date(2025, 11, 1),
+        date(2025, 12, 1),
+        date(2026, 1, 1),
+        date(2026, 2, 1),
+    ]
+    assert get_upcoming_months(date(2025, 1, 31), 0) == [date(2025, 1, 1)]